@@ -0,0 +1,157 @@
+import os
+import gzip
+import json
+import time
+import threading
+from datetime import datetime
+from config import ARCHIVE_DIRECTORY, ARCHIVE_COMPRESSION_LEVEL, REPARSE_WORKERS
+from logging_config import log_and_print
+
+INDEX_FILENAME = 'index.jsonl'
+
+class PageArchive:
+    """Append-only, compressed archive of every fetched page body
+
+    Pages are stored WARC-style: each record is its own gzip member holding a
+    header block followed by the raw body, appended to a daily segment file
+    (``pages-YYYYMMDD.warc.gz``). Segments can be read sequentially with any
+    gzip reader; ``index.jsonl`` maps URL and fetch time to the segment offset
+    so single records can be read back without scanning.
+    """
+
+    def __init__(self, directory=ARCHIVE_DIRECTORY, compression_level=ARCHIVE_COMPRESSION_LEVEL):
+        self.directory = directory
+        self.compression_level = compression_level
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        self._lock = threading.Lock()
+
+    def store(self, url, body, parser, keywords=None, kind='http', status=None, content_type=None):
+        """Append a page to the archive and return its index entry"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        fetched_at = datetime.now()
+        keywords = list(keywords or [])
+
+        headers = [
+            'WARC/1.0',
+            'WARC-Type: response',
+            f'WARC-Target-URI: {url}',
+            f'WARC-Date: {fetched_at.isoformat()}',
+            f'X-Fetch-Kind: {kind}',
+            f'X-Parser: {parser}',
+            f'X-Keywords: {",".join(keywords)}',
+        ]
+        if status is not None:
+            headers.append(f'X-Status: {status}')
+        if content_type:
+            headers.append(f'Content-Type: {content_type}')
+        headers.append(f'Content-Length: {len(body)}')
+        record = ('\r\n'.join(headers) + '\r\n\r\n').encode('utf-8') + body + b'\r\n\r\n'
+        data = gzip.compress(record, compresslevel=self.compression_level)
+
+        segment = f"pages-{fetched_at.strftime('%Y%m%d')}.warc.gz"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, segment), 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(data)
+
+            entry = {
+                'url': url,
+                'fetched_at': fetched_at.isoformat(),
+                'kind': kind,
+                'parser': parser,
+                'keywords': keywords,
+                'status': status,
+                'segment': segment,
+                'offset': offset,
+                'length': len(data),
+                'size': len(body)
+            }
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        return entry
+
+    def entries(self, parser=None, since=None, url=None):
+        """Iterate index entries, optionally filtered by parser prefix, time and URL"""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written line from an interrupted run
+                if parser and not entry['parser'].startswith(parser):
+                    continue
+                if since and entry['fetched_at'] < since:
+                    continue
+                if url and entry['url'] != url:
+                    continue
+                yield entry
+
+    def read(self, entry):
+        """Return ``(headers, body)`` for an index entry"""
+        return read_record(self.directory, entry)
+
+def read_record(directory, entry):
+    """Read a single archived record by its index entry"""
+    with open(os.path.join(directory, entry['segment']), 'rb') as f:
+        f.seek(entry['offset'])
+        data = gzip.decompress(f.read(entry['length']))
+
+    header_block, _, body = data.partition(b'\r\n\r\n')
+    headers = {}
+    for line in header_block.decode('utf-8').split('\r\n')[1:]:
+        name, _, value = line.partition(': ')
+        headers[name] = value
+    return headers, body[:int(headers.get('Content-Length', len(body)))]
+
+def reparse_entry(directory, entry):
+    """Run the current parser for an archived page (executed in worker processes)"""
+    from parsers import parse_page
+
+    _, body = read_record(directory, entry)
+    keywords = entry.get('keywords')
+    jobs = parse_page(entry['parser'], body, keywords)
+    if keywords and len(keywords) == 1:
+        # A page fetched for one keyword; pages covering several tag their jobs in the parser
+        for job in jobs:
+            if not job.get('keyword'):
+                job['keyword'] = keywords[0]
+    return jobs
+
+def reparse_archive(directory=ARCHIVE_DIRECTORY, parser=None, since=None, workers=REPARSE_WORKERS):
+    """Re-run the parsers over archived pages in parallel, without any network access
+
+    Returns ``(jobs, stats)`` where ``stats`` holds page, byte and timing totals
+    so parser changes can be benchmarked against real pages.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    archive = PageArchive(directory)
+    entries = list(archive.entries(parser=parser, since=since))
+    log_and_print(f"Re-parsing {len(entries)} archived pages from {directory}")
+
+    start = time.perf_counter()
+    jobs = []
+    errors = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(reparse_entry, directory, entry) for entry in entries]
+        for entry, future in zip(entries, futures):
+            try:
+                jobs.extend(future.result())
+            except Exception as e:
+                errors += 1
+                log_and_print(f"Error re-parsing {entry['url']} ({entry['parser']}): {str(e)}", "error", e)
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        'pages': len(entries),
+        'errors': errors,
+        'jobs': len(jobs),
+        'bytes': sum(entry['size'] for entry in entries),
+        'seconds': round(elapsed, 3),
+        'pages_per_second': round(len(entries) / elapsed, 1) if elapsed else 0.0
+    }
+    return jobs, stats
@@ -0,0 +1,33 @@
+import re
+
+# Public JSON job-board endpoints, keyed by applicant-tracking system
+ATS_ENDPOINTS = {
+    'greenhouse': 'https://boards-api.greenhouse.io/v1/boards/{token}/jobs',
+    'lever': 'https://api.lever.co/v0/postings/{token}?mode=json',
+    'ashby': 'https://api.ashbyhq.com/posting-api/job-board/{token}',
+    'workable': 'https://apply.workable.com/api/v1/widget/accounts/{token}'
+}
+
+# Links and embeds that identify the ATS behind a careers page, most specific first
+ATS_PATTERNS = [
+    ('greenhouse', re.compile(r'greenhouse\.io/embed/job_board(?:/js)?\?for=([\w-]+)', re.IGNORECASE)),
+    ('greenhouse', re.compile(r'(?:job-)?boards(?:\.eu)?\.greenhouse\.io/(?!embed\b)([\w-]+)', re.IGNORECASE)),
+    ('lever', re.compile(r'jobs\.(?:eu\.)?lever\.co/([\w.-]+)', re.IGNORECASE)),
+    ('ashby', re.compile(r'jobs\.ashbyhq\.com/([\w.%-]+)', re.IGNORECASE)),
+    ('workable', re.compile(r'apply\.workable\.com/(?!api\b)([\w-]+)', re.IGNORECASE))
+]
+
+def detect_ats(html):
+    """Return ``'<ats>:<board token>'`` for the first known ATS linked from a page, or None"""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    for kind, pattern in ATS_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return f"{kind}:{match.group(1)}"
+    return None
+
+def ats_endpoint(ats):
+    """Return the JSON endpoint URL for an ``'<ats>:<board token>'`` string"""
+    kind, _, token = ats.partition(':')
+    return ATS_ENDPOINTS[kind].format(token=token)
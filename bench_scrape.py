@@ -0,0 +1,175 @@
+"""End-to-end scrape load test against the local mock job boards (mock_server.py)
+
+Runs the real scrape path (RemoteJobScraper.scrape_jobs or
+search_remote_jobs, which reach scrape_company_jobs and the careers pages)
+with every source pointed at a MockJobServer in a child process, and reports
+jobs/sec, p50/p99 request latency and peak memory.
+
+Usage:
+    python bench_scrape.py                       # 1000 listings per site, 3 keywords
+    python bench_scrape.py --jobs 20000 --workers 4 --per-keyword
+    python bench_scrape.py --latency lognormal:80:0.5 --error-rate 0.05 --enrich
+    python bench_scrape.py --chromedriver /usr/local/bin/chromedriver   # include the JavaScript careers page
+
+Chrome is only used with --chromedriver, so the benchmark never downloads a
+driver and runs offline.
+"""
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import subprocess
+import urllib.request
+from mock_server import add_server_arguments
+
+def mock_namespace(base_url, keywords, delay):
+    """The source settings of config.py, pointed at the mock server"""
+    import config
+
+    paths = {
+        'WeWorkRemotely': '/wwr/remote-jobs/search?term=',
+        'RemoteOK': '/remoteok/remote-',
+        'Remotive': '/remotive/remote-jobs/search?query='
+    }
+    company = {'job_selector': '.job', 'title_selector': '.job-title', 'location_selector': '.job-location',
+               'link_selector': 'a', 'delay': delay}
+    namespace = dict(vars(config))
+    namespace.update(
+        KEYWORDS=list(keywords),
+        JOB_FEEDS={
+            'WeWorkRemotely': {'url': f"{base_url}/wwr/remote-jobs.rss"},
+            'RemoteOK': {'url': f"{base_url}/remoteok/api"},
+            'Remotive': {'url': f"{base_url}/remotive/api/remote-jobs"}
+        },
+        # Real board selectors, so the mock markup is read exactly like the live pages
+        JOB_BOARDS={name: dict(board, base_url=base_url + paths[name], delay=delay)
+                    for name, board in config.JOB_BOARDS.items() if name in paths},
+        REMOTE_COMPANIES={'Static Careers': dict(company, url=f"{base_url}/careers/static", search_selector='#search')},
+        TECH_COMPANIES={},  # Their search forms need a browser and the mock has none
+        COMPANY_CAREER_PAGES=[dict(company, name='Static Careers', url=f"{base_url}/careers/static"),
+                              dict(company, name='Script Careers', url=f"{base_url}/careers/js")]
+    )
+    return namespace
+
+def start_server(args):
+    """Start mock_server.py in a child process (so its CPU and memory are not counted) and return it with its URL"""
+    command = [sys.executable, 'mock_server.py', '--port', '0', '--keywords', ','.join(args.keywords),
+               '--jobs', str(args.jobs), '--latency', args.latency,
+               '--error-rate', str(args.error_rate), '--error-statuses', args.error_statuses,
+               '--pad-bytes', str(args.pad_bytes), '--description-bytes', str(args.description_bytes), '--seed', str(args.seed)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith('Serving on '):
+        process.kill()
+        raise RuntimeError(f"Mock server did not start: {line!r}")
+    return process, line.split()[-1]
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def run(args, base_url, workdir):
+    import main
+    from parse_pool import ParsePool
+    from site_registry import SiteRegistry
+    from archive import PageArchive
+    from sources import compile_sources, install_sources
+
+    install_sources(compile_sources(mock_namespace(base_url, args.keywords, args.delay)))
+    # Engine settings read as module constants
+    main.BROAD_FETCH = args.broad
+    main.DELAY_BETWEEN_REQUESTS = args.delay
+    main.CHROMEDRIVER_PATH = args.chromedriver
+
+    scraper = main.RemoteJobScraper(enrich=args.enrich, store=False)
+    if not args.chromedriver:
+        scraper.selenium_attempted = True  # Pages that need a browser are skipped
+    scraper.parse_pool = ParsePool(workers=args.workers)
+    scraper.archive = PageArchive(os.path.join(workdir, 'archive')) if args.archive else None
+    # Fresh registries: every run probes ATS and render mode like a first run, and cache/ is left alone
+    scraper.ats_registry = SiteRegistry(os.path.join(workdir, 'ats.json'), 1)
+    scraper.render_modes = SiteRegistry(os.path.join(workdir, 'render_modes.json'), 1)
+    scraper.application_links = SiteRegistry(os.path.join(workdir, 'application_links.json'), 1)
+
+    latencies = []
+    def record_latency(response, *args, **kwargs):
+        latencies.append(response.elapsed.total_seconds())  # Time to response headers
+    scraper.session.hooks['response'].append(record_latency)
+
+    start = time.perf_counter()
+    try:
+        for keyword in args.keywords:
+            if args.entry == 'search_remote_jobs':
+                scraper.search_remote_jobs(keyword)
+            else:
+                scraper.scrape_jobs([keyword])
+            scraper.flush()
+        elapsed = time.perf_counter() - start
+        jobs = scraper.writer.written
+    finally:
+        scraper.close()
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss  # Parse workers and browser helpers, reaped by now
+    return {
+        'entry': args.entry,
+        'keywords': len(args.keywords),
+        'jobs': jobs,
+        'seconds': round(elapsed, 3),
+        'jobs_per_second': round(jobs / elapsed, 1) if elapsed else 0.0,
+        'requests': len(latencies),
+        'latency_p50_ms': round(percentile(latencies, 0.5) * 1000, 1),
+        'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'peak_child_rss_mb': round(children_rss / 1024, 1)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the scraper against local mock job boards")
+    parser.add_argument('--keywords', default='python,javascript,react', help="Comma-separated keywords to scrape")
+    parser.add_argument('--entry', choices=('scrape_jobs', 'search_remote_jobs'), default='scrape_jobs',
+                        help="Scraper method run for each keyword")
+    parser.add_argument('--workers', type=int, default=None, help="Parse worker processes (default: one per core)")
+    parser.add_argument('--per-keyword', dest='broad', action='store_false',
+                        help="Fetch each board's search page per keyword instead of its feed once (BROAD_FETCH off)")
+    parser.add_argument('--delay', type=float, default=0.0, help="Politeness delay between requests in seconds")
+    parser.add_argument('--enrich', action='store_true', help="Fetch each job's detail page as well")
+    parser.add_argument('--archive', action='store_true', help="Archive fetched pages (to a temporary directory)")
+    parser.add_argument('--chromedriver', help="Local chromedriver for the JavaScript careers page (skipped without one)")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    args.keywords = [keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()]
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    process, base_url = start_server(args)
+    workdir = tempfile.mkdtemp(prefix='bench_scrape_')
+    try:
+        report = run(args, base_url, workdir)
+        with urllib.request.urlopen(f"{base_url}/_stats") as response:
+            stats = json.load(response)
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+    report['responses'] = stats['statuses']
+    report['served_mb'] = round(stats['bytes'] / 1024 / 1024, 2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    statuses = ', '.join(f"{status}: {count}" for status, count in sorted(report['responses'].items()))
+    print(f"{'entry':<18} {report['entry']} ({report['keywords']} keywords)")
+    print(f"{'jobs':<18} {report['jobs']} in {report['seconds']:.2f}s = {report['jobs_per_second']:.1f} jobs/s")
+    print(f"{'requests':<18} {report['requests']} ({statuses}), {report['served_mb']} MB served")
+    print(f"{'latency p50/p99':<18} {report['latency_p50_ms']:.1f} / {report['latency_p99_ms']:.1f} ms")
+    print(f"{'peak RSS':<18} {report['peak_rss_mb']:.1f} MB scraper, {report['peak_child_rss_mb']:.1f} MB largest child process")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Startup-time benchmark for the CLI, GUI module and parser worker processes
+
+Usage:
+    python bench_startup.py              # 10 runs per target
+    python bench_startup.py -n 30 --importtime
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+
+TARGETS = {
+    'interpreter': ['-c', 'pass'],
+    'import main': ['-c', 'import main'],
+    'cli --help': ['main.py', '--help'],
+    'reparse worker': ['-c', 'import archive, parsers'],
+    'import gui': ['-c', 'import gui'],
+}
+
+def time_target(args, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def slowest_imports(module, count=10):
+    """Return the modules with the highest cumulative import time (-X importtime)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure process startup time")
+    parser.add_argument('-n', '--runs', type=int, default=10, help="Runs per target")
+    parser.add_argument('--importtime', action='store_true', help="Also list the slowest imports of main")
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    print(f"{'target':<18} {'min ms':>8} {'median ms':>10} {'max ms':>8}")
+    for name, target_args in TARGETS.items():
+        timings = time_target(target_args, args.runs)
+        print(f"{name:<18} {min(timings):>8.1f} {statistics.median(timings):>10.1f} {max(timings):>8.1f}")
+
+    if args.importtime:
+        print("\nSlowest imports (cumulative, us) for 'import main':")
+        for micros, module in slowest_imports('main'):
+            print(f"{micros:>10}  {module}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from config import OUTPUT_DIRECTORY, CHANGE_REMOVED_AFTER_RUNS
+from logging_config import log_and_print
+
+# Fields that make up a posting's content; scrape-time stamps are left out on purpose
+HASH_FIELDS = ('title', 'company', 'location', 'url', 'salary', 'employment_type', 'tags', 'description')
+
+def job_id(job):
+    """Stable identity of a posting: its URL, or title and company when it has none"""
+    return job.get('url') or f"{job.get('title', '').lower()}|{job.get('company', '').lower()}"
+
+def content_hash(job):
+    """Short digest of a posting's content fields"""
+    text = '\x1f'.join(str(job.get(field) or '') for field in HASH_FIELDS)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+def index_path(directory, keyword):
+    return os.path.join(directory, keyword, f"{keyword}_index.json")
+
+def changes_path(directory, keyword, run_id):
+    return os.path.join(directory, keyword, f"{keyword}_changes_{run_id}.jsonl")
+
+class ChangeTracker:
+    """Classifies each run's jobs as new, changed or unchanged against a per-keyword hash index
+
+    ``output/<keyword>/<keyword>_index.json`` maps a job id to
+    ``[content hash, first seen, last seen, runs missed, title, company]``,
+    so a run is compared with history in O(n) without reading the result
+    files. A job missing from CHANGE_REMOVED_AFTER_RUNS consecutive runs is
+    reported as removed. Every run's delta (new, changed and removed jobs,
+    each with a ``change`` field) is written to
+    ``<keyword>_changes_<run>.jsonl`` as it is classified, so the writer
+    only appends; run_jobs() reads a keyword's new and changed jobs back to
+    merge them into the result files once. An index is only held in memory
+    between the first classify() for its keyword and finish().
+    """
+
+    def __init__(self, directory=OUTPUT_DIRECTORY, removed_after=CHANGE_REMOVED_AFTER_RUNS):
+        self.directory = directory
+        self.removed_after = removed_after
+        self.run_id = None
+        self._open = {}  # keyword -> (index, ids seen this run, counts)
+        self._lock = threading.Lock()
+        self.start_run()
+
+    def start_run(self):
+        """Begin a new run with its own delta files (a reused scraper calls this for every run)"""
+        now = datetime.now()
+        with self._lock:
+            # Run ids have one-second resolution; a second run within the same second must not share its files
+            if self.run_id and now.strftime('%Y%m%d_%H%M%S') <= self.run_id:
+                now = datetime.strptime(self.run_id, '%Y%m%d_%H%M%S') + timedelta(seconds=1)
+            self.run_id = now.strftime('%Y%m%d_%H%M%S')
+
+    def _load(self, keyword):
+        state = self._open.get(keyword)
+        if state is None:
+            index = {}
+            path = index_path(self.directory, keyword)
+            # The index describes the stored results; without them every job counts as new again
+            if os.path.exists(path) and os.path.exists(os.path.join(self.directory, keyword, f"{keyword}_jobs.json")):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        index = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    log_and_print(f"Rebuilding unreadable change index {path}", "warning", e)
+            state = self._open[keyword] = (index, set(), {'new': 0, 'changed': 0, 'unchanged': 0})
+        return state
+
+    def _append(self, keyword, records, create=False):
+        if not records and not create:
+            return
+        os.makedirs(os.path.join(self.directory, keyword), exist_ok=True)
+        with open(changes_path(self.directory, keyword, self.run_id), 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def classify(self, keyword, jobs):
+        """Return ``(new, changed, unchanged)`` job lists and record the delta"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        new, changed, unchanged = [], [], []
+        with self._lock:
+            index, seen, counts = self._load(keyword)
+            for job in jobs:
+                key = job_id(job)
+                digest = content_hash(job)
+                entry = index.get(key)
+                seen.add(key)
+                if entry is None or entry[3] >= self.removed_after:
+                    new.append(job)  # Never seen, or back after being removed
+                    index[key] = [digest, now, now, 0, job.get('title', ''), job.get('company', '')]
+                    continue
+                entry[2], entry[3] = now, 0
+                if entry[0] != digest:
+                    entry[0], entry[4], entry[5] = digest, job.get('title', ''), job.get('company', '')
+                    changed.append(job)
+                else:
+                    unchanged.append(job)
+            counts['new'] += len(new)
+            counts['changed'] += len(changed)
+            counts['unchanged'] += len(unchanged)
+            self._append(keyword, [dict(job, change='new') for job in new] + [dict(job, change='changed') for job in changed])
+        return new, changed, unchanged
+
+    def finish(self, keyword):
+        """Close a keyword's run: count misses, report removals, save the index; returns the counts"""
+        with self._lock:
+            if keyword not in self._open:
+                self._load(keyword)
+            index, seen, counts = self._open.pop(keyword)
+            removed = []
+            for key, entry in index.items():
+                if key in seen or entry[3] >= self.removed_after:
+                    continue
+                entry[3] += 1
+                if entry[3] >= self.removed_after:
+                    removed.append({'url': key if '://' in key else '', 'title': entry[4], 'company': entry[5],
+                                    'keyword': keyword, 'last_seen': entry[2], 'change': 'removed'})
+            self._append(keyword, removed, create=True)  # An empty delta still marks the latest run
+            counts['removed'] = len(removed)
+
+            path = index_path(self.directory, keyword)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+            os.replace(path + '.tmp', path)
+
+            with open(os.path.join(self.directory, keyword, f"{keyword}_update_log.txt"), 'a') as f:
+                f.write(f"Update performed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: "
+                        f"{counts['new']} new, {counts['changed']} changed, {counts['unchanged']} unchanged, "
+                        f"{counts['removed']} removed\n")
+        return counts
+
+    def run_jobs(self, keyword):
+        """Return the jobs this run classified as new or changed for a keyword, read back from its delta file
+
+        A job reported more than once in the run appears once, in its last version.
+        """
+        jobs = {}
+        path = changes_path(self.directory, keyword, self.run_id)
+        with self._lock:
+            if not os.path.exists(path):
+                return []
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.pop('change', None) in ('new', 'changed'):
+                        jobs[job_id(record)] = record
+        return list(jobs.values())
+
+    def open_keywords(self):
+        """Keywords classified in this run and not finished yet"""
+        with self._lock:
+            return list(self._open)
+
+def latest_changes_file(directory, keyword):
+    """Path of the newest changes file for a keyword, or None"""
+    keyword_dir = os.path.join(directory, keyword)
+    if not os.path.isdir(keyword_dir):
+        return None
+    prefix = f"{keyword}_changes_"
+    names = sorted(name for name in os.listdir(keyword_dir) if name.startswith(prefix) and name.endswith('.jsonl'))
+    return os.path.join(keyword_dir, names[-1]) if names else None
+
+def iter_changes(directory=OUTPUT_DIRECTORY, keywords=None, statuses=None):
+    """Yield the jobs in each keyword's most recent delta, optionally only some statuses"""
+    if not os.path.isdir(directory):
+        return
+    for keyword in sorted(os.listdir(directory)):
+        if keywords and keyword not in keywords:
+            continue
+        path = latest_changes_file(directory, keyword)
+        if not path:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written line from an interrupted run
+                if not statuses or record.get('change') in statuses:
+                    yield record
@@ -25,17 +25,61 @@ EXPERIENCE_LEVELS = [
 # Scraping configuration
 DELAY_BETWEEN_REQUESTS = 2  # seconds
 MAX_RETRIES = 3
-TIMEOUT = 30  # seconds
+TIMEOUT = 30  # seconds; for streamed fetches, the longest wait for headers or for the next part of the body
+CONNECT_TIMEOUT = 10  # seconds to open a connection
+HTTP_POOL_SIZE = 10  # keep-alive connections kept per host
 
 # Output settings
 OUTPUT_DIRECTORY = 'output'
 SAVE_AS_CSV = True
 SAVE_AS_JSON = True
+CHANGE_REMOVED_AFTER_RUNS = 3  # a job missing from this many consecutive runs is reported as removed
+
+# Retention for output/ (applied after every batch run, or with `python main.py compact`)
+RETENTION_MAX_SNAPSHOTS = 10  # per-run files kept per keyword; older ones are merged into <keyword>_history.jsonl.gz
+RETENTION_SNAPSHOT_MAX_AGE_DAYS = 30  # per-run files older than this are merged even below the limit
+RETENTION_EXPIRE_AFTER_DAYS = 60  # postings not seen for this long move from the results to history
+EXPORT_COMPRESSION_LEVEL = 6  # gzip level for compressed exports, 1 (fastest) - 9 (smallest)
+EXPORT_PROGRESS_EVERY = 1000  # rows between export progress updates
+
+# Raw page archive (used by `python main.py reparse`)
+ARCHIVE_PAGES = True
+ARCHIVE_DIRECTORY = 'archive'
+ARCHIVE_COMPRESSION_LEVEL = 6  # gzip level, 1 (fastest) - 9 (smallest)
+REPARSE_WORKERS = None  # None = one worker per CPU core
+PARSE_WORKERS = None  # processes parsing fetched pages during a scrape; None = one per CPU core, 1 = parse inline
+PARSE_POOL_MIN_BYTES = 64 * 1024  # smaller pages are parsed inline, where a process round trip costs more
+
+# Run metrics
+METRICS_DIRECTORY = 'metrics'  # JSON summary written here after every batch run
+METRICS_PORT = 9108  # /metrics endpoint port in daemon mode
+DAEMON_INTERVAL = 3600  # seconds between runs in daemon mode
+
+# Profiling (--profile / GUI "Profile run")
+PROFILE_DIRECTORY = 'profiles'
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+PROFILE_TOP_ALLOCATIONS = 25  # allocation sites listed per stage
+
+# Run timeline traces (--trace)
+TRACE_DIRECTORY = 'traces'
+
+# GUI settings
+FILTER_DEBOUNCE_MS = 200  # wait this long after the last keystroke before filtering
+UI_TICK_MS = 50  # how often queued updates from the scraping thread are applied
+UI_MAX_EVENTS_PER_TICK = 5000  # cap per tick so a burst can't stall the main loop
+LOG_MAX_LINES = 1000  # lines kept in the GUI log panel
+SCRAPER_IDLE_TIMEOUT = 600  # seconds before the GUI's warm browser is shut down
+SCRAPER_IDLE_CHECK_MS = 30000  # how often the GUI checks for an idle scraper
+
+# Long-running processes (daemon, GUI) poll this file and hot-reload KEYWORDS,
+# JOB_BOARDS, JOB_FEEDS and the company lists below; other settings need a restart
+CONFIG_RELOAD_SECONDS = 5
 
 # Job board configurations
 JOB_BOARDS = {
     'WeWorkRemotely': {
         'enabled': True,
+        'feed': 'WeWorkRemotely',  # JOB_FEEDS entry used in broad-fetch mode
         'base_url': 'https://weworkremotely.com/remote-jobs/search?term=',
         'job_selector': '.feature, .job',
         'title_selector': 'span.title',
@@ -45,6 +89,7 @@ JOB_BOARDS = {
     },
     'RemoteOK': {
         'enabled': True,
+        'feed': 'RemoteOK',  # JOB_FEEDS entry used in broad-fetch mode
         'base_url': 'https://remoteok.com/remote-',
         'job_selector': 'tr[data-url]',
         'title_selector': 'h2[itemprop="title"]',
@@ -54,6 +99,7 @@ JOB_BOARDS = {
     },
     'Remotive': {
         'enabled': True,
+        'feed': 'Remotive',  # JOB_FEEDS entry used in broad-fetch mode
         'base_url': 'https://remotive.com/remote-jobs/search?query=',
         'job_selector': '.job-list-item',
         'title_selector': '.job-title',
@@ -63,6 +109,108 @@ JOB_BOARDS = {
     }
 }
 
+# Machine-readable listing feeds; each is fetched once per run and filtered
+# against the keywords locally
+JOB_FEEDS = {
+    'WeWorkRemotely': {
+        'url': 'https://weworkremotely.com/remote-jobs.rss'
+    },
+    'RemoteOK': {
+        'url': 'https://remoteok.com/api'
+    },
+    'Remotive': {
+        'url': 'https://remotive.com/api/remote-jobs'
+    }
+}
+
+# Applicant-tracking-system adapters: companies whose careers page is backed by
+# Greenhouse, Lever, Ashby or Workable are read from the ATS's JSON board
+# instead of through Selenium. Set 'ats': '<ats>:<board token>' on a company to
+# skip detection; detection results are cached in ATS_CACHE_FILE.
+ATS_CACHE_FILE = 'cache/ats.json'
+ATS_DETECT_TTL_DAYS = 7  # re-probe careers pages for their ATS after this many days
+
+# Careers pages are fetched over plain HTTP first; Chrome is only used (and only
+# started) for pages whose listings are not in the server-rendered HTML. The
+# per-page decision is cached and re-probed after RENDER_REPROBE_DAYS.
+RENDER_MODE_CACHE_FILE = 'cache/render_modes.json'
+RENDER_REPROBE_DAYS = 3
+
+# Application-link resolver (RemoteJobScraper.resolve_application_links)
+APPLY_LINK_CACHE_FILE = 'cache/apply_links.json'
+APPLY_LINK_TTL_DAYS = 14  # resolve a job's application link again after this many days
+APPLY_LINK_WORKERS = 8  # job pages fetched concurrently over HTTP
+APPLY_LINK_BROWSER_FALLBACK = True  # render pages with no link in their HTML in Chrome
+
+# Job detail enrichment (description, salary, tags, employment type)
+ENRICH_JOBS = False  # also enabled per run with `python main.py --enrich`
+ENRICH_CACHE_FILE = 'cache/job_details.json'
+ENRICH_TTL_DAYS = 30  # a posting's details are fetched once in this period
+ENRICH_WORKERS = 8  # detail pages fetched concurrently
+ENRICH_PER_HOST = 2  # concurrent detail requests per host
+ENRICH_DESCRIPTION_MAX_CHARS = 4000
+ENRICH_MAX_PENDING = 200  # jobs waiting for details before add_job blocks
+ENRICH_WAIT_TIMEOUT = 120  # seconds a flush or close waits for detail pages before passing the jobs on without them
+
+# Scrape pipeline: jobs pass through a bounded queue to a writer thread that
+# saves them in batches, so memory stays flat however large the run is
+PIPELINE_QUEUE_SIZE = 1000  # jobs queued for the writer before the scraper blocks
+PIPELINE_BATCH_SIZE = 200  # jobs written per batch
+PIPELINE_FLUSH_SECONDS = 5  # write a partial batch after this long
+
+# Per-source selectors for detail pages, used when a page has no JobPosting JSON-LD
+DETAIL_SELECTORS = {
+    'RemoteOK': {
+        'description': '.description, .markdown',
+        'tags': '.tags .tag, a.tag',
+        'salary': '.salary'
+    },
+    'We Work Remotely': {
+        'description': '.listing-container',
+        'tags': '.listing-header-container .listing-tag, .lis-container__job__sidebar__job-about__list__item span.box',
+        'salary': None
+    },
+    'Remotive': {
+        'description': '.job-description, #job-description',
+        'tags': '.job-tile-tags a, .job-tags a',
+        'salary': '.job-salary'
+    }
+}
+
+# Lean Selenium profile: Chrome skips the resources listings don't need
+BROWSER_LEAN_PROFILE = True  # False loads pages in full (useful to compare bytes/load time)
+BROWSER_PAGE_LOAD_STRATEGY = 'eager'  # return from get() at DOMContentLoaded
+BROWSER_BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media']  # also available: 'stylesheet'
+BROWSER_BLOCKED_DOMAINS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'segment.com',
+    'segment.io',
+    'optimizely.com',
+    'newrelic.com',
+    'nr-data.net',
+    'fullstory.com',
+    'intercom.io',
+    'hs-scripts.com',
+    'hs-analytics.net',
+    'clarity.ms',
+    'bat.bing.com',
+    'ads.linkedin.com',
+    'snap.licdn.com'
+]
+BROWSER_USER_DATA_DIR = 'cache/chrome-profile'  # reused between runs; None for a throwaway profile
+BROWSER_DISK_CACHE_MB = 50
+CHROMEDRIVER_PATH = None  # a local chromedriver; None lets webdriver-manager download a matching one
+
+# Fetch boards with a 'feed' once per run and tag listings with every matching
+# keyword, instead of one search request per (board, keyword)
+BROAD_FETCH = True
+
 # Browser headers for requests
 BROWSER_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -73,6 +221,7 @@ COMPANY_CAREER_PAGES = [
     {
         'name': 'GitLab',
         'url': 'https://about.gitlab.com/jobs/',
+        'ats': 'greenhouse:gitlab',
         'job_selector': '.job',
         'title_selector': '.job-title',
         'location_selector': '.job-location',
@@ -108,6 +257,7 @@ COMPANY_CAREER_PAGES = [
 REMOTE_COMPANIES = {
     'GitLab': {
         'url': 'https://about.gitlab.com/jobs/',
+        'ats': 'greenhouse:gitlab',
         'search_selector': '#search',
         'job_selector': '.job',
         'title_selector': '.job-title',
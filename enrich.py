@@ -0,0 +1,137 @@
+import threading
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from config import ENRICH_CACHE_FILE, ENRICH_TTL_DAYS, ENRICH_WORKERS, ENRICH_PER_HOST, ENRICH_MAX_PENDING, ENRICH_WAIT_TIMEOUT
+from logging_config import logger, log_and_print
+from site_registry import SiteRegistry
+
+DETAIL_FIELDS = ('description', 'salary', 'tags', 'employment_type')
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {'ref', 'source', 'src', 'gh_src', 'lever-source', 'lever-origin', 'utm_source',
+                   'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'fbclid', 'gclid'}
+
+def canonical_url(url):
+    """Normalise a job URL so the same posting always maps to one cache key"""
+    parts = urlparse(url.strip())
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+             if name.lower() not in TRACKING_PARAMS and not name.lower().startswith('utm_')]
+    return urlunparse((
+        parts.scheme.lower() or 'https',
+        parts.netloc.lower().removeprefix('www.'),
+        parts.path.rstrip('/') or '/',
+        '',
+        urlencode(sorted(query)),
+        ''
+    ))
+
+class JobEnricher:
+    """Background stage adding detail-page fields to jobs as they are added
+
+    Jobs are submitted from ``add_job``; detail pages are fetched on a
+    thread pool with at most ``per_host`` requests per host in flight,
+    parsed by the per-source extractor and written into the job dict.
+    Results are cached by canonical URL for ENRICH_TTL_DAYS, so a posting is
+    fetched once however many runs and keywords it shows up in.
+    ``on_done(job)`` receives each job once its details are in (or could
+    not be fetched); ``submit`` blocks while ``max_pending`` fetches are
+    outstanding, which keeps the queue of waiting jobs bounded.
+    """
+
+    def __init__(self, fetch, extract, workers=ENRICH_WORKERS, per_host=ENRICH_PER_HOST,
+                 cache=None, on_done=None, max_pending=ENRICH_MAX_PENDING):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.fetch = fetch
+        self.extract = extract
+        self.per_host = per_host
+        self.on_done = on_done
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.cache = cache or SiteRegistry(ENRICH_CACHE_FILE, ENRICH_TTL_DAYS)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enrich')
+        self._host_limits = {}
+        self._waiting = {}  # canonical URL -> jobs waiting for its details
+        self._futures = []
+        self._lock = threading.Lock()
+        self.fetched = 0
+        self.cached = 0
+
+    def submit(self, job):
+        """Queue a job for enrichment; cached details are applied immediately"""
+        if not job.get('url'):
+            self._done([job])
+            return
+        key = canonical_url(job['url'])
+        with self._lock:
+            known, details = self.cache.lookup(key)
+            if not known and key in self._waiting:
+                self._waiting[key].append(job)  # Already being fetched for another keyword
+                return
+        if known:
+            job.update(details)
+            self.cached += 1
+            self._done([job])
+            return
+        self._slots.acquire()
+        with self._lock:
+            self._waiting[key] = [job]
+            self._futures.append(self._executor.submit(self._enrich, key, job['url'], job.get('source', '')))
+
+    def _done(self, jobs):
+        if self.on_done:
+            for job in jobs:
+                self.on_done(job)
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _enrich(self, key, url, source):
+        try:
+            with self._host_limit(url):
+                response = self.fetch(url)
+            response.raise_for_status()
+            details = self.extract(response.content, source)
+            details = {field: details.get(field, '') for field in DETAIL_FIELDS}
+        except Exception as e:
+            logger.debug("Could not enrich %s: %s", url, e)
+            details = None  # Not cached, so the next run tries again
+        with self._lock:
+            if details is not None:
+                self.cache.record(key, details, persist=False)
+                self.fetched += 1
+            jobs = self._waiting.pop(key, [])
+        if details is not None:
+            for job in jobs:
+                job.update(details)
+        self._slots.release()
+        self._done(jobs)
+
+    def wait(self, timeout=ENRICH_WAIT_TIMEOUT):
+        """Block until all queued jobs are enriched and persist the cache
+
+        Jobs whose detail page is still being fetched after ``timeout``
+        seconds are passed on without details.
+        """
+        from concurrent.futures import wait
+
+        with self._lock:
+            futures, self._futures = self._futures, []
+        _, pending = wait(futures, timeout)
+        if pending:
+            with self._lock:
+                stalled, self._waiting = self._waiting, {}  # A late fetch then finds no jobs to update
+            log_and_print(f"Gave up waiting for {len(stalled)} job detail pages after {timeout}s", "warning")
+            for jobs in stalled.values():
+                self._done(jobs)
+        if futures:
+            self.cache.save()
+        if futures or self.cached:
+            log_and_print(f"Enriched jobs: {self.fetched} detail pages fetched, {self.cached} from cache")
+        self.fetched = self.cached = 0
+
+    def close(self):
+        self.wait()
+        self._executor.shutdown(wait=False, cancel_futures=True)  # Only stalled fetches can still be running
@@ -0,0 +1,137 @@
+import os
+import csv
+import json
+import gzip
+from config import OUTPUT_DIRECTORY, EXPORT_COMPRESSION_LEVEL, EXPORT_PROGRESS_EVERY
+from logging_config import log_and_print
+
+# Exported column name -> job field and default
+EXPORT_COLUMNS = {
+    'Title': ('title', ''),
+    'Company': ('company', ''),
+    'Location': ('location', 'Remote'),
+    'Source': ('source', ''),
+    'URL': ('url', ''),
+    'Date Posted': ('date_posted', ''),
+    'Keyword': ('keyword', ''),
+    'Salary': ('salary', ''),
+    'Employment Type': ('employment_type', ''),
+    'Tags': ('tags', ''),
+    'Description': ('description', ''),
+    'Change': ('change', '')
+}
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'json')
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+
+class ExportCancelled(Exception):
+    """Raised when the progress callback asks an export to stop"""
+
+def export_row(job):
+    """Map a job dict to the exported column names"""
+    return {column: job.get(field) or default for column, (field, default) in EXPORT_COLUMNS.items()}
+
+def detect_compression(path):
+    """Return 'gzip', 'zstd' or None based on the file extension"""
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+def detect_format(path):
+    """Return the export format implied by the file name (ignoring a compression suffix)"""
+    root, ext = os.path.splitext(path.lower())
+    if ext in COMPRESSION_SUFFIXES:
+        ext = os.path.splitext(root)[1]
+    return ext.lstrip('.') if ext.lstrip('.') in EXPORT_FORMATS else None
+
+def open_export(path, compression=None):
+    """Open a text stream for writing, optionally gzip or zstd compressed"""
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=EXPORT_COMPRESSION_LEVEL)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd compression requires the 'zstandard' package (pip install zstandard)")
+        import io
+        raw = open(path, 'wb')
+        stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if compression:
+        raise ValueError(f"Unknown compression: {compression}")
+    return open(path, 'w', encoding='utf-8', newline='')
+
+def export_jobs(jobs, path, format_type, compression=None, total=None, progress=None):
+    """Stream jobs to a CSV, JSON-lines or JSON file one row at a time
+
+    ``jobs`` may be any iterable, so rows are never collected in memory.
+    ``progress(written, total)`` is called every EXPORT_PROGRESS_EVERY rows
+    and once at the end; if it returns False the export stops, the partial
+    file is removed and ExportCancelled is raised. Returns the row count.
+    """
+    if format_type not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {format_type}")
+
+    written = 0
+    try:
+        with open_export(path, compression) as f:
+            if format_type == 'csv':
+                writer = csv.DictWriter(f, fieldnames=list(EXPORT_COLUMNS))
+                writer.writeheader()
+                write = writer.writerow
+            elif format_type == 'jsonl':
+                write = lambda row: f.write(json.dumps(row, ensure_ascii=False) + '\n')
+            else:
+                f.write('[')
+                write = lambda row: f.write((',\n  ' if written else '\n  ') + json.dumps(row, ensure_ascii=False))
+
+            for job in jobs:
+                write(export_row(job))
+                written += 1
+                if progress and written % EXPORT_PROGRESS_EVERY == 0 and progress(written, total) is False:
+                    raise ExportCancelled(f"Export cancelled after {written} rows")
+
+            if format_type == 'json':
+                f.write('\n]\n' if written else ']\n')
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+    if progress:
+        progress(written, total)
+    return written
+
+def iter_stored_jobs(directory=OUTPUT_DIRECTORY, keywords=None):
+    """Yield jobs from the per-keyword JSON result files, one keyword file at a time"""
+    if not os.path.isdir(directory):
+        return
+    for keyword in sorted(os.listdir(directory)):
+        if keywords and keyword not in keywords:
+            continue
+        path = os.path.join(directory, keyword, f"{keyword}_jobs.json")
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            log_and_print(f"Skipping unreadable result file {path}", "warning", e)
+            continue
+        for job in jobs:
+            job.setdefault('keyword', keyword)
+            yield job
+
+def open_folder(path):
+    """Open a folder in the platform's file manager; returns False if that isn't possible"""
+    import sys
+    import subprocess
+
+    try:
+        if sys.platform == 'win32':
+            os.startfile(path)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', path])
+        else:
+            subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return True
+    except OSError:
+        return False
@@ -1,14 +1,226 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import threading
+import queue
+import time
+import itertools
 from datetime import datetime
 import os
-import pandas as pd
-import json
+from array import array
 from main import RemoteJobScraper
-from logging_config import logger
+from sources import ConfigWatcher
+from export import export_jobs, detect_format, detect_compression, open_folder, ExportCancelled
+from logging_config import logger, setup_logging
+from metrics import metrics
+from profiling import enable_profiling, finish_profiling
 import config  # Import config module directly
 
+class JobSearchIndex:
+    """Precomputed lowercase search keys plus a trigram index for the results filter
+
+    Each job's searchable text is lowercased once when it is added. A query
+    term of three or more characters only visits the jobs in the posting
+    list of its rarest trigram, which are then confirmed with a substring
+    check; shorter terms fall back to scanning the precomputed keys.
+    """
+
+    SEARCH_FIELDS = ('title', 'company', 'location', 'source', 'keyword', 'date_posted')
+
+    def __init__(self):
+        self.keys = []
+        self.trigrams = {}
+
+    def clear(self):
+        self.keys = []
+        self.trigrams = {}
+
+    def add(self, job):
+        """Index a job; its index is the next position in the job list"""
+        index = len(self.keys)
+        key = ' '.join(str(job.get(field) or '') for field in self.SEARCH_FIELDS).lower()
+        self.keys.append(key)
+        for gram in {key[i:i + 3] for i in range(len(key) - 2)}:
+            postings = self.trigrams.get(gram)
+            if postings is None:
+                postings = self.trigrams[gram] = array('l')
+            postings.append(index)
+        return index
+
+    def matches(self, index, terms):
+        key = self.keys[index]
+        return all(term in key for term in terms)
+
+    def search(self, query):
+        """Return the indices of all jobs containing every whitespace-separated term"""
+        terms = query.lower().split()
+        if not terms:
+            return list(range(len(self.keys)))
+
+        candidates = None
+        for term in terms:
+            if len(term) < 3:
+                continue
+            postings = [self.trigrams.get(term[i:i + 3]) for i in range(len(term) - 2)]
+            if any(p is None for p in postings):
+                return []
+            rarest = min(postings, key=len)
+            if candidates is None or len(rarest) < len(candidates):
+                candidates = rarest
+
+        if candidates is None:
+            candidates = range(len(self.keys))
+        return [index for index in candidates if self.matches(index, terms)]
+
+class VirtualTreeview:
+    """Treeview that only keeps the visible window of rows as Tk items
+
+    ``rows`` is a plain list of row keys; ``row_data(key)`` returns
+    ``(text, values, tags)`` for a key. A fixed pool of Treeview items, one per
+    visible line, is rebound to different keys as the view scrolls, so
+    appending or scrolling through 100k rows never creates more than a
+    screenful of Tk items.
+    """
+
+    def __init__(self, tree, scrollbar, row_data):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_data = row_data
+        self.rows = []
+        self._positions = {}  # row key -> index in rows
+        self.offset = 0
+        self.visible_count = 1
+        self.selected_key = None
+        self._pool = []  # Treeview item ids, one per visible line
+        self._pool_keys = {}  # item id -> row key currently shown
+        self._detached = set()  # Pool items not in the tree (Tk reports them like an attached first row)
+        self._row_height = 20
+        self._header_height = 0
+
+        self.scrollbar.config(command=self.on_scrollbar)
+        self.tree.bind('<Configure>', self.on_configure)
+        self.tree.bind('<MouseWheel>', self.on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+        self.tree.bind('<<TreeviewSelect>>', self.on_select, add='+')
+        self.tree.bind('<Up>', lambda event: self.move_selection(-1))
+        self.tree.bind('<Down>', lambda event: self.move_selection(1))
+        self.tree.bind('<Prior>', lambda event: self.scroll(-self.visible_count))
+        self.tree.bind('<Next>', lambda event: self.scroll(self.visible_count))
+
+    def set_rows(self, rows):
+        """Replace all rows and scroll back to the top"""
+        self.rows = list(rows)
+        self._positions = {key: index for index, key in enumerate(self.rows)}
+        self.offset = 0
+        self.refresh()
+
+    def append_rows(self, rows):
+        """Append rows; only re-renders if they land in the visible window"""
+        start = len(self.rows)
+        self.rows.extend(rows)
+        for index in range(start, len(self.rows)):
+            self._positions[self.rows[index]] = index
+        if start < self.offset + self.visible_count:
+            self.refresh()
+        else:
+            self.update_scrollbar()
+
+    def key_for_item(self, item):
+        """Return the row key currently displayed by a Treeview item"""
+        return self._pool_keys.get(item)
+
+    def refresh(self):
+        """Rebind the item pool to the rows in the visible window"""
+        self.offset = max(0, min(self.offset, len(self.rows) - self.visible_count))
+        self._resize_pool()
+        self._pool_keys = {}
+        selected_item = None
+        for i, item in enumerate(self._pool):
+            index = self.offset + i
+            if index < len(self.rows):
+                key = self.rows[index]
+                text, values, tags = self.row_data(key)
+                self.tree.item(item, text=text, values=values, tags=tags)
+                if item in self._detached or self.tree.index(item) != i:
+                    self.tree.move(item, '', i)
+                    self._detached.discard(item)
+                self._pool_keys[item] = key
+                if key == self.selected_key:
+                    selected_item = item
+            elif item not in self._detached:
+                self.tree.detach(item)
+                self._detached.add(item)
+
+        if selected_item:
+            self.tree.selection_set(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        self.update_scrollbar()
+
+    def _resize_pool(self):
+        while len(self._pool) < self.visible_count:
+            self._pool.append(self.tree.insert('', 'end', text=''))
+        while len(self._pool) > self.visible_count:
+            item = self._pool.pop()
+            self.tree.delete(item)
+            self._detached.discard(item)
+
+    def update_scrollbar(self):
+        total = len(self.rows)
+        if total <= self.visible_count:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.visible_count) / total)
+
+    def scroll(self, lines):
+        offset = max(0, min(self.offset + lines, len(self.rows) - self.visible_count))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+        return 'break'
+
+    def on_scrollbar(self, action, *args):
+        if action == 'moveto':
+            self.offset = int(float(args[0]) * len(self.rows))
+            self.refresh()
+        elif action == 'scroll':
+            amount, unit = int(args[0]), args[1]
+            self.scroll(amount * (self.visible_count if unit == 'pages' else 1))
+
+    def on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * steps)
+
+    def on_configure(self, event):
+        if self._pool and self.tree.bbox(self._pool[0]):
+            _, y, _, height = self.tree.bbox(self._pool[0])
+            self._header_height, self._row_height = y, max(height, 1)
+        visible_count = max(1, (event.height - self._header_height) // self._row_height)
+        if visible_count != self.visible_count:
+            self.visible_count = visible_count
+            self.refresh()
+
+    def on_select(self, event):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._pool_keys:
+            self.selected_key = self._pool_keys[selection[0]]
+
+    def move_selection(self, step):
+        if self.selected_key is None or not self.rows:
+            return 'break'
+        index = self._positions.get(self.selected_key)
+        if index is None:
+            return 'break'
+        index = max(0, min(index + step, len(self.rows) - 1))
+        self.selected_key = self.rows[index]
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_count:
+            self.offset = index - self.visible_count + 1
+        self.refresh()
+        return 'break'
+
 class JobScraperGUI:
     def __init__(self, root):
         try:
@@ -16,6 +228,18 @@ class JobScraperGUI:
             self.root.title("Remote Job Scraper")
             self.is_scraping = False
             self.all_jobs_data = []
+            self.search_index = JobSearchIndex()
+            self.filter_after_id = None
+            self.ui_events = queue.SimpleQueue()  # (kind, payload) posted from worker threads
+            
+            # Long-lived scraper (warm browser and HTTP connections) shared by all runs
+            self.scraper = None
+            self.scraper_last_used = time.monotonic()
+            self.engine_lock = threading.Lock()
+            self.scrape_thread = None  # Worker of the current run; cleared as its last step
+            self.is_exporting = False
+            # Source edits in config.py apply to the next keyword scraped, keeping the warm scraper
+            self.config_watcher = ConfigWatcher().start()
             
             # Configure grid weights to make it responsive
             self.root.grid_rowconfigure(1, weight=1)  # Results row expands
@@ -41,6 +265,10 @@ class JobScraperGUI:
             # Create bottom section
             self.create_bottom_section()
             
+            # Apply updates from worker threads on the Tk main loop
+            self.root.after(config.UI_TICK_MS, self.drain_ui_events)
+            self.root.after(config.SCRAPER_IDLE_CHECK_MS, self.check_idle_scraper)
+            
             # Log successful initialization
             self.log("GUI initialized successfully")
             
@@ -111,6 +339,15 @@ class JobScraperGUI:
             row=0, column=3, padx=5
         )
         
+        # Profiling toggle
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Profile run", variable=self.profile_var).grid(
+            row=0, column=4, padx=5
+        )
+        
+        self.restart_button = ttk.Button(button_frame, text="Restart Engine", command=self.restart_engine)
+        self.restart_button.grid(row=0, column=5, padx=5)
+        
         # Progress section
         progress_frame = ttk.LabelFrame(self.main_frame, text="Progress", padding="5")
         progress_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=5, padx=5)
@@ -123,9 +360,22 @@ class JobScraperGUI:
         
     def create_results_tree(self):
         """Create the results treeview with scrollbars"""
+        # Filter box above the results
+        filter_frame = ttk.Frame(self.results_frame)
+        filter_frame.grid(row=0, column=0, sticky='ew', pady=(0, 5))
+        filter_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(filter_frame, text="Filter:").grid(row=0, column=0, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.filter_var).grid(row=0, column=1, sticky='ew')
+        self.filter_var.trace_add('write', self.schedule_filter)
+        self.match_count_var = tk.StringVar(value="")
+        ttk.Label(filter_frame, textvariable=self.match_count_var).grid(row=0, column=2, padx=5)
+        
         # Create frame for treeview and scrollbars
+        self.results_frame.grid_rowconfigure(0, weight=0)
+        self.results_frame.grid_rowconfigure(1, weight=1)
         tree_frame = ttk.Frame(self.results_frame)
-        tree_frame.grid(row=0, column=0, sticky='nsew')
+        tree_frame.grid(row=1, column=0, sticky='nsew')
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
         
@@ -138,13 +388,11 @@ class JobScraperGUI:
         hsb.grid(row=1, column=0, sticky='ew')
         
         # Create treeview
-        self.results_tree = ttk.Treeview(tree_frame, selectmode='browse', 
-                                        yscrollcommand=vsb.set,
+        self.results_tree = ttk.Treeview(tree_frame, selectmode='browse',
                                         xscrollcommand=hsb.set)
         self.results_tree.grid(row=0, column=0, sticky='nsew')
         
-        # Configure scrollbars
-        vsb.config(command=self.results_tree.yview)
+        # Configure scrollbars (vertical scrolling is handled by the virtual view)
         hsb.config(command=self.results_tree.xview)
         
         # Configure columns
@@ -165,9 +413,13 @@ class JobScraperGUI:
         # Configure tags for URL styling
         self.results_tree.tag_configure('link', foreground='blue')
         
+        # Only the visible rows exist as Treeview items
+        self.results_view = VirtualTreeview(self.results_tree, vsb, self.job_row)
+        
         # Bind double-click event
         self.results_tree.bind('<Double-1>', self.on_tree_double_click)
         self.results_tree.bind('<Button-1>', self.on_tree_click)
+        self.results_tree.bind('<Return>', self.show_job_details)
         
     def create_bottom_section(self):
         # Log section - moved below results
@@ -193,68 +445,83 @@ class JobScraperGUI:
             self.custom_keyword.delete(0, tk.END)
             
     def show_job_details(self, event):
-        item = self.results_tree.selection()[0]
-        job_title = self.results_tree.item(item)['text']
-        for job in self.all_jobs_data:
-            if job['title'] == job_title:
-                JobDetailsWindow(self.root, job)
-                break
+        selection = self.results_tree.selection()
+        if not selection:
+            return
+        index = self.results_view.key_for_item(selection[0])
+        if index is not None:
+            JobDetailsWindow(self.root, self.all_jobs_data[index])
+            
+    def schedule_filter(self, *args):
+        """Debounce filter input: apply it once typing pauses"""
+        if self.filter_after_id is not None:
+            self.root.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.root.after(config.FILTER_DEBOUNCE_MS, self.apply_filter)
             
     def apply_filter(self, *args):
+        self.filter_after_id = None
         filter_text = self.filter_var.get().lower()
         self.update_results_tree(filter_text)
         
     def export_results(self, format_type):
-        """Export results to CSV or JSON file"""
+        """Export results to a CSV or JSON file from a background thread"""
         if not self.all_jobs_data:
             messagebox.showwarning("No Data", "No job data available to export!")
             return
-            
-        # Create a list of dictionaries for DataFrame
-        jobs_list = []
-        for job in self.all_jobs_data:
-            job_dict = {
-                'Title': job.get('title', ''),
-                'Company': job.get('company', ''),
-                'Location': job.get('location', 'Remote'),
-                'Source': job.get('source', ''),
-                'URL': job.get('url', ''),
-                'Date Posted': job.get('date_posted', ''),
-                'Keyword': job.get('keyword', '')
-            }
-            jobs_list.append(job_dict)
+        if self.is_exporting:
+            messagebox.showwarning("Export in Progress", "Please wait for the current export to finish.")
+            return
             
         # Get file name from user
         if format_type == 'csv':
             filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
+                filetypes=[("CSV files", "*.csv"), ("Gzipped CSV", "*.csv.gz"), ("Zstd CSV", "*.csv.zst")],
                 title="Export as CSV"
             )
         else:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json")],
+                filetypes=[("JSON files", "*.json"), ("JSON lines", "*.jsonl"),
+                           ("Gzipped JSON lines", "*.jsonl.gz"), ("Zstd JSON lines", "*.jsonl.zst")],
                 title="Export as JSON"
             )
+        if not filename:
+            return
             
-        if filename:
+        format_type = detect_format(filename) or format_type
+        compression = detect_compression(filename)
+        # Rows are only ever appended, so the export streams the first `total` of them in place
+        jobs = self.all_jobs_data
+        total = len(jobs)
+        self.is_exporting = True
+        self.log(f"Exporting {total} jobs to {filename}...")
+        
+        def report(written, total):
+            self.post('status', f"Exported {written}/{total} jobs")
+            return self.is_exporting
+        
+        def run_export():
             try:
-                if format_type == 'csv':
-                    df = pd.DataFrame(jobs_list)
-                    df.to_csv(filename, index=False, encoding='utf-8')
-                else:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(jobs_list, f, indent=2, ensure_ascii=False)
-                        
-                messagebox.showinfo("Success", f"Data exported successfully to {filename}")
-                
-                # Open the containing folder
-                folder_path = os.path.dirname(os.path.abspath(filename))
-                os.startfile(folder_path)
-                
+                export_jobs(itertools.islice(jobs, total), filename, format_type,
+                            compression=compression, total=total, progress=report)
+                self.log(f"Exported {total} jobs to {filename}")
+                self.post('call', lambda: self.export_finished(filename))
+            except ExportCancelled:
+                self.log("Export cancelled")
             except Exception as e:
-                messagebox.showerror("Export Error", f"Error exporting data: {str(e)}")
+                logger.error(f"Error exporting data: {str(e)}", exc_info=True)
+                message = f"Error exporting data: {str(e)}"
+                self.post('call', lambda: messagebox.showerror("Export Error", message))
+            finally:
+                self.is_exporting = False
+                
+        threading.Thread(target=run_export, daemon=True).start()
+        
+    def export_finished(self, filename):
+        """Offer to open the export's folder once the background export is done"""
+        if messagebox.askyesno("Success", f"Data exported successfully to {filename}\n\nOpen the containing folder?"):
+            open_folder(os.path.dirname(os.path.abspath(filename)))
         
     def show_completion_summary(self):
         """Show summary of scraped jobs"""
@@ -284,7 +551,7 @@ class JobScraperGUI:
         
     def start_scraping(self):
         """Start the scraping process"""
-        if self.is_scraping:
+        if self.is_scraping or self.scrape_thread is not None:
             return
         
         selected_keywords = [
@@ -303,93 +570,116 @@ class JobScraperGUI:
         self.is_scraping = True
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
+        self.restart_button.config(state=tk.DISABLED)
         
         # Clear previous results
         self.all_jobs_data = []
-        self.results_tree.delete(*self.results_tree.get_children())
+        self.search_index.clear()
+        self.results_view.set_rows([])
+        self.match_count_var.set("")
+        
+        profile_run = self.profile_var.get()
         
+        # Runs on a worker thread: all widget updates go through self.post()
         def scrape():
+            scraper = None
+            metrics.start_run()
             try:
-                self.scraper = RemoteJobScraper()
+                if profile_run:
+                    self.log(f"Profiling enabled, writing to {enable_profiling()}")
+                scraper = self.get_scraper()
+                scraper.writer.on_batch = self.on_scraped_jobs
                 total_keywords = len(selected_keywords)
+                total_found = 0
                 
                 for idx, keyword in enumerate(selected_keywords, 1):
                     if not self.is_scraping:
                         break
                         
-                    self.progress_var.set(f"Searching for {keyword} jobs... ({idx}/{total_keywords})")
+                    self.post('status', f"Searching for {keyword} jobs... ({idx}/{total_keywords})")
                     self.log(f"Searching for {keyword} jobs...")
                     
-                    # Get jobs for this keyword
-                    jobs = self.scraper.scrape_jobs([keyword])
+                    # Jobs reach the results view in batches through on_scraped_jobs
+                    total_found += scraper.scrape_jobs([keyword])
+                    if scraper.enricher:
+                        self.post('status', f"Fetching job details for {keyword}...")
+                    scraper.flush()
                     
-                    # Add jobs to the list with keyword
-                    for job in jobs:
-                        job['keyword'] = keyword
-                        self.all_jobs_data.append(job)
-                        self.log(f"Found job: {job['title']} at {job['company']}")
-                    
-                    # Update progress
-                    progress = (idx / total_keywords) * 100
-                    self.progress_bar['value'] = progress
-                    
-                    # Update the results tree after each keyword
-                    self.root.after(0, self.update_results_tree)
+                    self.post('progress', (idx / total_keywords) * 100)
                     
                 if self.is_scraping:
-                    self.progress_var.set("Scraping completed!")
-                    self.log(f"Found {len(self.all_jobs_data)} total jobs")
-                    self.root.after(0, self.show_completion_summary)
+                    self.post('status', "Scraping completed!")
+                    self.log(f"Found {total_found} total jobs")
+                    self.post('call', self.show_completion_summary)
                 
             except Exception as e:
                 logger.error(f"Error during scraping: {str(e)}")
-                self.progress_var.set(f"Error: {str(e)}")
+                self.post('status', f"Error: {str(e)}")
                 self.log(f"Error during scraping: {str(e)}")
-                messagebox.showerror("Error", f"An error occurred during scraping: {str(e)}")
+                error_message = f"An error occurred during scraping: {str(e)}"
+                self.post('call', lambda: messagebox.showerror("Error", error_message))
             finally:
+                # Keep the scraper warm for the next run; check_idle_scraper closes it later
+                if scraper is not None:
+                    scraper.writer.on_batch = None  # Late batches must not reach the next run's results
+                self.scraper_last_used = time.monotonic()
                 self.is_scraping = False
-                self.start_button.config(state=tk.NORMAL)
-                self.stop_button.config(state=tk.DISABLED)
-                if hasattr(self, 'scraper'):
-                    self.scraper.close()
+                metrics.write_summary()
+                profile_dir = finish_profiling()
+                if profile_dir:
+                    self.log(f"Profile written to {profile_dir}")
+                # Start and Restart come back only once this thread no longer uses the scraper
+                self.scrape_thread = None
+                self.post('call', self.reset_buttons)
                     
         # Start scraping in a separate thread
-        thread = threading.Thread(target=scrape)
-        thread.daemon = True
-        thread.start()
+        self.scrape_thread = threading.Thread(target=scrape, daemon=True)
+        self.scrape_thread.start()
+        
+    def on_scraped_jobs(self, jobs):
+        """Writer callback (runs on the writer thread): queue a batch of new jobs for the results view"""
+        for job in jobs:
+            self.log(f"Found job: {job['title']} at {job['company']}")
+        self.post('jobs', jobs)
+        
+    def job_row(self, index):
+        """Return (text, values, tags) for the job at ``index`` in all_jobs_data"""
+        job = self.all_jobs_data[index]
+        values = (
+            job.get('company', ''),
+            job.get('date_posted', ''),  # Use date_posted instead of date
+            job.get('source', ''),
+            job.get('url', '')
+        )
+        tags = ('link', 'direct_job') if job.get('is_company_direct', False) else ('link',)
+        return job.get('title', ''), values, tags
+        
+    def add_jobs(self, jobs):
+        """Append and index new jobs, showing the ones matching the current filter"""
+        terms = self.filter_var.get().lower().split()
+        new_rows = []
+        for job in jobs:
+            self.all_jobs_data.append(job)
+            index = self.search_index.add(job)
+            if not terms or self.search_index.matches(index, terms):
+                new_rows.append(index)
+        self.results_view.append_rows(new_rows)
+        self.update_match_count()
         
     def update_results_tree(self, filter_text=''):
-        """Update the results tree with job data"""
-        # Clear existing items
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-            
-        # Filter and insert jobs
-        for job in self.all_jobs_data:
-            # Apply filter if any
-            if filter_text.lower() not in str(job).lower():
-                continue
-                    
-            # Insert job into tree
-            values = (
-                job.get('company', ''),
-                job.get('date_posted', ''),  # Use date_posted instead of date
-                job.get('source', ''),
-                job.get('url', '')
-            )
-            
-            item = self.results_tree.insert('', 'end', text=job.get('title', ''), values=values, tags=('link',))
-            
-            # Apply direct job tag if applicable
-            if job.get('is_company_direct', False):
-                current_tags = list(self.results_tree.item(item, 'tags'))
-                current_tags.append('direct_job')
-                self.results_tree.item(item, tags=current_tags)
+        """Rebuild the visible row list from the search index"""
+        self.results_view.set_rows(self.search_index.search(filter_text))
+        self.update_match_count()
+        
+    def update_match_count(self):
+        shown, total = len(self.results_view.rows), len(self.all_jobs_data)
+        self.match_count_var.set(f"{shown} of {total} jobs" if shown != total else f"{total} jobs")
         
     def stop_scraping(self):
+        """Ask the worker to stop after the current keyword; the buttons are reset once it has exited"""
         self.is_scraping = False
-        self.log("Stopping scraper...")
-        self.start_button.config(state=tk.NORMAL)
+        self.log("Stopping scraper after the current keyword...")
+        self.progress_var.set("Stopping...")
         self.stop_button.config(state=tk.DISABLED)
         
     def toggle_all_keywords(self, state):
@@ -398,10 +688,122 @@ class JobScraperGUI:
             var.set(state)
             
     def log(self, message):
-        """Add message to log text widget"""
+        """Queue a message for the log text widget (safe from any thread)"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        self.post('log', f"[{timestamp}] {message}\n")
+        
+    def post(self, kind, payload=None):
+        """Queue a UI update from any thread; applied by drain_ui_events on the main loop
+
+        Kinds: 'log' (line), 'status' (progress text), 'progress' (percent),
+        'jobs' (list of new jobs) and 'call' (callable run on the main thread).
+        """
+        self.ui_events.put((kind, payload))
+        
+    def drain_ui_events(self):
+        """Apply all queued UI updates as one batch, then re-arm the timer"""
+        log_lines = []
+        status = progress = None
+        new_jobs = []
+        calls = []
+        try:
+            for _ in range(config.UI_MAX_EVENTS_PER_TICK):
+                kind, payload = self.ui_events.get_nowait()
+                if kind == 'log':
+                    log_lines.append(payload)
+                elif kind == 'status':
+                    status = payload
+                elif kind == 'progress':
+                    progress = payload
+                elif kind == 'jobs':
+                    new_jobs.extend(payload)
+                elif kind == 'call':
+                    calls.append(payload)
+        except queue.Empty:
+            pass
+        
+        try:
+            if log_lines:
+                # Only the newest lines can survive the cap, so skip inserting the rest
+                self.log_text.insert(tk.END, ''.join(log_lines[-config.LOG_MAX_LINES:]))
+                line_count = int(self.log_text.index('end-1c').split('.')[0])
+                if line_count > config.LOG_MAX_LINES:
+                    self.log_text.delete('1.0', f"{line_count - config.LOG_MAX_LINES + 1}.0")
+                self.log_text.see(tk.END)
+            if status is not None:
+                self.progress_var.set(status)
+            if progress is not None:
+                self.progress_bar['value'] = progress
+            if new_jobs:
+                self.add_jobs(new_jobs)
+            for call in calls:
+                call()
+        except Exception as e:
+            logger.error(f"Error applying UI updates: {str(e)}", exc_info=True)
+        finally:
+            self.root.after(config.UI_TICK_MS, self.drain_ui_events)
+        
+    def reset_buttons(self):
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.restart_button.config(state=tk.NORMAL)
+        
+    def get_scraper(self):
+        """Return the warm scraper, starting or restarting it if needed (call off the main thread)"""
+        with self.engine_lock:
+            if self.scraper is None:
+                self.log("Starting scraper engine...")
+                self.scraper = RemoteJobScraper(store=False)  # Results are kept in the view and exported on demand
+            elif not self.scraper.is_healthy():
+                self.log("Scraper engine is not responding, restarting...")
+                self.scraper.restart()
+            self.scraper.reset_run()
+            return self.scraper
+            
+    def shutdown_scraper(self):
+        """Close the warm scraper, if any (blocks while Chrome quits)"""
+        with self.engine_lock:
+            scraper, self.scraper = self.scraper, None
+        if scraper is not None:
+            scraper.close()
+            
+    def restart_engine(self):
+        """Replace the scraper with a fresh browser and HTTP session"""
+        if self.is_scraping or self.scrape_thread is not None:
+            messagebox.showwarning("Scraping in Progress", "Stop scraping before restarting the engine.")
+            return
+        self.restart_button.config(state=tk.DISABLED)
+        self.log("Restarting scraper engine...")
+        
+        def restart():
+            try:
+                self.shutdown_scraper()
+                self.get_scraper()
+                self.log("Scraper engine ready")
+            except Exception as e:
+                logger.error(f"Error restarting scraper engine: {str(e)}", exc_info=True)
+                self.log(f"Error restarting scraper engine: {str(e)}")
+            finally:
+                self.scraper_last_used = time.monotonic()
+                self.post('call', lambda: self.restart_button.config(state=tk.NORMAL))
+                
+        threading.Thread(target=restart, daemon=True).start()
+        
+    def check_idle_scraper(self):
+        """Shut down the warm scraper after SCRAPER_IDLE_TIMEOUT seconds without a run"""
+        idle = time.monotonic() - self.scraper_last_used
+        if self.scraper is not None and self.scrape_thread is None and idle > config.SCRAPER_IDLE_TIMEOUT:
+            self.log(f"Closing scraper engine after {int(idle)}s idle")
+            threading.Thread(target=self.shutdown_scraper, daemon=True).start()
+        self.root.after(config.SCRAPER_IDLE_CHECK_MS, self.check_idle_scraper)
+        
+    def on_close(self):
+        """Stop scraping, close the warm scraper and destroy the window"""
+        self.is_scraping = False
+        self.is_exporting = False  # Cancels a running export and removes its partial file
+        self.config_watcher.stop()
+        self.shutdown_scraper()
+        self.root.destroy()
         
     def on_tree_click(self, event):
         """Handle single click on tree item"""
@@ -445,6 +847,7 @@ class JobDetailsWindow:
         self.text.configure(state='disabled')
 
 def main():
+    setup_logging()
     try:
         # Create output directory if it doesn't exist
         if not os.path.exists('output'):
@@ -452,6 +855,7 @@ def main():
         
         root = tk.Tk()
         app = JobScraperGUI(root)
+        root.protocol("WM_DELETE_WINDOW", app.on_close)
         root.mainloop()
     except Exception as e:
         # Log any main function errors
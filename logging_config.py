@@ -1,45 +1,18 @@
 import logging
-import logging.handlers
 import os
 import sys
+import queue
+import atexit
 from datetime import datetime
 
-# Create logs directory if it doesn't exist
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-
-# Configure logger
+# Configure logger; handlers are attached by setup_logging()
 logger = logging.getLogger('remote_jobs_scraper')
 logger.setLevel(logging.DEBUG)
 
-# File handler with rotation
-log_file = os.path.join('logs', 'scraper.log')
-file_handler = logging.handlers.RotatingFileHandler(
-    log_file,
-    maxBytes=10*1024*1024,  # 10MB
-    backupCount=5,
-    encoding='utf-8'
-)
-file_handler.setLevel(logging.DEBUG)
-
-# Console handler
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.INFO)
-
-# Create formatters and add them to the handlers
-file_formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(funcName)s:%(lineno)d - %(message)s'
-)
-console_formatter = logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'
-)
-
-file_handler.setFormatter(file_formatter)
-console_handler.setFormatter(console_formatter)
-
-# Add the handlers to the logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Prevent logging from propagating to the root logger
+logger.propagate = False
+
+queue_listener = None
 
 # Set up exception handling
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -54,16 +27,9 @@ def handle_exception(exc_type, exc_value, exc_traceback):
         exc_info=(exc_type, exc_value, exc_traceback)
     )
 
-# Install exception handler
-sys.excepthook = handle_exception
-
-# Log startup
-logger.info(f"Logging started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
 # Function to clean old log files
-def clean_old_logs():
+def clean_old_logs(log_dir='logs'):
     try:
-        log_dir = 'logs'
         if os.path.exists(log_dir):
             for file in os.listdir(log_dir):
                 if file.startswith('scraper.log.') and file.split('.')[-1].isdigit():
@@ -76,8 +42,88 @@ def clean_old_logs():
     except Exception as e:
         logger.error(f"Error cleaning old logs: {str(e)}")
 
-# Clean old logs on startup
-clean_old_logs()
+def setup_logging(log_dir='logs', console=True, clean_logs=True, install_excepthook=True):
+    """Attach the file and console handlers and start the background log listener
 
-# Prevent logging from propagating to the root logger
-logger.propagate = False
+    Importing this module has no side effects; entry points (the CLI and the
+    GUI) call this once at startup. Calling it again is a no-op.
+    """
+    import logging.handlers
+    
+    global queue_listener
+    if queue_listener is not None:
+        return logger
+
+    # Create logs directory if it doesn't exist
+    os.makedirs(log_dir, exist_ok=True)
+
+    # File handler with rotation
+    log_file = os.path.join(log_dir, 'scraper.log')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(funcName)s:%(lineno)d - %(message)s'
+    ))
+    handlers = [file_handler]
+
+    # Console handler
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s'
+        ))
+        handlers.append(console_handler)
+
+    # Hand records to a background thread so file and console I/O stay off the scraping threads
+    log_queue = queue.SimpleQueue()
+    queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    # Install exception handler
+    if install_excepthook:
+        sys.excepthook = handle_exception
+
+    # Log startup
+    logger.info(f"Logging started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Clean old logs on startup
+    if clean_logs:
+        clean_old_logs(log_dir)
+    return logger
+
+def log_and_print(message, level="info", error=None):
+    """Helper function to log messages with improved error handling
+
+    Console output comes from the stdout handler, so nothing is printed here.
+    Use ``logger.debug("...%s", value)`` directly for high-volume messages so
+    they are only formatted when debug logging is enabled.
+    """
+    try:
+        if level == "info":
+            logger.info(message, stacklevel=2)
+        elif level == "error":
+            error_msg = f"{message}"
+            if error:
+                error_msg += f"\nError details: {str(error)}"
+                logger.error(error_msg, exc_info=True, stacklevel=2)  # Include stack trace for errors
+            else:
+                logger.error(error_msg, stacklevel=2)
+        elif level == "warning":
+            warning_msg = f"{message}"
+            if error:
+                warning_msg += f"\nWarning details: {str(error)}"
+            logger.warning(warning_msg, stacklevel=2)
+        elif level == "debug":
+            logger.debug(message, stacklevel=2)
+    except Exception as e:
+        # Fallback if logging fails
+        print(f"Logging error: {str(e)}")
+        print(f"{level.upper()}: {message}")
@@ -1,77 +1,317 @@
 import os
+import sys
 import time
 import json
-import pandas as pd
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from config import KEYWORDS, BROWSER_HEADERS, DELAY_BETWEEN_REQUESTS, REMOTE_COMPANIES, TECH_COMPANIES, JOB_BOARDS, COMPANY_CAREER_PAGES
-from urllib.parse import urljoin
-from logging_config import logger
-from dateutil import parser
+import argparse
+from collections import Counter
+from concurrent.futures import Future
+from config import BROWSER_HEADERS, DELAY_BETWEEN_REQUESTS
+from config import HTTP_POOL_SIZE, ARCHIVE_PAGES, ARCHIVE_DIRECTORY, REPARSE_WORKERS, METRICS_PORT, DAEMON_INTERVAL
+from config import OUTPUT_DIRECTORY, BROAD_FETCH, TIMEOUT, CONNECT_TIMEOUT
+from config import ATS_CACHE_FILE, ATS_DETECT_TTL_DAYS, RENDER_MODE_CACHE_FILE, RENDER_REPROBE_DAYS
+from config import BROWSER_LEAN_PROFILE, BROWSER_PAGE_LOAD_STRATEGY, BROWSER_BLOCKED_RESOURCE_TYPES, BROWSER_BLOCKED_DOMAINS
+from config import BROWSER_USER_DATA_DIR, BROWSER_DISK_CACHE_MB, CHROMEDRIVER_PATH
+from config import APPLY_LINK_CACHE_FILE, APPLY_LINK_TTL_DAYS, APPLY_LINK_WORKERS, APPLY_LINK_BROWSER_FALLBACK
+from config import ENRICH_JOBS
+from config import RETENTION_MAX_SNAPSHOTS, RETENTION_SNAPSHOT_MAX_AGE_DAYS, RETENTION_EXPIRE_AFTER_DAYS
+from urllib.parse import urljoin, urlparse
+from logging_config import logger, log_and_print, setup_logging
+from archive import PageArchive, reparse_archive
+from ats import detect_ats, ats_endpoint
+from site_registry import SiteRegistry
+from enrich import JobEnricher
+from pipeline import JobWriter, normalize_job, job_key
+from parse_pool import ParsePool
+from changes import ChangeTracker
+from retention import apply_retention
+from sources import current_sources, ConfigWatcher
+from metrics import metrics, start_metrics_server
+from profiling import profiled, enable_profiling, finish_profiling
+from tracing import tracer, traced
+import parsers
 
-def log_and_print(message, level="info", error=None):
-    """Helper function to log and print messages with improved error handling"""
-    try:
-        if level == "info":
-            logger.info(message)
-            print(f"INFO: {message}")
-        elif level == "error":
-            error_msg = f"{message}"
-            if error:
-                error_msg += f"\nError details: {str(error)}"
-                logger.error(error_msg, exc_info=True)  # Include stack trace for errors
-            else:
-                logger.error(error_msg)
-            print(f"ERROR: {message}")
-        elif level == "warning":
-            warning_msg = f"{message}"
-            if error:
-                warning_msg += f"\nWarning details: {str(error)}"
-            logger.warning(warning_msg)
-            print(f"WARNING: {message}")
-        elif level == "debug":
-            logger.debug(message)
-            # Don't print debug messages to console to keep it clean
-    except Exception as e:
-        # Fallback if logging fails
-        print(f"Logging error: {str(e)}")
-        print(f"{level.upper()}: {message}")
+# requests, selenium, webdriver_manager and pandas are imported inside the code
+# paths that use them so exports, queries and worker processes start quickly
+
+# Reads every listing on the page in one WebDriver round trip (see extract_listings)
+EXTRACT_LISTINGS_JS = """
+const [jobSelector, fields, limit] = arguments;
+let elements = Array.from(document.querySelectorAll(jobSelector));
+const total = elements.length;
+if (limit) elements = elements.slice(0, limit);
+const records = elements.map(element => {
+    const record = {};
+    for (const [name, [selector, attribute]] of Object.entries(fields)) {
+        const node = selector ? element.querySelector(selector) : element;
+        if (!node) {
+            record[name] = null;
+        } else if (attribute === 'href') {
+            record[name] = node.href || node.getAttribute('href');
+        } else {
+            record[name] = (node.innerText || node.textContent || '').trim();
+        }
+    }
+    return record;
+});
+return [total, records];
+"""
+
+# Bytes transferred and request count for the current page (Resource Timing API)
+PAGE_STATS_JS = """
+const navigation = performance.getEntriesByType('navigation')[0] || {};
+const resources = performance.getEntriesByType('resource');
+const bytes = resources.reduce((sum, entry) => sum + (entry.transferSize || 0), navigation.transferSize || 0);
+return [bytes, resources.length + 1];
+"""
+
+# URL patterns blocked through DevTools per resource type in the lean browser profile
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.m4a', '*.mov', '*.m3u8'],
+    'stylesheet': ['*.css']
+}
 
 class RemoteJobScraper:
-    def __init__(self):
-        """Initialize the scraper"""
+    def __init__(self, enrich=ENRICH_JOBS, store=True):
+        """Initialize the scraper
+
+        Added jobs flow through an optional enrichment stage (``enrich``) to
+        the writer, which saves the new and changed ones to output/ in
+        batches unless ``store`` is False; set ``writer.on_batch`` to
+        receive them as well.
+        """
         try:
             log_and_print("Initializing RemoteJobScraper")
-            self.jobs = []
-            self.seen_jobs = set()  # Track seen jobs to prevent duplicates
-            self.driver = None
-            self.setup_selenium()
+            self.seen_jobs = set()  # job_key digests of jobs already added, to prevent duplicates
+            self.job_counts = Counter()  # Jobs added per (source, keyword), logged as a summary
+            self.current_keyword = None
+            self.sources = current_sources()  # Re-read per keyword, so config reloads apply to a warm scraper
+            self.feed_entries = {}  # feed name -> parsed listings (or a Future while parsing), fetched once per run
+            self.driver = None  # Chrome is started on first use by ensure_driver()
+            self.selenium_attempted = False
+            self.session = None
+            self.archive = PageArchive() if ARCHIVE_PAGES else None
+            self.ats_registry = SiteRegistry(ATS_CACHE_FILE, ATS_DETECT_TTL_DAYS)
+            self.render_modes = SiteRegistry(RENDER_MODE_CACHE_FILE, RENDER_REPROBE_DAYS)
+            self.application_links = SiteRegistry(APPLY_LINK_CACHE_FILE, APPLY_LINK_TTL_DAYS)
+            self.parse_pool = ParsePool()
+            self.changes = ChangeTracker() if store else None
+            self.writer = JobWriter(self.store_batch if store else None)
+            self.enricher = JobEnricher(self.fetch_job_detail, self.extract_job_details, on_done=self.writer.put) if enrich else None
+            self.setup_session()
         except Exception as e:
             log_and_print("Error initializing RemoteJobScraper", "error", e)
             raise
         
+    def setup_session(self):
+        """Create the pooled HTTP session reused for every fetch"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.session = requests.Session()
+        self.session.headers.update(BROWSER_HEADERS)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def reset_run(self):
+        """Forget jobs from the previous run so a long-lived scraper can be reused"""
+        self.seen_jobs = set()
+        self.job_counts.clear()
+        self.current_keyword = None
+        self.sources = current_sources()
+        self.feed_entries = {}
+        self.selenium_attempted = False  # Retry a failed Chrome start once per run
+        if self.changes:
+            self.changes.start_run()
+        
+    def is_healthy(self):
+        """Check that the HTTP session exists and the browser (if any) still responds"""
+        if self.session is None:
+            return False
+        if self.driver is None:
+            return True
+        try:
+            self.driver.current_url  # Round trip to chromedriver
+            return True
+        except Exception as e:
+            log_and_print(f"Chrome WebDriver is not responding: {str(e)}", "warning", e)
+            return False
+            
+    def restart(self):
+        """Tear down the browser and recreate the HTTP session; Chrome restarts on next use"""
+        log_and_print("Restarting scraper engine")
+        self.close_engine()
+        self.setup_session()
+        self.selenium_attempted = False
+        
+    def ensure_driver(self):
+        """Start Chrome the first time a page needs it; returns False if it is unavailable"""
+        if self.driver is None and not self.selenium_attempted:
+            self.selenium_attempted = True
+            self.setup_selenium()
+        return self.driver is not None
+        
     def add_job(self, job_data):
-        """Add a job to the list if it's not a duplicate"""
-        # Create a unique identifier for the job
-        job_id = f"{job_data['title'].lower()}|{job_data['company'].lower()}"
+        """Normalize a job and pass it down the pipeline unless it's a duplicate; returns True if it was added
+
+        May block while the enrichment or write stage is behind (backpressure).
+        """
+        normalize_job(job_data, self.current_keyword)
+        job_id = job_key(job_data)
+        source = job_data.get('source', '')
         
         if job_id not in self.seen_jobs:
             self.seen_jobs.add(job_id)
-            self.jobs.append(job_data)
+            metrics.inc('scraper_listings_kept_total', source=source)
+            self.job_counts[(source, job_data.get('keyword'))] += 1
+            if self.enricher:
+                self.enricher.submit(job_data)  # Handed to the writer once enriched
+            else:
+                self.writer.put(job_data)
             # Only log at debug level to avoid cluttering the output
-            logger.debug(f"Added: {job_data['title']} at {job_data['company']}")
+            logger.debug("Added job: %s at %s - URL: %s", job_data['title'], job_data['company'], job_data.get('url'))
+            return True
+        metrics.inc('scraper_dedup_hits_total', source=source)
+        return False
             
+    def log_job_summary(self):
+        """Log one line per (source, keyword) with the number of jobs added, then reset the counters"""
+        for (source, keyword), count in sorted(self.job_counts.items(), key=lambda item: (item[0][0], item[0][1] or '')):
+            log_and_print(f"Added {count} jobs from {source} for '{keyword}'")
+        self.job_counts.clear()
+            
+    def fetch_page(self, url, parser, keyword=None, archive=True):
+        """Fetch a page over HTTP and record its body in the page archive (unless ``archive`` is False)"""
+        host = urlparse(url).netloc
+        with tracer.span('fetch', cat='http', url=url, host=host) as span:
+            start = time.perf_counter()
+            try:
+                # Stream so time to headers (connect + TTFB) and body download are traced separately;
+                # the read timeout also applies to every read of the body
+                with tracer.span('connect+ttfb', cat='http'):
+                    response = self.session.get(url, stream=True, timeout=(CONNECT_TIMEOUT, TIMEOUT))
+                with tracer.span('body', cat='http'):
+                    content = response.content
+            except Exception:
+                metrics.inc('scraper_fetch_errors_total', host=host)
+                raise
+            if span is not None:
+                span.update(status=response.status_code, bytes=len(content))
+        metrics.observe('scraper_fetch_seconds', time.perf_counter() - start, host=host)
+        metrics.inc('scraper_fetch_bytes_total', len(content), host=host)
+        metrics.inc('scraper_fetch_responses_total', host=host, status=response.status_code)
+        
+        if self.archive and archive:
+            try:
+                self.archive.store(
+                    url, response.content, parser,
+                    keywords=[keyword] if keyword else None,
+                    status=response.status_code,
+                    content_type=response.headers.get('Content-Type')
+                )
+            except Exception as e:
+                log_and_print(f"Could not archive {url}: {str(e)}", "warning", e)
+        return response
+        
+    def fetch_job_detail(self, url):
+        """Fetch a job detail page for the enrichment stage (not archived)"""
+        return self.fetch_page(url, 'job_detail', archive=False)
+        
+    def flush(self):
+        """Block until every job added so far has been enriched and written"""
+        if self.enricher:
+            self.enricher.wait()
+        self.writer.flush()
+            
+    def extract_job_details(self, html, source):
+        """Parse a job detail page in the parse pool (called from enrichment threads)"""
+        return self.parse_pool.submit(parsers.extract_job_details, html, source).result()
+        
+    def submit_parse(self, parser_name, html, keyword=None):
+        """Start parsing a fetched page in the parse pool; returns a Future for its jobs"""
+        kind, _, name = parser_name.partition(':')
+        if kind == 'job_board':
+            # Workers get the board itself, so they parse with this run's (possibly reloaded) selectors
+            return self.parse_pool.submit(parsers.parse_job_board, self.sources.boards[name], html, keyword, label=parser_name)
+        return self.parse_pool.submit(parsers.parse_page, parser_name, html, [keyword] if keyword else None, label=parser_name)
+        
+    def collect_parse(self, parser_name, future):
+        """Wait for a page submitted with submit_parse and record its listing counts"""
+        with tracer.span('parse', cat='parse', parser=parser_name):
+            jobs = future.result()
+        for job in jobs:
+            metrics.inc('scraper_listings_found_total', source=job.get('source', ''))
+        return jobs
+        
+    def parse_page(self, parser_name, html, keyword=None):
+        """Run the parser for a fetched page, recording parse time and listing counts"""
+        return self.collect_parse(parser_name, self.submit_parse(parser_name, html, keyword))
+        
+    def navigate(self, url):
+        """Load a page in the Selenium browser, recording load time and bytes per site"""
+        host = urlparse(url).netloc
+        with tracer.span('navigate', cat='browser', url=url) as span:
+            start = time.perf_counter()
+            self.driver.get(url)
+            elapsed = time.perf_counter() - start
+            try:
+                page_bytes, requests_made = self.driver.execute_script(PAGE_STATS_JS)
+            except Exception:
+                page_bytes, requests_made = 0, 0  # Stats are informational only
+            if span is not None:
+                span.update(bytes=page_bytes, requests=requests_made)
+        metrics.observe('scraper_browser_load_seconds', elapsed, host=host)
+        metrics.inc('scraper_browser_bytes_total', page_bytes, host=host)
+        log_and_print(f"Loaded {host} in {elapsed:.2f}s: {page_bytes / 1024:.0f} KB over {requests_made} requests")
+            
+    def wait_for(self, selector, timeout):
+        """Wait until an element matching the CSS selector is present and return it"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        with tracer.span('wait', cat='browser', selector=selector, timeout=timeout):
+            return WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            
+    def extract_listings(self, job_selector, fields, limit=None):
+        """Read the listings on the current page with a single execute_script call
+
+        ``fields`` maps a record key to ``(css selector, 'text' or 'href')``;
+        a selector of None reads the listing element itself and a missing
+        node gives None. Returns ``(listings found, records)``, with at most
+        ``limit`` records.
+        """
+        with tracer.span('extract', cat='browser', selector=job_selector) as span:
+            total, records = self.driver.execute_script(
+                EXTRACT_LISTINGS_JS, job_selector, {name: list(field) for name, field in fields.items()}, limit
+            )
+            if span is not None:
+                span.update(listings=total)
+        return total, records
+        
+    def archive_page_source(self, parser, keywords=None):
+        """Record the current Selenium page_source in the page archive"""
+        if not self.archive or not self.driver:
+            return
+        try:
+            self.archive.store(self.driver.current_url, self.driver.page_source, parser,
+                               keywords=keywords, kind='selenium')
+        except Exception as e:
+            log_and_print(f"Could not archive page source for {parser}: {str(e)}", "warning", e)
+            
+    @profiled('setup_selenium')
+    @traced('setup_selenium')
     def setup_selenium(self):
         """Setup Selenium WebDriver with Chrome"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        
         try:
             log_and_print("Setting up Chrome WebDriver")
             chrome_options = Options()
@@ -81,18 +321,30 @@ class RemoteJobScraper:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-software-rasterizer")
+            if BROWSER_LEAN_PROFILE:
+                self.add_lean_options(chrome_options)
             
-            # Get Chrome version
-            import winreg
-            try:
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
-                version = winreg.QueryValueEx(key, "version")[0]
-                log_and_print(f"Detected Chrome version: {version}")
-                winreg.CloseKey(key)
-            except Exception as e:
-                log_and_print(f"Could not detect Chrome version from registry: {str(e)}", "warning", e)
-                version = None
+            if CHROMEDRIVER_PATH:
+                # A local driver: nothing is downloaded, so this also works offline
+                self.driver = webdriver.Chrome(service=Service(CHROMEDRIVER_PATH), options=chrome_options)
+                log_and_print(f"Chrome WebDriver initialized from {CHROMEDRIVER_PATH}")
+                if BROWSER_LEAN_PROFILE:
+                    self.block_resources()
+                return
+            
+            # Get Chrome version (from the registry on Windows, otherwise let webdriver-manager pick)
+            version = None
+            if sys.platform == 'win32':
+                import winreg
+                try:
+                    key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+                    version = winreg.QueryValueEx(key, "version")[0]
+                    log_and_print(f"Detected Chrome version: {version}")
+                    winreg.CloseKey(key)
+                except Exception as e:
+                    log_and_print(f"Could not detect Chrome version from registry: {str(e)}", "warning", e)
             
+            from webdriver_manager.chrome import ChromeDriverManager
             try:
                 if version:
                     # Try installing specific version first
@@ -106,6 +358,8 @@ class RemoteJobScraper:
                 service = Service(driver_path)
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 log_and_print("Chrome WebDriver initialized successfully!")
+                if BROWSER_LEAN_PROFILE:
+                    self.block_resources()
                 
             except Exception as e:
                 log_and_print(f"Error installing ChromeDriver: {str(e)}", "error", e)
@@ -116,6 +370,8 @@ class RemoteJobScraper:
                     service = Service(driver_path)
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                     log_and_print("Chrome WebDriver initialized successfully with latest version!")
+                    if BROWSER_LEAN_PROFILE:
+                        self.block_resources()
                 except Exception as e:
                     log_and_print(f"Failed to initialize Chrome WebDriver: {str(e)}", "error", e)
                     self.driver = None
@@ -126,18 +382,43 @@ class RemoteJobScraper:
             log_and_print("Continuing without Selenium-dependent features...")
             self.driver = None
 
+    def add_lean_options(self, chrome_options):
+        """Configure Chrome to skip images and stop waiting at DOMContentLoaded"""
+        chrome_options.page_load_strategy = BROWSER_PAGE_LOAD_STRATEGY
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        chrome_options.add_argument(f"--disk-cache-size={BROWSER_DISK_CACHE_MB * 1024 * 1024}")
+        if BROWSER_USER_DATA_DIR:
+            os.makedirs(BROWSER_USER_DATA_DIR, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(BROWSER_USER_DATA_DIR)}")
+            
+    def block_resources(self):
+        """Block unneeded resource types and tracker domains through the DevTools protocol"""
+        patterns = [pattern for resource_type in BROWSER_BLOCKED_RESOURCE_TYPES for pattern in RESOURCE_TYPE_PATTERNS[resource_type]]
+        patterns += [f"*{domain}*" for domain in BROWSER_BLOCKED_DOMAINS]
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            log_and_print(f"Blocking {len(patterns)} resource patterns in Chrome")
+        except Exception as e:
+            log_and_print(f"Could not enable resource blocking: {str(e)}", "warning", e)
+            
+    @traced('search_remote_jobs')
     def search_remote_jobs(self, keyword):
         """Search for remote jobs across different platforms"""
         try:
             log_and_print(f"Searching for remote jobs with keyword: {keyword}")
-            # Clear previous results for this keyword
-            self.jobs = []
+            # Deduplicate within this keyword only
             self.seen_jobs = set()
+            self.current_keyword = keyword
+            self.sources = current_sources()
+            
+            # Feeds download (once per run) and parse in the background while companies are searched
+            self.prefetch_feeds(['WeWorkRemotely', 'RemoteOK', 'Remotive'])
             
-            # First try company career pages if Selenium is available
-            if self.driver:
-                log_and_print(f"Searching company career pages for '{keyword}'...")
-                self.search_company_jobs(keyword)
+            # First try company career pages (ATS boards, or Selenium when available)
+            log_and_print(f"Searching company career pages for '{keyword}'...")
+            self.search_company_jobs(keyword)
             
             # Then search job boards
             log_and_print(f"Searching job boards for '{keyword}'...")
@@ -147,320 +428,244 @@ class RemoteJobScraper:
             
         except Exception as e:
             log_and_print(f"Error during job search: {str(e)}", "error", e)
+        self.log_job_summary()
             
+    @profiled('search_company_jobs')
+    @traced('search_company_jobs')
     def search_company_jobs(self, keyword):
         """Search for jobs directly from company career pages"""
-        company_job_boards = {
-            'Microsoft': {
-                'url': 'https://careers.microsoft.com/professionals/us/en/search-results',
-                'search_selector': '#search-box-input',
-                'job_selector': '.job-tile',
-                'title_selector': '.job-title',
-                'company': 'Microsoft',
-                'location_selector': '.location'
-            },
-            'Google': {
-                'url': 'https://careers.google.com/jobs/results/',
-                'search_selector': 'input[aria-label="Search jobs"]',
-                'job_selector': '.gc-card',
-                'title_selector': '.gc-card__title',
-                'company': 'Google',
-                'location_selector': '.gc-card__location'
-            },
-            'Meta': {
-                'url': 'https://www.metacareers.com/jobs',
-                'search_selector': 'input[type="text"]',
-                'job_selector': '.job-results-card',
-                'title_selector': '.job-title',
-                'company': 'Meta',
-                'location_selector': '.job-location'
-            },
-            'Apple': {
-                'url': 'https://jobs.apple.com/en-us/search',
-                'search_selector': '#search-input',
-                'job_selector': '.table-row',
-                'title_selector': '.table-col-1',
-                'company': 'Apple',
-                'location_selector': '.table-col-2'
-            }
-        }
+        from selenium.webdriver.common.keys import Keys
         
-        if self.driver is None:
-            log_and_print("Skipping company jobs as Selenium WebDriver is not available", "warning")
-            return
-            
-        for company, config in company_job_boards.items():
+        for name in self.sources.tech_companies:
+            company = self.sources.companies[name]
             try:
-                log_and_print(f"Searching {company} jobs...")
-                self.driver.get(config['url'])
-                time.sleep(DELAY_BETWEEN_REQUESTS * 2)  # Extra delay for company sites
+                log_and_print(f"Searching {name} jobs...")
+                ats_jobs = self.ats_jobs(company, [keyword], parsers.REMOTE_TERMS)
+                if ats_jobs is not None:
+                    log_and_print(f"Found {len(ats_jobs)} remote {name} jobs on its ATS board")
+                    continue
+                if not self.ensure_driver():
+                    log_and_print(f"Skipping {name}: page needs a browser and Selenium WebDriver is not available", "warning")
+                    continue
+                    
+                self.navigate(company.url)
+                tracer.sleep(company.delay * 2)  # Extra delay for company sites
                 
                 # Search for keyword
                 try:
-                    search_box = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, config['search_selector']))
-                    )
+                    search_box = self.wait_for(company.search_selector, 10)
                     search_box.clear()
                     search_box.send_keys('remote ' + keyword)  # Add 'remote' to search
                     search_box.send_keys(Keys.RETURN)
-                    time.sleep(DELAY_BETWEEN_REQUESTS * 2)
+                    tracer.sleep(company.delay * 2)
                 except Exception as e:
-                    log_and_print(f"Could not search on {company}: {str(e)}", "error", e)
+                    log_and_print(f"Could not search on {name}: {str(e)}", "error", e)
                     continue
                 
                 # Wait for job listings
                 try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, config['job_selector']))
-                    )
+                    self.wait_for(company.job.css, 10)
                 except Exception as e:
-                    log_and_print(f"No jobs found for {company}: {str(e)}", "error", e)
+                    log_and_print(f"No jobs found for {name}: {str(e)}", "error", e)
                     continue
                 
-                # Extract jobs
-                jobs = self.driver.find_elements(By.CSS_SELECTOR, config['job_selector'])
-                log_and_print(f"Found {len(jobs)} potential jobs at {company}")
+                self.archive_page_source(f"company_search:{name}", [keyword])
                 
-                for job in jobs[:10]:  # Limit to first 10 jobs per company
-                    try:
-                        title = job.find_element(By.CSS_SELECTOR, config['title_selector']).text.strip()
-                        location = job.find_element(By.CSS_SELECTOR, config['location_selector']).text.strip()
-                        
-                        # Check if job is remote
-                        if any(term in location.lower() for term in ['remote', 'anywhere', 'global', 'worldwide']):
-                            job_url = job.find_element(By.CSS_SELECTOR, 'a').get_attribute('href')
-                            
-                            job_data = {
-                                'title': title,
-                                'company': config['company'],
-                                'location': location,
-                                'source': f"{company} Careers",
-                                'url': job_url,
-                                'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                                'is_company_direct': True  # Mark as direct company posting
-                            }
-                            
-                            self.add_job(job_data)
-                            log_and_print(f"Added job: {title} at {company}")
-                            
-                    except Exception as e:
-                        log_and_print(f"Error extracting job from {company}: {str(e)}", "error", e)
+                # Extract jobs (first 10 per company) in one round trip
+                total, records = self.extract_listings(company.job.css, {
+                    'title': (company.title.css, 'text'),
+                    'location': (company.location.css, 'text'),
+                    'url': ('a', 'href')
+                }, limit=10)
+                log_and_print(f"Found {total} potential jobs at {name}")
+                metrics.inc('scraper_listings_found_total', total, source=f"{name} Careers")
+                
+                for record in records:
+                    title, location = record['title'], record['location']
+                    if not title or location is None or not record['url']:
                         continue
+                    
+                    # Check if job is remote
+                    if any(term in location.lower() for term in ['remote', 'anywhere', 'global', 'worldwide']):
+                        job_data = {
+                            'title': title,
+                            'company': company.name,
+                            'location': location,
+                            'source': f"{name} Careers",
+                            'url': record['url'],
+                            'date_posted': datetime.now().strftime('%Y-%m-%d'),
+                            'is_company_direct': True  # Mark as direct company posting
+                        }
+                        
+                        self.add_job(job_data)
                         
             except Exception as e:
-                log_and_print(f"Error searching {company} jobs: {str(e)}", "error", e)
+                log_and_print(f"Error searching {name} jobs: {str(e)}", "error", e)
                 continue
                 
+    @traced('scrape_jobs')
     def scrape_jobs(self, keywords):
-        """Main method to scrape jobs from all sources"""
+        """Main method to scrape jobs from all sources; returns the number of jobs added
+
+        Jobs are streamed to the writer as they are found (see ``flush``).
+        """
         log_and_print(f"Starting job scraping for keywords: {keywords}")
-        all_jobs = []
+        self.current_keyword = keywords[0] if len(keywords) == 1 else None
+        self.sources = current_sources()  # Pick up a reloaded config; held for the whole call
+        added = 0
+        
+        # Download every feed up front; each parses in the parse pool while the next downloads
+        if BROAD_FETCH:
+            self.prefetch_feeds([board.feed for board in self.sources.boards.values() if board.enabled and board.feed])
         
         # Scrape job boards first
-        for board_name, board_config in JOB_BOARDS.items():
-            if board_config['enabled']:
+        for board in self.sources.boards.values():
+            if board.enabled:
                 try:
-                    log_and_print(f"Scraping {board_name}...")
-                    for keyword in keywords:
-                        jobs = self.scrape_job_board(board_name, board_config, keyword)
-                        all_jobs.extend(jobs)
-                        time.sleep(DELAY_BETWEEN_REQUESTS)
+                    log_and_print(f"Scraping {board.name}...")
+                    if BROAD_FETCH and board.feed:
+                        # One request per board per run, tagged against all keywords locally
+                        added += len(self.search_feed(board.feed, keywords))
+                    else:
+                        # Fetch every keyword's page first; earlier pages parse while later ones download
+                        pages = []
+                        for keyword in keywords:
+                            try:
+                                pages.append((keyword, self.fetch_job_board(board, keyword)))
+                            except Exception as e:
+                                log_and_print(f"Error scraping {board.name}: {str(e)}", "error", e)
+                            tracer.sleep(board.delay)
+                        for keyword, future in pages:
+                            added += len(self.scrape_job_board(board, keyword, future))
                 except Exception as e:
-                    log_and_print(f"Error scraping {board_name}: {str(e)}", "error", e)
+                    log_and_print(f"Error scraping {board.name}: {str(e)}", "error", e)
         
-        # Then scrape company career pages if Selenium is available
-        if self.driver:
-            # Scrape remote-first companies
-            for company, config in REMOTE_COMPANIES.items():
-                try:
-                    log_and_print(f"Scraping {company}...")
-                    jobs = self.scrape_company_jobs(company, config, keywords)
-                    all_jobs.extend(jobs)
-                except Exception as e:
-                    log_and_print(f"Error scraping {company}: {str(e)}", "error", e)
-            
-            # Scrape tech companies
-            for company, config in TECH_COMPANIES.items():
-                try:
-                    log_and_print(f"Scraping {company}...")
-                    jobs = self.scrape_company_jobs(company, config, keywords)
-                    all_jobs.extend(jobs)
-                except Exception as e:
-                    log_and_print(f"Error scraping {company}: {str(e)}", "error", e)
-            
-            # Scrape company career pages
+        # Then scrape company career pages: ATS boards over HTTP, the rest with Selenium if available
+        # Scrape remote-first companies
+        for name in self.sources.remote_companies:
             try:
-                log_and_print("Scraping company career pages...")
-                jobs = self.scrape_company_career_pages(keywords)
-                all_jobs.extend(jobs)
+                log_and_print(f"Scraping {name}...")
+                added += len(self.scrape_company_jobs(self.sources.companies[name], keywords))
             except Exception as e:
-                log_and_print(f"Error scraping company career pages: {str(e)}", "error", e)
-        else:
-            log_and_print("Skipping company career pages - Selenium not available", "warning")
+                log_and_print(f"Error scraping {name}: {str(e)}", "error", e)
         
-        log_and_print(f"Completed scraping. Found {len(all_jobs)} total jobs")
-        return all_jobs
+        # Scrape tech companies
+        for name in self.sources.tech_companies:
+            try:
+                log_and_print(f"Scraping {name}...")
+                added += len(self.scrape_company_jobs(self.sources.companies[name], keywords))
+            except Exception as e:
+                log_and_print(f"Error scraping {name}: {str(e)}", "error", e)
+        
+        # Scrape company career pages
+        try:
+            log_and_print("Scraping company career pages...")
+            added += len(self.scrape_company_career_pages(keywords))
+        except Exception as e:
+            log_and_print(f"Error scraping company career pages: {str(e)}", "error", e)
+        
+        self.log_job_summary()
+        log_and_print(f"Completed scraping. Found {added} total jobs")
+        return added
     
-    def scrape_job_board(self, board_name, board_config, keyword):
-        """Scrape a specific job board for a keyword"""
+    @profiled('scrape_job_board')
+    @traced('scrape_job_board')
+    def scrape_job_board(self, board, keyword, future=None):
+        """Scrape a job board (a sources.BoardSource) for a keyword; returns the jobs it added
+
+        Pass the Future from fetch_job_board to collect a page that was
+        fetched earlier and is already being parsed.
+        """
+        added = []
         try:
-            # Construct URL
-            url = board_config['base_url'] + keyword
-            log_and_print(f"Accessing URL: {url}")
+            if future is None:
+                future = self.fetch_job_board(board, keyword)
+            jobs = self.collect_parse(f"job_board:{board.name}", future)
             
-            # Get page content
-            response = requests.get(url, headers=BROWSER_HEADERS)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            added = [job_data for job_data in jobs if self.add_job(job_data)]
             
-            # Find all job listings
-            jobs = soup.select(board_config['job_selector'])
-            log_and_print(f"Found {len(jobs)} job listings on {board_name}")
-            
-            # Process each job
-            for job in jobs:
-                try:
-                    # Extract job details
-                    title = job.select_one(board_config['title_selector']).text.strip()
-                    company = job.select_one(board_config['company_selector']).text.strip()
-                    
-                    # Get the direct job posting URL
-                    job_url = self.get_job_url(job, board_name)
-                    if not job_url:  # Skip if no valid URL found
-                        continue
-                    
-                    try:
-                        location = job.select_one(board_config['location_selector']).text.strip()
-                    except (AttributeError, KeyError):
-                        location = "Remote"
-                    
-                    try:
-                        date_element = job.select_one(board_config['date_selector'])
-                        if date_element:
-                            if date_element.has_attr('datetime'):
-                                date_posted = date_element['datetime']
-                            else:
-                                date_posted = date_element.text.strip()
-                        else:
-                            date_posted = datetime.now().strftime('%Y-%m-%d')
-                    except (AttributeError, KeyError):
-                        date_posted = datetime.now().strftime('%Y-%m-%d')
-                    
-                    # Create job dictionary
-                    job_data = {
-                        'title': title,
-                        'company': company,
-                        'location': location,
-                        'date_posted': date_posted,
-                        'url': job_url,
-                        'source': board_name,
-                        'keyword': keyword
-                    }
-                    
-                    self.add_job(job_data)
-                    log_and_print(f"Added job: {title} at {company} - URL: {job_url}")
-                    
-                except Exception as e:
-                    log_and_print(f"Error parsing job from {board_name}: {str(e)}", "error", e)
-                    continue
-            
-            log_and_print(f"Successfully scraped {len(jobs)} jobs from {board_name} for keyword '{keyword}'")
+            log_and_print(f"Successfully scraped {len(jobs)} jobs from {board.name} for keyword '{keyword}'")
             
         except Exception as e:
-            log_and_print(f"Error scraping {board_name}: {str(e)}", "error", e)
+            log_and_print(f"Error scraping {board.name}: {str(e)}", "error", e)
         
-        return self.jobs
+        return added
+    
+    def fetch_job_board(self, board, keyword):
+        """Fetch a job board's search page for a keyword and start parsing it; returns a Future for its jobs"""
+        url = board.url_for(keyword)
+        log_and_print(f"Accessing URL: {url}")
+        response = self.fetch_page(url, f"job_board:{board.name}", keyword)
+        return self.submit_parse(f"job_board:{board.name}", response.content, keyword)
     
     def get_job_url(self, job_element, board_name):
         """Get the actual job posting URL"""
-        try:
-            if board_name == 'WeWorkRemotely':
-                # Find the link that specifically points to a job listing
-                # Job URLs contain '/remote-jobs/' in their path
-                link = job_element.find('a', href=lambda x: x and '/remote-jobs/' in x)
-                if link and link['href']:
-                    return f"https://weworkremotely.com{link['href']}"
-            
-            elif board_name == 'RemoteOK':
-                # RemoteOK job URLs are in the data-url attribute and start with /remote-jobs/
-                url = job_element.get('data-url', '')
-                if url and url.startswith('/remote-jobs/'):
-                    return f"https://remoteok.com{url}"
-            
-            elif board_name == 'Remotive':
-                # Remotive job URLs contain /remote-jobs/ in their path
-                link = job_element.find('a', href=lambda x: x and '/remote-jobs/' in x)
-                if link and link['href']:
-                    return f"https://remotive.com{link['href']}"
-            
-            # If all else fails, look for any link containing job-specific patterns
-            any_link = job_element.find('a', href=lambda x: x and (
-                '/remote-jobs/' in x or 
-                '/job/' in x or 
-                '/position/' in x
-            ))
-            if any_link and any_link['href']:
-                href = any_link['href']
-                if href.startswith('http'):
-                    return href
-                elif board_name == 'WeWorkRemotely':
-                    return f"https://weworkremotely.com{href}"
-                elif board_name == 'RemoteOK':
-                    return f"https://remoteok.com{href}"
-                elif board_name == 'Remotive':
-                    return f"https://remotive.com{href}"
-            
-            log_and_print("Could not find job posting URL in element", "warning")
-            return None
-            
-        except Exception as e:
-            log_and_print(f"Error getting job URL: {str(e)}", "error")
-            return None
+        return parsers.get_job_url(job_element, board_name)
     
-    def scrape_company_jobs(self, company_name, company_config, keywords):
-        """Scrape jobs from a company's career page"""
+    @profiled('scrape_company_jobs')
+    @traced('scrape_company_jobs')
+    def scrape_company_jobs(self, company, keywords):
+        """Scrape jobs from a company's (a sources.CompanySource) career page"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        
+        company_name = company.name
+        ats_jobs = self.ats_jobs(company, keywords, ['remote'])
+        if ats_jobs is not None:
+            log_and_print(f"Found {len(ats_jobs)} jobs from {company_name} on its ATS board")
+            return ats_jobs
+        static_jobs = self.static_jobs(company, f"company_jobs:{company_name}", keywords, ['remote'])
+        if static_jobs is not None:
+            log_and_print(f"Found {len(static_jobs)} jobs from {company_name} without a browser")
+            return static_jobs
+        
         jobs = []
-        if not self.driver:
+        if not self.ensure_driver():
+            log_and_print(f"Skipping {company_name}: page needs a browser and Selenium WebDriver is not available", "warning")
             return jobs
         
         try:
-            self.driver.get(company_config['url'])
-            time.sleep(2)  # Wait for page to load
+            self.navigate(company.url)
+            tracer.sleep(2)  # Wait for page to load
             
             # Try to find and use search if available
             try:
-                search = self.driver.find_element(By.CSS_SELECTOR, company_config['search_selector'])
+                search = self.driver.find_element(By.CSS_SELECTOR, company.search_selector)
                 for keyword in keywords:
                     search.clear()
                     search.send_keys(keyword)
                     search.send_keys(Keys.RETURN)
-                    time.sleep(2)  # Wait for results
+                    tracer.sleep(2)  # Wait for results
                     
-                    # Find all job listings
-                    job_elements = self.driver.find_elements(By.CSS_SELECTOR, company_config['job_selector'])
+                    self.archive_page_source(f"company_jobs:{company_name}", [keyword])
                     
-                    for job_element in job_elements:
-                        try:
-                            title = job_element.find_element(By.CSS_SELECTOR, company_config['title_selector']).text
-                            location = job_element.find_element(By.CSS_SELECTOR, company_config['location_selector']).text
-                            
-                            # Create unique job identifier
-                            job_id = f"{company_name}:{title}:{location}"
-                            
-                            if job_id not in self.seen_jobs and 'remote' in location.lower():
-                                self.seen_jobs.add(job_id)
-                                job = {
-                                    'title': title,
-                                    'company': company_name,
-                                    'location': location,
-                                    'date': datetime.now().strftime('%Y-%m-%d'),
-                                    'url': job_element.get_attribute('href') or company_config['url'],
-                                    'is_company_direct': True
-                                }
-                                jobs.append(job)
-                        except Exception as e:
-                            log_and_print(f"Error extracting job details from {company_name}: {str(e)}", "error", e)
+                    # Read all job listings in one round trip
+                    _, records = self.extract_listings(company.job.css, {
+                        'title': (company.title.css, 'text'),
+                        'location': (company.location.css, 'text'),
+                        'url': (None, 'href')
+                    })
+                    
+                    for record in records:
+                        title, location = record['title'], record['location']
+                        if title is None or location is None:
                             continue
                         
+                        metrics.inc('scraper_listings_found_total', source=f"{company_name} Careers")
+                        if 'remote' in location.lower():
+                            job = {
+                                'title': title,
+                                'company': company_name,
+                                'location': location,
+                                'source': f"{company_name} Careers",
+                                'date_posted': datetime.now().strftime('%Y-%m-%d'),
+                                'url': record['url'] or company.url,
+                                'keyword': keyword,
+                                'is_company_direct': True
+                            }
+                            if self.add_job(job):
+                                jobs.append(job)
+                        
             except Exception as e:
                 log_and_print(f"Error searching jobs at {company_name}: {str(e)}", "error", e)
         
@@ -470,65 +675,67 @@ class RemoteJobScraper:
         log_and_print(f"Found {len(jobs)} jobs from {company_name}")
         return jobs
     
+    @profiled('scrape_company_career_pages')
+    @traced('scrape_company_career_pages')
     def scrape_company_career_pages(self, keywords):
         """Scrape jobs from company career pages"""
-        if not self.driver:
-            retry_count = 0
-            max_retries = 3
-            
-            while retry_count < max_retries:
-                try:
-                    log_and_print(f"Attempt {retry_count + 1} to initialize Selenium for company career pages")
-                    self.setup_selenium()
-                    if self.driver:
-                        break
-                except Exception as e:
-                    log_and_print(f"Retry {retry_count + 1} failed: {str(e)}", "error", e)
-                    retry_count += 1
-                    time.sleep(2)  # Wait before retrying
-            
-            if not self.driver:
-                log_and_print("All attempts to initialize Selenium failed. Skipping company career pages.", "warning")
-                return []
-
         log_and_print("Scraping company career pages...")
         all_jobs = []
         
-        for company in COMPANY_CAREER_PAGES:
+        for name in self.sources.career_pages:
+            company = self.sources.companies[name]
             try:
-                log_and_print(f"Scraping {company['name']} career page")
-                url = company['url']
-                self.driver.get(url)
-                time.sleep(3)  # Wait for JavaScript to load
+                log_and_print(f"Scraping {name} career page")
+                ats_jobs = self.ats_jobs(company, keywords)
+                if ats_jobs is not None:
+                    log_and_print(f"Found {len(ats_jobs)} jobs from {name} on its ATS board")
+                    all_jobs.extend(ats_jobs)
+                    continue
+                static_jobs = self.static_jobs(company, f"career_page:{name}", keywords)
+                if static_jobs is not None:
+                    log_and_print(f"Found {len(static_jobs)} jobs from {name} without a browser")
+                    all_jobs.extend(static_jobs)
+                    continue
+                if not self.ensure_driver():
+                    log_and_print(f"Skipping {name}: page needs a browser and Selenium WebDriver is not available", "warning")
+                    continue
+                    
+                self.navigate(company.url)
+                tracer.sleep(3)  # Wait for JavaScript to load
+                self.archive_page_source(f"career_page:{name}", keywords)
                 
-                # Use company-specific selectors
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, company.get('job_selector', '.job-listing'))
+                # Use company-specific selectors, read in one round trip
+                total, records = self.extract_listings(company.job.css, {
+                    'title': (company.title.css, 'text'),
+                    'url': (company.link.css, 'href'),
+                    'location': (company.location.css, 'text')
+                })
                 
-                for job in job_elements:
-                    try:
-                        title = job.find_element(By.CSS_SELECTOR, company.get('title_selector', '.job-title')).text
-                        
-                        # Check if job matches any keyword
-                        if any(keyword.lower() in title.lower() for keyword in keywords):
-                            job_data = {
-                                'title': title,
-                                'company': company['name'],
-                                'url': job.find_element(By.CSS_SELECTOR, company.get('link_selector', 'a')).get_attribute('href'),
-                                'location': job.find_element(By.CSS_SELECTOR, company.get('location_selector', '.location')).text,
-                                'source': f"{company['name']} Careers",
-                                'is_company_direct': True
-                            }
-                            all_jobs.append(job_data)
-                            log_and_print(f"Added job: {title} at {company['name']}")
-                    
-                    except Exception as e:
-                        log_and_print(f"Error parsing job from {company['name']}: {str(e)}", "error", e)
+                metrics.inc('scraper_listings_found_total', total, source=f"{name} Careers")
+                for record in records:
+                    title = record['title']
+                    if not title or not record['url'] or record['location'] is None:
                         continue
+                    
+                    # Check if job matches any keyword
+                    keyword = next((keyword for keyword in keywords if keyword.lower() in title.lower()), None)
+                    if keyword:
+                        job_data = {
+                            'title': title,
+                            'company': name,
+                            'url': record['url'],
+                            'location': record['location'],
+                            'source': f"{name} Careers",
+                            'keyword': keyword,
+                            'is_company_direct': True
+                        }
+                        if self.add_job(job_data):
+                            all_jobs.append(job_data)
                 
-                time.sleep(DELAY_BETWEEN_REQUESTS)
+                tracer.sleep(company.delay)
             
             except Exception as e:
-                log_and_print(f"Error scraping {company['name']} career page: {str(e)}", "error", e)
+                log_and_print(f"Error scraping {name} career page: {str(e)}", "error", e)
                 continue
         
         return all_jobs
@@ -555,271 +762,522 @@ class RemoteJobScraper:
     
     def parse_weworkremotely_job(self, job_element):
         """Parse a job listing from We Work Remotely"""
-        try:
-            if not job_element:
-                logger.warning("Empty job element received")
-                return None
+        return parsers.parse_weworkremotely_job(job_element)
+    
+    def fetch_feed(self, feed_name):
+        """Download a feed and start parsing it in the parse pool; returns a Future for its listings"""
+        parser_name = f"feed:{feed_name}"
+        log_and_print(f"Fetching {feed_name} feed")
+        response = self.fetch_page(self.sources.feeds[feed_name], parser_name)
+        response.raise_for_status()
+        future = self.parse_pool.submit(parsers.parse_feed, feed_name, response.content, label=parser_name)
+        tracer.sleep(DELAY_BETWEEN_REQUESTS)
+        return future
+        
+    def prefetch_feeds(self, feed_names):
+        """Download the feeds not fetched yet in this run, leaving them to parse in the background"""
+        for feed_name in feed_names:
+            if feed_name not in self.feed_entries:
+                try:
+                    self.feed_entries[feed_name] = self.fetch_feed(feed_name)
+                except Exception as e:
+                    self.feed_entries[feed_name] = []  # A failed fetch is not retried for every keyword
+                    log_and_print(f"Error fetching {feed_name} feed: {str(e)}", "error", e)
+                    
+    def get_feed_entries(self, feed_name):
+        """Return the parsed listings of a feed, downloading it on first use in a run"""
+        entries = self.feed_entries.get(feed_name)
+        if entries is None:
+            self.feed_entries[feed_name] = []  # A failed fetch is not retried for every keyword
+            entries = self.feed_entries[feed_name] = self.fetch_feed(feed_name)
+        if isinstance(entries, Future):
+            self.feed_entries[feed_name] = []
+            with tracer.span('parse', cat='parse', parser=f"feed:{feed_name}"):
+                entries = self.feed_entries[feed_name] = entries.result()
+            for job, _ in entries:
+                metrics.inc('scraper_listings_found_total', source=job['source'])
+            log_and_print(f"Found {len(entries)} listings in the {feed_name} feed")
+        return entries
+        
+    @profiled('search_feed')
+    @traced('search_feed')
+    def search_feed(self, feed_name, keywords):
+        """Add the jobs from a listing feed that match any of the keywords; returns the jobs added
 
-            # Extract job details with None checks
-            title_element = job_element.find('span', class_='title')
-            title = title_element.text.strip() if title_element and hasattr(title_element, 'text') else "Unknown Title"
-            
-            company_element = job_element.find('span', class_='company')
-            company = company_element.text.strip() if company_element and hasattr(company_element, 'text') else "Unknown Company"
-            
-            link_element = job_element.find('a', href=True)
-            link = f"https://weworkremotely.com{link_element['href']}" if link_element and 'href' in link_element.attrs else None
-            
-            region_element = job_element.find('span', class_='region')
-            region = region_element.text.strip() if region_element and hasattr(region_element, 'text') else "Remote"
-            
-            # Create job object only if we have minimum required info
-            if title != "Unknown Title" or company != "Unknown Company":
-                job = {
-                    'title': title,
-                    'company': company,
-                    'location': region,
-                    'url': link,
-                    'source': 'We Work Remotely'
-                }
-                return job
-            else:
-                logger.warning("Skipping job due to missing required information")
-                return None
-                
+        The feed is downloaded once per run however many keywords or calls
+        there are; tagging is done locally with one combined regex.
+        """
+        entries = self.get_feed_entries(feed_name)
+        return [job_data for job_data in parsers.tag_feed_jobs(entries, keywords) if self.add_job(job_data)]
+            
+    def detect_company_ats(self, company_name, url):
+        """Probe a careers page over plain HTTP for a known ATS and remember the result"""
+        try:
+            with tracer.span('detect_ats', cat='http', url=url):
+                response = self.session.get(url, timeout=TIMEOUT)
+            ats = detect_ats(response.text)
         except Exception as e:
-            logger.error(f"Error parsing job from weworkremotely: {str(e)}")
+            log_and_print(f"Could not check {company_name} careers page for an ATS: {str(e)}", "warning", e)
             return None
-    
+        self.ats_registry.record(company_name, ats)
+        if ats:
+            log_and_print(f"{company_name} careers page uses {ats}")
+        return ats
+        
+    def get_ats_entries(self, company):
+        """Return a company's listings from its ATS JSON board, or None if it has no usable ATS
+
+        Uses the company's 'ats' setting, else the cached detection result,
+        else probes the careers page. The board is fetched once per run.
+        """
+        company_name = company.name
+        ats = company.ats
+        if not ats:
+            known, ats = self.ats_registry.lookup(company_name)
+            if not known:
+                ats = self.detect_company_ats(company_name, company.url)
+        if not ats:
+            return None
+            
+        ats_kind = ats.partition(':')[0]
+        parser_name = f"ats:{ats_kind}:{company_name}"
+        entries = self.feed_entries.get(parser_name)
+        if entries is None:
+            try:
+                response = self.fetch_page(ats_endpoint(ats), parser_name)
+                response.raise_for_status()
+                with tracer.span('parse', cat='parse', parser=parser_name):
+                    entries = self.parse_pool.submit(parsers.parse_ats, ats_kind, response.content, company_name, label=parser_name).result()
+                for job, _ in entries:
+                    metrics.inc('scraper_listings_found_total', source=job['source'])
+            except Exception as e:
+                log_and_print(f"Could not read the {ats_kind} board for {company_name}, using the careers page: {str(e)}", "warning", e)
+                entries = False  # Fall back to Selenium for the rest of the run
+            self.feed_entries[parser_name] = entries
+        return entries if entries is not False else None
+        
+    def ats_jobs(self, company, keywords, remote_terms=None):
+        """Add a company's ATS listings matching the keywords; returns the jobs added, or None without an ATS"""
+        entries = self.get_ats_entries(company)
+        if entries is None:
+            return None
+        return self.add_entries(entries, keywords, remote_terms)
+        
+    def get_static_entries(self, company, parser_name):
+        """Return the listings of a server-rendered careers page, or None if it needs a browser
+
+        The page is fetched over plain HTTP and used when its job_selector
+        matches. The static/browser decision is remembered per page in the
+        render-mode registry and probed again once it expires.
+        """
+        company_name = company.name
+        entries = self.feed_entries.get(parser_name)
+        if entries is None:
+            entries = False
+            known, mode = self.render_modes.lookup(parser_name)
+            if not (known and mode == 'browser'):
+                try:
+                    response = self.fetch_page(company.url, parser_name)
+                    response.raise_for_status()
+                    with tracer.span('parse', cat='parse', parser=parser_name), metrics.timer('scraper_parse_seconds', parser=parser_name):
+                        soup = parsers.make_soup(response.content)
+                        static = company.job.select_one(soup) is not None
+                        jobs = parsers.parse_company_listing(company, soup, remote_terms=None) if static else []
+                    self.render_modes.record(parser_name, 'static' if static else 'browser')
+                    if static:
+                        entries = [(job, job['title']) for job in jobs]
+                        metrics.inc('scraper_listings_found_total', len(jobs), source=f"{company_name} Careers")
+                    else:
+                        log_and_print(f"{company_name} listings are rendered by JavaScript, using the browser")
+                except Exception as e:
+                    log_and_print(f"Could not fetch {company_name} careers page over HTTP: {str(e)}", "warning", e)
+            self.feed_entries[parser_name] = entries
+        return entries if entries is not False else None
+        
+    def static_jobs(self, company, parser_name, keywords, remote_terms=None):
+        """Add the matching jobs from a server-rendered careers page; returns the jobs added, or None if it needs a browser"""
+        entries = self.get_static_entries(company, parser_name)
+        if entries is None:
+            return None
+        return self.add_entries(entries, keywords, remote_terms)
+        
+    def add_entries(self, entries, keywords, remote_terms=None):
+        """Tag ``(job, search_text)`` entries with the keywords and add them; returns the jobs added"""
+        if remote_terms:
+            entries = parsers.filter_remote(entries, remote_terms)
+        return [job_data for job_data in parsers.tag_feed_jobs(entries, keywords) if self.add_job(job_data)]
+        
     def search_we_work_remotely(self, keyword):
-        """Search We Work Remotely for jobs"""
+        """Search We Work Remotely for jobs (RSS feed)"""
         try:
-            log_and_print(f"Searching We Work Remotely for keyword: {keyword}")
-            url = f"https://weworkremotely.com/remote-jobs/search?term={keyword}"
-            response = requests.get(url, headers=BROWSER_HEADERS)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for job in soup.select('li.feature'):
-                job_data = self.parse_weworkremotely_job(job)
-                if job_data:
-                    self.add_job(job_data)
-            
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+            self.search_feed('WeWorkRemotely', [keyword])
         except Exception as e:
             log_and_print(f"Error scraping We Work Remotely: {str(e)}", "error", e)
             
     def search_remote_ok(self, keyword):
-        """Search RemoteOK for jobs"""
+        """Search RemoteOK for jobs (JSON API)"""
         try:
-            log_and_print(f"Searching RemoteOK for keyword: {keyword}")
-            url = f"https://remoteok.com/remote-{keyword}-jobs"
-            response = requests.get(url, headers=BROWSER_HEADERS)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for job in soup.select('tr.job'):
-                title = job.select_one('.company h2')
-                company = job.select_one('.company h3')
-                date = job.select_one('.time')
-                
-                if title and company:
-                    job_data = {
-                        'title': title.text.strip(),
-                        'company': company.text.strip(),
-                        'date_posted': date.text.strip() if date else '',
-                        'source': 'RemoteOK',
-                        'url': self.extract_job_url(job, 'https://remoteok.com'),
-                        'is_company_direct': False
-                    }
-                    self.add_job(job_data)
-            
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+            self.search_feed('RemoteOK', [keyword])
         except Exception as e:
             log_and_print(f"Error scraping RemoteOK: {str(e)}", "error", e)
             
     def search_remotive_jobs(self, keyword):
-        """Search Remotive for jobs"""
+        """Search Remotive for jobs (JSON API)"""
         try:
-            log_and_print(f"Searching Remotive for keyword: {keyword}")
-            url = f"https://remotive.com/remote-jobs/search?term={keyword}"
-            response = requests.get(url, headers=BROWSER_HEADERS)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for job in soup.select('.job-list-item'):
-                title = job.select_one('.position')
-                company = job.select_one('.company')
-                date = job.select_one('.job-date')
-                
-                if title and company:
-                    job_data = {
-                        'title': title.text.strip(),
-                        'company': company.text.strip(),
-                        'date_posted': date.text.strip() if date else '',
-                        'source': 'Remotive',
-                        'url': f"https://remotive.com{job.select_one('a')['href']}" if job.select_one('a') else '',
-                        'is_company_direct': False
-                    }
-                    self.add_job(job_data)
-            
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+            self.search_feed('Remotive', [keyword])
         except Exception as e:
             log_and_print(f"Error scraping Remotive: {str(e)}", "error", e)
             
+    def store_batch(self, keyword, jobs):
+        """Write stage (writer thread): classify a batch; new and changed jobs are appended to the run's delta file"""
+        self.changes.classify(keyword, jobs)
+            
+    @profiled('save_results')
     def save_results(self, keyword):
-        """Save scraped jobs to CSV and JSON files, organized by keyword and append to existing files"""
-        log_and_print(f"Saving results for keyword: {keyword}")
-        if not os.path.exists('output'):
-            os.makedirs('output')
-        
-        # Create a directory for this keyword if it doesn't exist
-        keyword_dir = os.path.join('output', keyword)
-        if not os.path.exists(keyword_dir):
-            os.makedirs(keyword_dir)
-        
-        # Filter jobs for this keyword
-        keyword_jobs = [job for job in self.jobs if 'keyword' in job and job['keyword'] == keyword]
-        
-        if keyword_jobs:
-            # Add update timestamp to each job
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            for job in keyword_jobs:
-                job['last_updated'] = timestamp
+        """Wait until the jobs found for a keyword are written, then merge them into its result files"""
+        self.flush()
+        if self.changes:
+            self.finish_keyword(keyword)
+            
+    def finish_keyword(self, keyword):
+        """Merge a keyword's new and changed jobs of this run into its result files once, then close its change record"""
+        jobs = self.changes.run_jobs(keyword)
+        if jobs:
+            save_keyword_results(keyword, jobs, log_update=False)
+        counts = self.changes.finish(keyword)
+        log_and_print(f"Changes for '{keyword}': {counts['new']} new, {counts['changed']} changed, "
+                      f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+            
+    def close(self):
+        """Finish the enrichment and write stages, then close the browser and HTTP session"""
+        if self.enricher is not None:
+            self.enricher.close()
+            self.enricher = None
+        self.writer.close()
+        if self.changes:
+            for keyword in self.changes.open_keywords():
+                self.finish_keyword(keyword)
+        self.parse_pool.close()
+        self.close_engine()
+        
+    def close_engine(self):
+        """Close the Selenium WebDriver and the HTTP session"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        if self.driver is not None:
+            try:
+                log_and_print("Closing Chrome WebDriver...")
+                self.driver.quit()
+                log_and_print("Chrome WebDriver closed successfully!")
+            except Exception as e:
+                log_and_print(f"Error closing Chrome WebDriver: {str(e)}", "error", e)
+            self.driver = None
+
+    def find_application_link_http(self, job_url):
+        """Look for the application link in a job page's HTML
+
+        Returns '' if the page has none and None if it could not be fetched.
+        """
+        try:
+            response = self.fetch_page(job_url, 'apply_page', archive=False)
+            response.raise_for_status()
+            return parsers.find_application_link(response.content, response.url or job_url) or ''
+        except Exception as e:
+            logger.debug("Could not fetch %s for its application link: %s", job_url, e)
+            return None
+            
+    def find_application_link_browser(self, job_url):
+        """Render a job page in Chrome and look for the application link in one page_source pass
+
+        Returns '' if the page has none and None if it could not be rendered.
+        """
+        if not self.ensure_driver():
+            return None
+        try:
+            self.navigate(job_url)
+            return parsers.find_application_link(self.driver.page_source, self.driver.current_url) or ''
+        except Exception as e:
+            log_and_print(f"Error rendering {job_url} for its application link: {str(e)}", "warning", e)
+            return None
+            
+    @profiled('resolve_application_links')
+    @traced('resolve_application_links')
+    def resolve_application_links(self, job_urls, workers=APPLY_LINK_WORKERS, browser_fallback=APPLY_LINK_BROWSER_FALLBACK):
+        """Return ``{job_url: application link}`` for job pages, falling back to the job URL itself
 
-            # Base filenames without timestamp
-            csv_filename = os.path.join(keyword_dir, f"{keyword}_jobs.csv")
-            json_filename = os.path.join(keyword_dir, f"{keyword}_jobs.json")
+        Cached links are reused. The rest are fetched concurrently over
+        HTTP; only pages whose HTML has no link are rendered in Chrome, one
+        at a time. Results are cached by job URL for APPLY_LINK_TTL_DAYS;
+        pages that could not be fetched or rendered are not cached, so the
+        next run tries them again.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        links = {}
+        pending = []
+        for job_url in dict.fromkeys(url for url in job_urls if url):
+            known, link = self.application_links.lookup(job_url)
+            if known:
+                links[job_url] = link
+            else:
+                pending.append(job_url)
+        if not pending:
+            return links
             
+        log_and_print(f"Resolving application links for {len(pending)} jobs ({len(links)} cached)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='apply-link') as executor:
+            found = dict(zip(pending, executor.map(self.find_application_link_http, pending)))
+        if browser_fallback:
+            for job_url in pending:
+                if not found[job_url]:
+                    found[job_url] = self.find_application_link_browser(job_url)
+                    
+        for job_url in pending:
+            links[job_url] = found[job_url] or job_url
+            if found[job_url] is not None:
+                self.application_links.record(job_url, links[job_url], persist=False)
+        self.application_links.save()
+        return links
+        
+    def get_application_link(self, job_url, source):
+        """Extract the actual application link from a job posting page"""
+        try:
+            return self.resolve_application_links([job_url])[job_url]
+        except Exception as e:
+            log_and_print(f"Error getting application link: {str(e)}", "error", e)
+            return job_url
+
+@traced('save_results', cat='store')
+def save_keyword_results(keyword, jobs, log_update=True):
+    """Save jobs to CSV and JSON files, organized by keyword and append to existing files
+
+    ``log_update=False`` leaves the update log to the caller (the change tracker).
+    """
+    import pandas as pd
+    
+    log_and_print(f"Saving results for keyword: {keyword}")
+    if not os.path.exists('output'):
+        os.makedirs('output')
+    
+    # Create a directory for this keyword if it doesn't exist
+    keyword_dir = os.path.join('output', keyword)
+    if not os.path.exists(keyword_dir):
+        os.makedirs(keyword_dir)
+    
+    # Filter jobs for this keyword
+    keyword_jobs = [job for job in jobs if 'keyword' in job and job['keyword'] == keyword]
+    
+    if keyword_jobs:
+        # Add update timestamp to each job
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for job in keyword_jobs:
+            job['last_updated'] = timestamp
+
+        # Base filenames without timestamp
+        csv_filename = os.path.join(keyword_dir, f"{keyword}_jobs.csv")
+        json_filename = os.path.join(keyword_dir, f"{keyword}_jobs.json")
+        
+        with metrics.timer('scraper_store_write_seconds', format='csv'):
             # Handle CSV file
             if os.path.exists(csv_filename):
                 # Read existing CSV
                 existing_df = pd.read_csv(csv_filename)
                 # Create DataFrame for new jobs
                 new_df = pd.DataFrame(keyword_jobs)
-                
+            
                 # Combine existing and new jobs, drop duplicates based on URL
                 combined_df = pd.concat([existing_df, new_df]).drop_duplicates(subset=['url'], keep='last')
                 combined_df.to_csv(csv_filename, index=False)
             else:
                 # Create new CSV if it doesn't exist
                 pd.DataFrame(keyword_jobs).to_csv(csv_filename, index=False)
+        
+        log_and_print(f"Results saved/updated in {csv_filename}")
+        
+        # Handle JSON file
+        if os.path.exists(json_filename):
+            # Read existing JSON
+            with open(json_filename, 'r') as f:
+                try:
+                    existing_jobs = json.load(f)
+                except json.JSONDecodeError:
+                    existing_jobs = []
             
-            log_and_print(f"Results saved/updated in {csv_filename}")
+            # Create URL-based dictionary of existing jobs
+            existing_jobs_dict = {job['url']: job for job in existing_jobs}
+            new_count = sum(1 for job in keyword_jobs if job['url'] not in existing_jobs_dict)
             
-            # Handle JSON file
-            if os.path.exists(json_filename):
-                # Read existing JSON
-                with open(json_filename, 'r') as f:
-                    try:
-                        existing_jobs = json.load(f)
-                    except json.JSONDecodeError:
-                        existing_jobs = []
-                
-                # Create URL-based dictionary of existing jobs
-                existing_jobs_dict = {job['url']: job for job in existing_jobs}
-                
-                # Update with new jobs
-                for job in keyword_jobs:
-                    existing_jobs_dict[job['url']] = job
-                
-                # Convert back to list
-                updated_jobs = list(existing_jobs_dict.values())
-            else:
-                updated_jobs = keyword_jobs
+            # Update with new jobs
+            for job in keyword_jobs:
+                existing_jobs_dict[job['url']] = job
             
-            # Save updated JSON
+            # Convert back to list
+            updated_jobs = list(existing_jobs_dict.values())
+        else:
+            updated_jobs = keyword_jobs
+            new_count = len(keyword_jobs)
+        
+        # Save updated JSON
+        with metrics.timer('scraper_store_write_seconds', format='json'):
             with open(json_filename, 'w') as f:
                 json.dump(updated_jobs, f, indent=2)
-            
-            # Save an update log
+        metrics.inc('scraper_store_jobs_written_total', len(keyword_jobs), keyword=keyword)
+        
+        # Save an update log
+        if log_update:
             log_filename = os.path.join(keyword_dir, f"{keyword}_update_log.txt")
             with open(log_filename, 'a') as f:
-                f.write(f"Update performed at {timestamp}: Found {len(keyword_jobs)} new jobs\n")
-            
-    def close(self):
-        """Close the Selenium WebDriver"""
-        if self.driver is not None:
-            try:
-                log_and_print("Closing Chrome WebDriver...")
-                self.driver.quit()
-                log_and_print("Chrome WebDriver closed successfully!")
-            except Exception as e:
-                log_and_print(f"Error closing Chrome WebDriver: {str(e)}", "error", e)
+                f.write(f"Update performed at {timestamp}: Found {len(keyword_jobs)} jobs, {new_count} new\n")
 
-    def get_application_link(self, job_url, source):
-        """Extract the actual application link from a job posting page"""
-        try:
-            if not self.driver:
-                return job_url
-                
-            # Visit the job page
-            self.driver.get(job_url)
-            time.sleep(2)  # Wait for page to load
-            
-            # Common application button/link patterns
-            apply_selectors = [
-                'a[href*="apply"]',
-                'a[href*="application"]',
-                'a[href*="job-details"]',
-                'button[contains(text(), "Apply")]',
-                '.apply-button',
-                '#apply-button',
-                '.application-btn',
-                '.job-apply',
-                'a.btn-apply',
-                'a[data-automation="job-detail-apply"]'
-            ]
-            
-            # Try each selector
-            for selector in apply_selectors:
-                try:
-                    apply_element = WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    apply_url = apply_element.get_attribute('href')
-                    if apply_url and apply_url.startswith('http'):
-                        log_and_print(f"Found application link: {apply_url}", "debug")
-                        return apply_url
-                except:
-                    continue
-            
-            # If no apply button found, try to find any link containing "apply" or "application"
-            try:
-                links = self.driver.find_elements(By.TAG_NAME, 'a')
-                for link in links:
-                    href = link.get_attribute('href')
-                    if href and any(term in href.lower() for term in ['apply', 'application']):
-                        return href
-            except:
-                pass
-                
-            return job_url
-            
-        except Exception as e:
-            log_and_print(f"Error getting application link: {str(e)}", "error", e)
-            return job_url
-
-def main():
+def run_scrape(args):
+    """Scrape all configured keywords and save the results"""
     # Create output directory if it doesn't exist
     if not os.path.exists('output'):
         os.makedirs('output')
     
     # Initialize scraper
-    scraper = RemoteJobScraper()
+    metrics.start_run()
+    scraper = RemoteJobScraper(enrich=args.enrich or ENRICH_JOBS)
     
     try:
         # Search for each keyword from config
-        for keyword in KEYWORDS:
+        for keyword in current_sources().keywords:
             log_and_print(f"Searching for {keyword} jobs...")
             scraper.search_remote_jobs(keyword)
             # Save results for this keyword
             scraper.save_results(keyword)
             # Use delay from config
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+            tracer.sleep(DELAY_BETWEEN_REQUESTS)
         
     finally:
         # Clean up
         scraper.close()
+        try:
+            apply_retention()
+        except Exception as e:
+            log_and_print(f"Error applying retention: {str(e)}", "error", e)
+        metrics.write_summary()
     
     log_and_print("Job search completed!")
 
+def run_daemon(args):
+    """Scrape repeatedly, serving live run metrics on /metrics
+
+    Edits to the sources in config.py are picked up without a restart (see sources.ConfigWatcher).
+    """
+    start_metrics_server(args.metrics_port)
+    ConfigWatcher().start()
+    while True:
+        try:
+            run_scrape(args)
+        except Exception as e:
+            log_and_print(f"Error during scheduled run: {str(e)}", "error", e)
+        log_and_print(f"Next run in {args.interval} seconds")
+        time.sleep(args.interval)
+
+def run_reparse(args):
+    """Re-run the current parsers over the raw page archive (no network access)"""
+    jobs, stats = reparse_archive(args.archive_dir, parser=args.parser, since=args.since, workers=args.workers)
+    
+    # Keep the most recent copy of each posting per keyword
+    unique_jobs = {}
+    for job in jobs:
+        unique_jobs[(job.get('keyword'), job.get('url') or f"{job['title']}|{job['company']}")] = job
+    jobs = list(unique_jobs.values())
+    
+    if not args.no_save:
+        for keyword in sorted({job['keyword'] for job in jobs if job.get('keyword')}):
+            save_keyword_results(keyword, jobs)
+    
+    log_and_print(
+        f"Re-parsed {stats['pages']} pages ({stats['bytes'] / 1024 / 1024:.1f} MB) in {stats['seconds']}s "
+        f"({stats['pages_per_second']} pages/s): {len(jobs)} unique jobs, {stats['errors']} errors"
+    )
+
+def run_export(args):
+    """Stream the stored results (output/<keyword>/<keyword>_jobs.json) to one export file"""
+    from export import export_jobs, iter_stored_jobs, detect_format, detect_compression
+    from changes import iter_changes
+    
+    format_type = args.format or detect_format(args.path) or 'csv'
+    compression = args.compress or detect_compression(args.path)
+    
+    def report(written, total):
+        log_and_print(f"Exported {written} jobs...")
+    
+    if args.changes:
+        jobs = iter_changes(args.output_dir, keywords=args.keyword)
+    else:
+        jobs = iter_stored_jobs(args.output_dir, keywords=args.keyword)
+    start = time.perf_counter()
+    count = export_jobs(jobs, args.path, format_type, compression=compression, progress=report)
+    log_and_print(f"Exported {count} jobs to {args.path} ({format_type}, {compression or 'uncompressed'}) in {time.perf_counter() - start:.2f}s")
+
+def run_compact(args):
+    """Apply the output/ retention policy now"""
+    totals = apply_retention(args.output_dir, max_snapshots=args.max_snapshots,
+                             snapshot_max_age_days=args.max_age_days, expire_after_days=args.expire_after_days)
+    log_and_print(f"Compaction finished: {totals.get('snapshots', 0)} snapshots merged, {totals.get('expired', 0)} postings expired")
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Remote jobs scraper")
+    parser.add_argument('--profile', action='store_true', help="Profile each scraper stage and write the results to profiles/")
+    parser.add_argument('--trace', action='store_true', help="Write a Chrome trace-event timeline of the run to traces/")
+    parser.add_argument('--enrich', action='store_true', help="Fetch description, salary, tags and employment type for each job")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('scrape', help="Scrape all configured keywords (default)")
+    
+    daemon_parser = subparsers.add_parser('daemon', help="Scrape on a fixed interval and serve /metrics")
+    daemon_parser.add_argument('--interval', type=int, default=DAEMON_INTERVAL, help="Seconds between runs")
+    daemon_parser.add_argument('--metrics-port', type=int, default=METRICS_PORT, help="Port for the /metrics endpoint")
+    
+    reparse_parser = subparsers.add_parser('reparse', help="Re-parse archived pages without network access")
+    reparse_parser.add_argument('--archive-dir', default=ARCHIVE_DIRECTORY, help="Page archive directory")
+    reparse_parser.add_argument('--parser', help="Only re-parse pages whose parser starts with this, e.g. job_board:RemoteOK")
+    reparse_parser.add_argument('--since', help="Only re-parse pages fetched at or after this ISO timestamp")
+    reparse_parser.add_argument('--workers', type=int, default=REPARSE_WORKERS, help="Number of parser processes")
+    reparse_parser.add_argument('--no-save', action='store_true', help="Parse only (benchmark), do not update output files")
+    
+    export_parser = subparsers.add_parser('export', help="Export stored results to a single CSV/JSON-lines/JSON file")
+    export_parser.add_argument('path', help="Export file; the format and compression follow the extension, e.g. jobs.jsonl.gz")
+    export_parser.add_argument('--format', choices=['csv', 'jsonl', 'json'], help="Override the format implied by the file name")
+    export_parser.add_argument('--compress', choices=['gzip', 'zstd'], help="Override the compression implied by the file name")
+    export_parser.add_argument('--keyword', action='append', help="Only export this keyword (repeatable)")
+    export_parser.add_argument('--output-dir', default=OUTPUT_DIRECTORY, help="Directory holding the per-keyword results")
+    export_parser.add_argument('--changes', action='store_true', help="Only export the new, changed and removed jobs of the latest run")
+    
+    compact_parser = subparsers.add_parser('compact', help="Merge old per-run files into history and expire stale postings")
+    compact_parser.add_argument('--output-dir', default=OUTPUT_DIRECTORY, help="Directory holding the per-keyword results")
+    compact_parser.add_argument('--max-snapshots', type=int, default=RETENTION_MAX_SNAPSHOTS, help="Per-run files kept per keyword")
+    compact_parser.add_argument('--max-age-days', type=int, default=RETENTION_SNAPSHOT_MAX_AGE_DAYS, help="Merge per-run files older than this")
+    compact_parser.add_argument('--expire-after-days', type=int, default=RETENTION_EXPIRE_AFTER_DAYS, help="Expire postings not seen for this long")
+    
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_logging()
+    if args.profile:
+        enable_profiling()
+    if args.trace:
+        tracer.start()
+    try:
+        if args.command == 'reparse':
+            run_reparse(args)
+        elif args.command == 'daemon':
+            run_daemon(args)
+        elif args.command == 'export':
+            run_export(args)
+        elif args.command == 'compact':
+            run_compact(args)
+        else:
+            run_scrape(args)
+    finally:
+        tracer.finish()
+        finish_profiling()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from config import METRICS_DIRECTORY
+from logging_config import log_and_print
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Help text for the Prometheus exposition, keyed by metric name
+METRIC_HELP = {
+    'scraper_fetch_seconds': 'HTTP fetch latency by host',
+    'scraper_fetch_bytes_total': 'Response body bytes fetched by host',
+    'scraper_fetch_responses_total': 'HTTP responses by host and status code',
+    'scraper_fetch_errors_total': 'Failed HTTP fetches by host',
+    'scraper_parse_seconds': 'Time spent parsing one page by parser',
+    'scraper_listings_found_total': 'Listings found on pages by source',
+    'scraper_listings_kept_total': 'Listings kept after deduplication by source',
+    'scraper_dedup_hits_total': 'Listings dropped as duplicates by source',
+    'scraper_browser_load_seconds': 'Selenium page load time by host',
+    'scraper_browser_bytes_total': 'Bytes transferred by Chrome by host (Resource Timing)',
+    'scraper_store_write_seconds': 'Time spent writing result files by format',
+    'scraper_store_jobs_written_total': 'Jobs written to result files by keyword',
+    'scraper_pipeline_wait_seconds': 'Time the scraper waited for room in the write queue (backpressure)',
+    'scraper_pipeline_batches_total': 'Job batches written by the pipeline writer',
+    'scraper_retention_seconds': 'Time spent compacting and expiring output/',
+}
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+def _format_labels(key, extra=None):
+    items = list(key) + list(extra or [])
+    if not items:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in items)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(items, escaped)) + '}'
+
+class Metrics:
+    """Thread-safe in-process counters and histograms
+
+    Values are kept per metric name and label set, rendered in the Prometheus
+    text format for the ``/metrics`` endpoint (cumulative over the process)
+    and as a JSON summary at the end of a run, which only counts what
+    happened since start_run().
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.started_at = datetime.now()
+        self._counters = {}
+        self._histograms = {}
+        self._baseline = ({}, {})  # Counter values and histogram (count, sum) at start_run()
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        """Increase a counter"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Record a value in a histogram"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist['buckets'][i] += 1
+                    break
+            hist['sum'] += value
+            hist['count'] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the duration of a block in a histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._baseline = ({}, {})
+            self.started_at = datetime.now()
+
+    def start_run(self):
+        """Mark the start of a run; summary() then reports only what happened since"""
+        with self._lock:
+            self._baseline = (
+                {name: dict(series) for name, series in self._counters.items()},
+                {name: {key: (hist['count'], hist['sum']) for key, hist in series.items()}
+                 for name, series in self._histograms.items()}
+            )
+            self.started_at = datetime.now()
+
+    def render_prometheus(self):
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+
+            for name, series in sorted(self._histograms.items()):
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, hist['buckets']):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(key, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key, [('le', '+Inf')])} {hist['count']}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist['sum']:.6f}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """Return a JSON-serialisable summary of the metrics recorded since start_run()"""
+        with self._lock:
+            base_counters, base_histograms = self._baseline
+            counters = {}
+            for name, series in sorted(self._counters.items()):
+                base = base_counters.get(name, {})
+                values = [dict(key, value=value - base.get(key, 0)) for key, value in sorted(series.items())
+                          if value != base.get(key, 0)]
+                if values:
+                    counters[name] = values
+            histograms = {}
+            for name, series in sorted(self._histograms.items()):
+                base = base_histograms.get(name, {})
+                values = []
+                for key, hist in sorted(series.items()):
+                    base_count, base_sum = base.get(key, (0, 0.0))
+                    count, total = hist['count'] - base_count, hist['sum'] - base_sum
+                    if count:
+                        values.append(dict(key, count=count, sum=round(total, 6), avg=round(total / count, 6)))
+                if values:
+                    histograms[name] = values
+        return {
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'counters': counters,
+            'histograms': histograms
+        }
+
+    def write_summary(self, directory=METRICS_DIRECTORY):
+        """Write the run summary as JSON and return the file path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        log_and_print(f"Run metrics written to {path}")
+        return path
+
+# Process-wide registry used by the scraper
+metrics = Metrics()
+
+def start_metrics_server(port, host='127.0.0.1'):
+    """Serve ``/metrics`` from a background thread and return the server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep scrapes of /metrics out of the console
+
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    log_and_print(f"Metrics available at http://{host}:{server.server_port}/metrics")
+    return server
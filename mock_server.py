@@ -0,0 +1,338 @@
+"""Local synthetic job-board server for end-to-end load tests (see bench_scrape.py)
+
+Serves deterministic listings in the markup of the boards the scraper reads:
+
+    /wwr/remote-jobs.rss                      We Work Remotely RSS feed
+    /wwr/remote-jobs/search?term=<kw>         We Work Remotely search page
+    /remoteok/api                             RemoteOK JSON API
+    /remoteok/remote-<kw>                     RemoteOK search page
+    /remotive/api/remote-jobs                 Remotive JSON API
+    /remotive/remote-jobs/search?query=<kw>   Remotive search page
+    /careers/static                           server-rendered careers page
+    /careers/js                               careers page rendered by JavaScript
+    /remote-jobs/<site>-<id>                  job detail page with JobPosting JSON-LD
+    /_stats                                   request counts (JSON)
+
+Search pages list every matching job on one page, since the scraper reads
+only the first page of a search. Every response can be delayed and a share
+of them answered with 429/503.
+
+Usage:
+    python mock_server.py --port 8765 --jobs 5000 --latency lognormal:80:0.5 --error-rate 0.02
+"""
+import re
+import json
+import html
+import math
+import random
+import argparse
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+SITES = ('wwr', 'remoteok', 'remotive', 'careers')
+DEFAULT_KEYWORDS = ('python', 'javascript', 'react', 'data science', 'devops')
+TITLES = ('Senior {} Engineer', '{} Developer', 'Staff {} Engineer', 'Lead {} Developer', '{} Consultant')
+LOCATIONS = ('Remote', 'Remote - US', 'Anywhere', 'Remote (Europe)', 'Worldwide', 'New York, NY')
+EXTRA_TAGS = ('aws', 'sql', 'docker', 'kubernetes', 'typescript', 'go', 'rust', 'graphql')
+EMPLOYMENT_TYPES = ('FULL_TIME', 'CONTRACTOR', 'PART_TIME')
+COMPANY_WORDS = ('Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka')
+
+def parse_latency(spec):
+    """Turn a latency spec into a sampler returning seconds
+
+    ``"50"`` is a fixed 50 ms, ``"20-200"`` uniform between 20 and 200 ms and
+    ``"lognormal:80:0.5"`` log-normal with an 80 ms median and sigma 0.5.
+    """
+    spec = str(spec).strip()
+    if spec.startswith('lognormal:'):
+        _, median, sigma = spec.split(':')
+        mu, sigma = math.log(float(median) / 1000), float(sigma)
+        return lambda rng: rng.lognormvariate(mu, sigma)
+    if '-' in spec:
+        low, high = (float(part) / 1000 for part in spec.split('-', 1))
+        return lambda rng: rng.uniform(low, high)
+    fixed = float(spec) / 1000
+    return lambda rng: fixed
+
+def make_jobs(count, keywords, seed, description_bytes=0):
+    """Generate ``count`` deterministic listings spread over the keywords"""
+    rng = random.Random(seed)
+    today = date.today()
+    jobs = []
+    for i in range(count):
+        keyword = keywords[i % len(keywords)]
+        title = rng.choice(TITLES).format(keyword.title())
+        tags = [keyword, rng.choice(EXTRA_TAGS)]
+        jobs.append({
+            'id': i,
+            'title': title,
+            'company': f"{rng.choice(COMPANY_WORDS)} {i}",  # Unique per site, so only cross-site copies dedup
+            'location': rng.choice(LOCATIONS),
+            'date': (today - timedelta(days=rng.randrange(60))).isoformat(),
+            'tags': tags,
+            'salary': 60000 + 5000 * rng.randrange(20),
+            'employment_type': rng.choice(EMPLOYMENT_TYPES),
+            'description': (f"{title} working with {', '.join(tags)}. " * (description_bytes // 40 + 1))[:description_bytes]
+        })
+    return jobs
+
+class MockJobServer:
+    """Threaded HTTP server emulating the job boards, feeds and careers pages
+
+    ``jobs`` listings are generated per site; search pages show all the
+    matching ones and the careers pages all of theirs. ``latency`` is
+    a parse_latency spec applied to every response, ``error_rate`` the share
+    of requests answered with one of ``error_statuses`` (429 responses carry
+    Retry-After). ``pad_bytes`` adds filler markup to every HTML page and
+    ``description_bytes`` sizes each listing's description. Bodies are
+    rendered once and cached, so the server costs little next to the scraper.
+    """
+
+    def __init__(self, jobs=1000, keywords=DEFAULT_KEYWORDS, latency='0', error_rate=0.0,
+                 error_statuses=(429, 503), pad_bytes=0, description_bytes=500, seed=0, host='127.0.0.1', port=0):
+        self.keywords = tuple(keywords)
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.pad = f"<div hidden>{'x' * pad_bytes}</div>" if pad_bytes else ''
+        self.jobs = {site: make_jobs(jobs, self.keywords, seed + index, description_bytes) for index, site in enumerate(SITES)}
+        self.rng = random.Random(seed)
+        self.stats = {'requests': 0, 'bytes': 0, 'statuses': {}}
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like the real sites
+
+            def do_GET(self):
+                status, content_type, body, headers = server.respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def respond(self, path):
+        """Return ``(status, content type, body, headers)`` for a request path"""
+        if path == '/_stats':
+            with self._lock:
+                return 200, 'application/json', json.dumps(self.stats).encode(), {}
+        with self._lock:
+            delay = self.latency(self.rng)
+            failed = self.rng.random() < self.error_rate
+            status = self.rng.choice(self.error_statuses) if failed else 200
+        if delay > 0:
+            time.sleep(delay)
+
+        headers = {}
+        if failed:
+            content_type, body = 'text/html; charset=utf-8', f"<html><body><h1>{status}</h1></body></html>".encode()
+            if status == 429:
+                headers['Retry-After'] = '1'
+        else:
+            with self._lock:
+                cached = self._cache.get(path)
+            if cached is None:
+                cached = self._render(path)
+                with self._lock:
+                    self._cache[path] = cached
+            content_type, body = cached
+            if body is None:
+                status, content_type, body = 404, 'text/plain', b'Not found'
+
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += len(body)
+            self.stats['statuses'][str(status)] = self.stats['statuses'].get(str(status), 0) + 1
+        return status, content_type, body, headers
+
+    def _render(self, path):
+        parts = urlsplit(path)
+        query = parse_qs(parts.query)
+        route = parts.path
+        if route == '/wwr/remote-jobs.rss':
+            return 'application/rss+xml', self.render_wwr_feed()
+        if route == '/wwr/remote-jobs/search':
+            return 'text/html; charset=utf-8', self.render_search('wwr', query.get('term', [''])[0])
+        if route == '/remoteok/api':
+            return 'application/json', self.render_remoteok_feed()
+        if route.startswith('/remoteok/remote-'):
+            return 'text/html; charset=utf-8', self.render_search('remoteok', route[len('/remoteok/remote-'):])
+        if route == '/remotive/api/remote-jobs':
+            return 'application/json', self.render_remotive_feed()
+        if route == '/remotive/remote-jobs/search':
+            return 'text/html; charset=utf-8', self.render_search('remotive', query.get('query', [''])[0])
+        if route in ('/careers/static', '/careers/js'):
+            return 'text/html; charset=utf-8', self.render_careers(script=route.endswith('/js'))
+        match = re.fullmatch(r'/remote-jobs/([a-z]+)-(\d+)', route)
+        if match and match[1] in self.jobs and int(match[2]) < len(self.jobs[match[1]]):
+            return 'text/html; charset=utf-8', self.render_detail(match[1], self.jobs[match[1]][int(match[2])])
+        return 'text/plain', None
+
+    def job_url(self, site, job):
+        return f"{self.url}/remote-jobs/{site}-{job['id']}"
+
+    def render_wwr_feed(self):
+        items = []
+        for job in self.jobs['wwr']:
+            published = format_datetime(datetime.fromisoformat(job['date']).replace(tzinfo=timezone.utc))
+            items.append(
+                f"<item><title>{html.escape(job['company'])}: {html.escape(job['title'])}</title>"
+                f"<region>{html.escape(job['location'])}</region><category>{html.escape(job['tags'][0])}</category>"
+                f"<description>{html.escape(job['description'])}</description>"
+                f"<pubDate>{published}</pubDate><link>{self.job_url('wwr', job)}</link></item>"
+            )
+        return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Remote jobs</title>'
+                + ''.join(items) + '</channel></rss>').encode()
+
+    def render_remoteok_feed(self):
+        items = [{'legal': 'Mock RemoteOK API for load tests'}]
+        items += [{'id': job['id'], 'position': job['title'], 'company': job['company'], 'location': job['location'],
+                   'tags': job['tags'], 'date': f"{job['date']}T00:00:00+00:00", 'description': job['description'],
+                   'url': self.job_url('remoteok', job)} for job in self.jobs['remoteok']]
+        return json.dumps(items).encode()
+
+    def render_remotive_feed(self):
+        jobs = [{'id': job['id'], 'title': job['title'], 'company_name': job['company'],
+                 'candidate_required_location': job['location'], 'publication_date': f"{job['date']}T00:00:00",
+                 'category': 'Software Development', 'tags': job['tags'], 'description': job['description'],
+                 'url': self.job_url('remotive', job)} for job in self.jobs['remotive']]
+        return json.dumps({'job-count': len(jobs), 'jobs': jobs}).encode()
+
+    def render_search(self, site, keyword):
+        keyword = keyword.lower()
+        matching = [job for job in self.jobs[site] if keyword in job['title'].lower() or keyword in job['tags']]
+        render = {'wwr': self.render_wwr_listing, 'remoteok': self.render_remoteok_listing,
+                  'remotive': self.render_remotive_listing}[site]
+        body = ''.join(render(job) for job in matching)
+        if site == 'wwr':
+            body = f'<section class="jobs"><ul>{body}</ul></section>'
+        elif site == 'remoteok':
+            body = f'<table id="jobsboard"><tbody>{body}</tbody></table>'
+        else:
+            body = f'<ul class="job-list">{body}</ul>'
+        return self.page(f"{len(matching)} {keyword} jobs", body)
+
+    def render_wwr_listing(self, job):
+        return (f'<li class="feature"><a href="/remote-jobs/wwr-{job["id"]}">'
+                f'<span class="company">{html.escape(job["company"])}</span>'
+                f'<span class="title">{html.escape(job["title"])}</span>'
+                f'<span class="region">{html.escape(job["location"])}</span>'
+                f'<time datetime="{job["date"]}">{job["date"]}</time></a></li>')
+
+    def render_remoteok_listing(self, job):
+        return (f'<tr class="job" data-url="/remote-jobs/remoteok-{job["id"]}"><td class="company">'
+                f'<a href="/remote-jobs/remoteok-{job["id"]}"><h2 itemprop="title">{html.escape(job["title"])}</h2></a>'
+                f'<h3 itemprop="name">{html.escape(job["company"])}</h3>'
+                f'<div class="location">{html.escape(job["location"])}</div></td>'
+                f'<td class="time"><time datetime="{job["date"]}">{job["date"]}</time></td></tr>')
+
+    def render_remotive_listing(self, job):
+        return (f'<li class="job-list-item"><a href="/remote-jobs/remotive-{job["id"]}">'
+                f'<span class="job-title">{html.escape(job["title"])}</span></a>'
+                f'<span class="company-name">{html.escape(job["company"])}</span>'
+                f'<span class="location">{html.escape(job["location"])}</span>'
+                f'<span class="job-date">{job["date"]}</span></li>')
+
+    def render_careers(self, script):
+        """The careers page; with ``script`` the listings only appear once JavaScript runs"""
+        jobs = self.jobs['careers']
+        if not script:
+            body = ''.join(f'<div class="job"><a class="job-title" href="/remote-jobs/careers-{job["id"]}">'
+                           f'{html.escape(job["title"])}</a><span class="job-location">{html.escape(job["location"])}</span></div>'
+                           for job in jobs)
+            return self.page('Careers', f'<div id="openings">{body}</div>')
+        data = json.dumps([{'id': job['id'], 'title': job['title'], 'location': job['location']} for job in jobs])
+        return self.page('Careers', '<div id="openings"></div><script>'
+                         f"const jobs = {data.replace('</', '<' + chr(92) + '/')};"
+                         "const esc = s => s.replace(/[&<>\"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\"': '&quot;'})[c]);"
+                         "document.getElementById('openings').innerHTML = jobs.map(j =>"
+                         " `<div class=\"job\"><a class=\"job-title\" href=\"/remote-jobs/careers-${j.id}\">${esc(j.title)}</a>"
+                         "<span class=\"job-location\">${esc(j.location)}</span></div>`).join('');</script>")
+
+    def render_detail(self, site, job):
+        posting = {
+            '@context': 'https://schema.org', '@type': 'JobPosting', 'title': job['title'],
+            'description': f"<p>{html.escape(job['description'])}</p>", 'datePosted': job['date'],
+            'employmentType': job['employment_type'], 'skills': job['tags'],
+            'hiringOrganization': {'@type': 'Organization', 'name': job['company']},
+            'baseSalary': {'@type': 'MonetaryAmount', 'currency': 'USD',
+                           'value': {'@type': 'QuantitativeValue', 'value': job['salary'], 'unitText': 'YEAR'}}
+        }
+        ld = json.dumps(posting).replace('</', '<\\/')
+        return self.page(job['title'], f'<script type="application/ld+json">{ld}</script>'
+                         f'<h1>{html.escape(job["title"])}</h1><div class="description">{html.escape(job["description"])}</div>'
+                         f'<a class="apply" href="{self.job_url(site, job)}/apply">Apply</a>')
+
+    def page(self, title, body):
+        return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(title)}</title></head>'
+                f'<body>{body}{self.pad}</body></html>').encode()
+
+def add_server_arguments(parser):
+    """Add the MockJobServer options to an argparse parser (shared with bench_scrape.py)"""
+    parser.add_argument('--jobs', type=int, default=1000, help="Listings generated per site")
+    parser.add_argument('--latency', default='0', help="Response latency in ms: 50, 20-200 or lognormal:<median>:<sigma>")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with an error status")
+    parser.add_argument('--error-statuses', default='429,503', help="Comma-separated error statuses to inject")
+    parser.add_argument('--pad-bytes', type=int, default=0, help="Filler bytes added to every HTML page")
+    parser.add_argument('--description-bytes', type=int, default=500, help="Description size of each listing")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for listings, latency and errors")
+
+def server_options(args):
+    """MockJobServer keyword arguments from parsed add_server_arguments options"""
+    return dict(jobs=args.jobs, latency=args.latency, error_rate=args.error_rate,
+                error_statuses=[int(status) for status in args.error_statuses.split(',') if status],
+                pad_bytes=args.pad_bytes, description_bytes=args.description_bytes, seed=args.seed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic job boards for load tests")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on, 0 for any free port")
+    parser.add_argument('--keywords', default=','.join(DEFAULT_KEYWORDS), help="Comma-separated keywords the listings cover")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockJobServer(keywords=[keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()],
+                           host=args.host, port=args.port, **server_options(args))
+    print(f"Serving on {server.url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import os
+import time
+import threading
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from config import PARSE_WORKERS, PARSE_POOL_MIN_BYTES
+from logging_config import log_and_print
+from metrics import metrics
+
+def pack_jobs(jobs):
+    """Turn job dicts into ``(layouts, rows)`` of plain tuples
+
+    Jobs from one parser nearly always share the same keys, so each distinct
+    key tuple is sent once and every job becomes ``(layout index, values)``,
+    which pickles smaller and faster than a list of dicts.
+    """
+    layouts = {}
+    rows = []
+    for job in jobs:
+        layout = layouts.setdefault(tuple(job), len(layouts))
+        rows.append((layout, tuple(job.values())))
+    return list(layouts), rows
+
+def unpack_jobs(packed):
+    """Rebuild the job dicts from pack_jobs output"""
+    layouts, rows = packed
+    return [dict(zip(layouts[layout], values)) for layout, values in rows]
+
+def pack_result(result):
+    """Compact a parser result for the trip back from a worker process"""
+    if isinstance(result, list) and result:
+        if all(isinstance(item, dict) for item in result):
+            return 'jobs', pack_jobs(result)
+        if all(isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], dict) for item in result):
+            return 'entries', (pack_jobs([job for job, _ in result]), [text for _, text in result])
+    return 'raw', result
+
+def unpack_result(packed):
+    kind, data = packed
+    if kind == 'jobs':
+        return unpack_jobs(data)
+    if kind == 'entries':
+        jobs, texts = data
+        return list(zip(unpack_jobs(jobs), texts))
+    return data
+
+def run_packed(func, args):
+    """Worker process entry point: run a parser and return ``(seconds, packed result)``"""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, pack_result(result)
+
+class ParsePool:
+    """Runs CPU-bound parsers in worker processes so the scraper keeps fetching meanwhile
+
+    ``submit(func, *args)`` returns a Future for ``func(*args)``; ``func``
+    must be a module-level function (e.g. from parsers) so it can be sent to
+    a worker. Raw page bytes go in and job lists come back as compact tuples
+    (see pack_result). Pages smaller than ``min_bytes`` are parsed inline,
+    where the process round trip would cost more than it saves. The pool is
+    started on first use with ``workers`` processes (None = one per core).
+    If a worker dies (killed, out of memory), the pool is shut down, the
+    parses it lost are re-run inline and the rest of the run parses inline.
+    """
+
+    def __init__(self, workers=PARSE_WORKERS, min_bytes=PARSE_POOL_MIN_BYTES):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_bytes = min_bytes
+        self._executor = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, label=None):
+        """Start ``func(*args)``; ``label`` names the parser in scraper_parse_seconds"""
+        size = sum(len(arg) for arg in args if isinstance(arg, (bytes, str)))
+        executor = self._get_executor() if size >= self.min_bytes else None
+        if executor is None:
+            return self._run_inline(func, args, label)
+
+        future = Future()
+        def done(worker_future):
+            try:
+                seconds, packed = worker_future.result()
+            except BrokenProcessPool as e:
+                self._pool_broken(executor, e)
+                self._run_inline(func, args, label, future)
+                return
+            except Exception as e:
+                future.set_exception(e)
+                return
+            try:
+                if label:
+                    metrics.observe('scraper_parse_seconds', seconds, parser=label)
+                future.set_result(unpack_result(packed))
+            except Exception as e:
+                future.set_exception(e)
+        try:
+            worker_future = executor.submit(run_packed, func, args)
+        except BrokenProcessPool as e:
+            self._pool_broken(executor, e)
+            return self._run_inline(func, args, label, future)
+        worker_future.add_done_callback(done)
+        return future
+
+    def _run_inline(self, func, args, label, future=None):
+        future = future or Future()
+        try:
+            start = time.perf_counter()
+            result = func(*args)
+            if label:
+                metrics.observe('scraper_parse_seconds', time.perf_counter() - start, parser=label)
+            future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None and not self._broken and self.workers > 1:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                try:
+                    # Spawned, not forked: the scraper process already runs writer and fetch threads
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+                except (OSError, NotImplementedError) as e:
+                    log_and_print(f"Parsing in the scraper process, worker processes are unavailable: {str(e)}", "warning", e)
+                    self._broken = True
+            return self._executor
+
+    def _pool_broken(self, executor, error):
+        """Drop a pool whose worker process died; parsing continues inline"""
+        with self._lock:
+            if self._executor is not executor:
+                return  # Already handled for another parse
+            self._executor = None
+            self._broken = True
+        log_and_print(f"A parse worker process died, parsing in the scraper process from now on: {str(error)}", "warning", error)
+        # Not waiting: this may run on the pool's own management thread
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
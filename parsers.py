@@ -0,0 +1,615 @@
+import io
+import re
+import json
+import functools
+from datetime import datetime
+from urllib.parse import urljoin
+from config import DETAIL_SELECTORS, ENRICH_DESCRIPTION_MAX_CHARS
+from logging_config import logger, log_and_print
+from sources import current_sources
+
+REMOTE_TERMS = ['remote', 'anywhere', 'global', 'worldwide']
+
+def make_soup(html):
+    """Parse HTML with BeautifulSoup (imported on first use to keep startup fast)"""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
+
+BOARD_HOSTS = {
+    'WeWorkRemotely': 'https://weworkremotely.com',
+    'RemoteOK': 'https://remoteok.com',
+    'Remotive': 'https://remotive.com'
+}
+
+def get_job_url(job_element, board_name, base_url=None):
+    """Get the actual job posting URL
+
+    Relative links are resolved against ``base_url`` (the board's search
+    URL) when given, else against the board's public host.
+    """
+    base_url = base_url or BOARD_HOSTS.get(board_name)
+    try:
+        if board_name == 'WeWorkRemotely':
+            # Find the link that specifically points to a job listing
+            # Job URLs contain '/remote-jobs/' in their path
+            link = job_element.find('a', href=lambda x: x and '/remote-jobs/' in x)
+            if link and link['href']:
+                return urljoin(base_url, link['href'])
+
+        elif board_name == 'RemoteOK':
+            # RemoteOK job URLs are in the data-url attribute and start with /remote-jobs/
+            url = job_element.get('data-url', '')
+            if url and url.startswith('/remote-jobs/'):
+                return urljoin(base_url, url)
+
+        elif board_name == 'Remotive':
+            # Remotive job URLs contain /remote-jobs/ in their path
+            link = job_element.find('a', href=lambda x: x and '/remote-jobs/' in x)
+            if link and link['href']:
+                return urljoin(base_url, link['href'])
+
+        # If all else fails, look for any link containing job-specific patterns
+        any_link = job_element.find('a', href=lambda x: x and (
+            '/remote-jobs/' in x or
+            '/job/' in x or
+            '/position/' in x
+        ))
+        if any_link and any_link['href']:
+            href = any_link['href']
+            if href.startswith('http'):
+                return href
+            elif base_url:
+                return urljoin(base_url, href)
+
+        log_and_print("Could not find job posting URL in element", "warning")
+        return None
+
+    except Exception as e:
+        log_and_print(f"Error getting job URL: {str(e)}", "error")
+        return None
+
+def parse_job_board(board, html, keyword):
+    """Parse a job board search results page into job dictionaries (``board`` is a sources.BoardSource)"""
+    soup = make_soup(html)
+    board_name = board.name
+
+    # Find all job listings
+    listings = board.job.select(soup)
+    log_and_print(f"Found {len(listings)} job listings on {board_name}")
+
+    jobs = []
+    for job in listings:
+        try:
+            # Extract job details
+            title = board.title.select_one(job).text.strip()
+            company = board.company.select_one(job).text.strip()
+
+            # Get the direct job posting URL
+            job_url = get_job_url(job, board_name, board.search_url)
+            if not job_url:  # Skip if no valid URL found
+                continue
+
+            try:
+                location = board.location.select_one(job).text.strip()
+            except (AttributeError, KeyError):
+                location = "Remote"
+
+            try:
+                date_element = board.date.select_one(job)
+                if date_element:
+                    if date_element.has_attr('datetime'):
+                        date_posted = date_element['datetime']
+                    else:
+                        date_posted = date_element.text.strip()
+                else:
+                    date_posted = datetime.now().strftime('%Y-%m-%d')
+            except (AttributeError, KeyError):
+                date_posted = datetime.now().strftime('%Y-%m-%d')
+
+            jobs.append({
+                'title': title,
+                'company': company,
+                'location': location,
+                'date_posted': date_posted,
+                'url': job_url,
+                'source': board_name,
+                'keyword': keyword
+            })
+
+        except Exception as e:
+            log_and_print(f"Error parsing job from {board_name}: {str(e)}", "error", e)
+            continue
+
+    return jobs
+
+def parse_weworkremotely_job(job_element):
+    """Parse a job listing from We Work Remotely"""
+    try:
+        if not job_element:
+            logger.warning("Empty job element received")
+            return None
+
+        # Extract job details with None checks
+        title_element = job_element.find('span', class_='title')
+        title = title_element.text.strip() if title_element and hasattr(title_element, 'text') else "Unknown Title"
+
+        company_element = job_element.find('span', class_='company')
+        company = company_element.text.strip() if company_element and hasattr(company_element, 'text') else "Unknown Company"
+
+        link_element = job_element.find('a', href=True)
+        link = f"https://weworkremotely.com{link_element['href']}" if link_element and 'href' in link_element.attrs else None
+
+        region_element = job_element.find('span', class_='region')
+        region = region_element.text.strip() if region_element and hasattr(region_element, 'text') else "Remote"
+
+        # Create job object only if we have minimum required info
+        if title != "Unknown Title" or company != "Unknown Company":
+            return {
+                'title': title,
+                'company': company,
+                'location': region,
+                'url': link,
+                'source': 'We Work Remotely'
+            }
+        else:
+            logger.warning("Skipping job due to missing required information")
+            return None
+
+    except Exception as e:
+        logger.error(f"Error parsing job from weworkremotely: {str(e)}")
+        return None
+
+def parse_weworkremotely(html, keyword=None):
+    """Parse a We Work Remotely search results page"""
+    soup = make_soup(html)
+    jobs = []
+    for job in soup.select('li.feature'):
+        job_data = parse_weworkremotely_job(job)
+        if job_data:
+            jobs.append(job_data)
+    return jobs
+
+def parse_remote_ok(html, keyword=None):
+    """Parse a RemoteOK search results page"""
+    soup = make_soup(html)
+    jobs = []
+    for job in soup.select('tr.job'):
+        title = job.select_one('.company h2')
+        company = job.select_one('.company h3')
+        date = job.select_one('.time')
+
+        if title and company:
+            link = job.select_one('a[href]')
+            jobs.append({
+                'title': title.text.strip(),
+                'company': company.text.strip(),
+                'date_posted': date.text.strip() if date else '',
+                'source': 'RemoteOK',
+                'url': f"https://remoteok.com{link['href']}" if link else '',
+                'is_company_direct': False
+            })
+    return jobs
+
+def parse_remotive(html, keyword=None):
+    """Parse a Remotive search results page"""
+    soup = make_soup(html)
+    jobs = []
+    board = current_sources().boards['Remotive']
+    for job in board.job.select(soup):
+        title = board.title.select_one(job)
+        company = board.company.select_one(job)
+        date = board.date.select_one(job)
+
+        if title and company:
+            jobs.append({
+                'title': title.text.strip(),
+                'company': company.text.strip(),
+                'date_posted': date.text.strip() if date else '',
+                'source': 'Remotive',
+                'url': f"https://remotive.com{job.select_one('a')['href']}" if job.select_one('a') else '',
+                'is_company_direct': False
+            })
+    return jobs
+
+def iter_json_items(body, path):
+    """Yield the items of the array at ``path`` ('item' or 'jobs.item') in a JSON document
+
+    Uses the incremental ijson parser when it is installed and falls back to
+    json.loads otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = json.loads(body)
+        for key in path.split('.')[:-1]:
+            data = data.get(key, []) if isinstance(data, dict) else []
+        yield from data
+        return
+    yield from ijson.items(io.BytesIO(body), path)
+
+def parse_remoteok_feed(body):
+    """Parse the RemoteOK JSON API into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'item'):
+        if not isinstance(item, dict) or not item.get('position'):
+            continue  # The first element is the API's legal notice
+        tags = item.get('tags') or []
+        job = {
+            'title': item['position'].strip(),
+            'company': (item.get('company') or '').strip(),
+            'location': item.get('location') or 'Remote',
+            'date_posted': (item.get('date') or '')[:10],
+            'source': 'RemoteOK',
+            'url': item.get('url') or f"https://remoteok.com/remote-jobs/{item.get('slug', '')}",
+            'is_company_direct': False
+        }
+        entries.append((job, ' '.join([job['title'], job['company']] + tags)))
+    return entries
+
+def parse_remotive_feed(body):
+    """Parse the Remotive JSON API into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'jobs.item'):
+        if not item.get('title'):
+            continue
+        tags = item.get('tags') or []
+        job = {
+            'title': item['title'].strip(),
+            'company': (item.get('company_name') or '').strip(),
+            'location': item.get('candidate_required_location') or 'Remote',
+            'date_posted': (item.get('publication_date') or '')[:10],
+            'source': 'Remotive',
+            'url': item.get('url', ''),
+            'is_company_direct': False
+        }
+        entries.append((job, ' '.join([job['title'], job['company'], item.get('category') or ''] + tags)))
+    return entries
+
+def parse_weworkremotely_feed(body):
+    """Parse the We Work Remotely RSS feed into ``(job, search_text)`` entries"""
+    import xml.etree.ElementTree as ET
+    from email.utils import parsedate_to_datetime
+
+    entries = []
+    for _, element in ET.iterparse(io.BytesIO(body), events=('end',)):
+        if element.tag != 'item':
+            continue
+        # Item titles are "Company: Job title"
+        company, _, title = (element.findtext('title') or '').partition(': ')
+        if not title:
+            company, title = '', company
+        if not title.strip():
+            element.clear()
+            continue
+        try:
+            date_posted = parsedate_to_datetime(element.findtext('pubDate')).strftime('%Y-%m-%d')
+        except (TypeError, ValueError):
+            date_posted = ''
+        job = {
+            'title': title.strip(),
+            'company': company.strip(),
+            'location': element.findtext('region') or 'Remote',
+            'date_posted': date_posted,
+            'source': 'We Work Remotely',
+            'url': (element.findtext('link') or '').strip(),
+            'is_company_direct': False
+        }
+        entries.append((job, ' '.join([job['title'], job['company'], element.findtext('category') or ''])))
+        element.clear()  # Keep memory flat on large feeds
+    return entries
+
+FEED_PARSERS = {
+    'WeWorkRemotely': parse_weworkremotely_feed,
+    'RemoteOK': parse_remoteok_feed,
+    'Remotive': parse_remotive_feed
+}
+
+def parse_feed(feed_name, body):
+    """Parse a listing feed into ``(job, search_text)`` entries, untagged"""
+    return FEED_PARSERS[feed_name](body)
+
+def ats_job(company, title, location, url, date_posted, remote=False):
+    """Build a job dict for an ATS listing; ``remote`` flags jobs the ATS marks as remote"""
+    location = (location or '').strip()
+    if remote and 'remote' not in location.lower():
+        location = f"Remote - {location}" if location else 'Remote'
+    return {
+        'title': (title or '').strip(),
+        'company': company,
+        'location': location or 'Unknown',
+        'source': f"{company} Careers",
+        'url': url or '',
+        'date_posted': date_posted,
+        'is_company_direct': True
+    }
+
+def parse_greenhouse(body, company):
+    """Parse a Greenhouse job board (boards-api.greenhouse.io) into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'jobs.item'):
+        job = ats_job(company, item.get('title'), (item.get('location') or {}).get('name'),
+                      item.get('absolute_url'), (item.get('first_published') or item.get('updated_at') or '')[:10])
+        departments = [d.get('name') or '' for d in item.get('departments') or []]
+        entries.append((job, ' '.join([job['title']] + departments)))
+    return entries
+
+def parse_lever(body, company):
+    """Parse a Lever postings list (api.lever.co) into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'item'):
+        categories = item.get('categories') or {}
+        created = item.get('createdAt')
+        job = ats_job(company, item.get('text'), categories.get('location'), item.get('hostedUrl'),
+                      datetime.fromtimestamp(int(created) / 1000).strftime('%Y-%m-%d') if created else '',
+                      remote=item.get('workplaceType') == 'remote')
+        entries.append((job, ' '.join([job['title'], categories.get('team') or '', categories.get('department') or ''])))
+    return entries
+
+def parse_ashby(body, company):
+    """Parse an Ashby job board (api.ashbyhq.com) into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'jobs.item'):
+        if item.get('isListed') is False:
+            continue
+        job = ats_job(company, item.get('title'), item.get('location'), item.get('jobUrl'),
+                      (item.get('publishedAt') or '')[:10],
+                      remote=item.get('isRemote') or item.get('workplaceType') == 'Remote')
+        entries.append((job, ' '.join([job['title'], item.get('department') or '', item.get('team') or ''])))
+    return entries
+
+def parse_workable(body, company):
+    """Parse a Workable account widget (apply.workable.com) into ``(job, search_text)`` entries"""
+    entries = []
+    for item in iter_json_items(body, 'jobs.item'):
+        location = ', '.join(part for part in (item.get('city'), item.get('country')) if part)
+        job = ats_job(company, item.get('title'), location, item.get('url') or item.get('shortlink'),
+                      item.get('published_on') or (item.get('created_at') or '')[:10],
+                      remote=item.get('telecommuting'))
+        entries.append((job, ' '.join([job['title'], item.get('department') or '', item.get('function') or ''])))
+    return entries
+
+ATS_PARSERS = {
+    'greenhouse': parse_greenhouse,
+    'lever': parse_lever,
+    'ashby': parse_ashby,
+    'workable': parse_workable
+}
+
+def parse_ats(ats_kind, body, company):
+    """Parse an ATS JSON job board into ``(job, search_text)`` entries"""
+    return ATS_PARSERS[ats_kind](body, company)
+
+def filter_remote(entries, remote_terms=REMOTE_TERMS):
+    """Keep the entries whose location mentions one of ``remote_terms``"""
+    return [(job, text) for job, text in entries if any(term in job['location'].lower() for term in remote_terms)]
+
+def keyword_pattern(keyword):
+    """Regex source for a keyword as whole words; hyphens match any separator"""
+    terms = [re.escape(term) for term in re.split(r'[-\s]+', keyword) if term]
+    return r'[\s\-_/]*'.join(terms)
+
+class KeywordTagger:
+    """Match text against many keywords with one combined regex
+
+    Each keyword becomes a capture group in a single alternation, so a
+    listing that matches no keyword (most of a feed) is rejected in one
+    scan. Matches of an alternation cannot overlap, so a keyword sharing
+    text with another one ("paid-social" in "Paid Social Media Marketing")
+    can be hidden; once anything matched, the remaining keywords are checked
+    with their own patterns and every matching keyword is reported.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted(set(keywords), key=len, reverse=True)
+        groups = '|'.join(f'({keyword_pattern(keyword)})' for keyword in self.keywords)
+        self.pattern = re.compile(rf'(?<!\w)(?:{groups})(?!\w)', re.IGNORECASE)
+        self.patterns = [re.compile(rf'(?<!\w){keyword_pattern(keyword)}(?!\w)', re.IGNORECASE) for keyword in self.keywords]
+
+    def tags(self, text):
+        """Return the set of keywords found in the text"""
+        found = {self.keywords[match.lastindex - 1] for match in self.pattern.finditer(text)}
+        if found:
+            found.update(keyword for keyword, pattern in zip(self.keywords, self.patterns)
+                         if keyword not in found and pattern.search(text))
+        return found
+
+@functools.lru_cache(maxsize=32)
+def get_tagger(keywords):
+    """Return a cached KeywordTagger for a tuple of keywords"""
+    return KeywordTagger(keywords)
+
+def tag_feed_jobs(entries, keywords):
+    """Return one job per (entry, matching keyword), with ``keyword`` set"""
+    tagger = get_tagger(tuple(keywords))
+    jobs = []
+    for job, text in entries:
+        for keyword in tagger.tags(text):
+            jobs.append(dict(job, keyword=keyword))
+    return jobs
+
+def parse_company_listing(company, html, keywords=None, remote_terms=REMOTE_TERMS):
+    """Parse a company careers page (``company`` is a sources.CompanySource)
+
+    Keeps listings whose location mentions one of ``remote_terms`` and, when
+    ``keywords`` is given, whose title mentions one of the keywords.
+    """
+    soup = html if hasattr(html, 'select') else make_soup(html)  # Accepts an already parsed page
+    base_url = company.url
+    jobs = []
+    for job in company.job.select(soup):
+        title_element = company.title.select_one(job)
+        if not title_element:
+            continue
+        title = title_element.get_text(strip=True)
+        location_element = company.location.select_one(job)
+        location = location_element.get_text(strip=True) if location_element else ''
+
+        if remote_terms and not any(term in location.lower() for term in remote_terms):
+            continue
+        if keywords and not any(keyword.lower() in title.lower() for keyword in keywords):
+            continue
+
+        link = job if job.name == 'a' else company.link.select_one(job)
+        href = link.get('href') if link else None
+        jobs.append({
+            'title': title,
+            'company': company.name,
+            'location': location,
+            'source': f"{company.name} Careers",
+            'url': urljoin(base_url, href) if href else base_url,
+            'date_posted': datetime.now().strftime('%Y-%m-%d'),
+            'is_company_direct': True
+        })
+    return jobs
+
+# Ways a job page marks its application link, best first: (attribute, substring)
+APPLY_LINK_RULES = [
+    ('data-automation', 'job-detail-apply'),
+    ('href', 'apply'),
+    ('href', 'application'),
+    ('class', 'apply-button'),
+    ('id', 'apply-button'),
+    ('class', 'application-btn'),
+    ('class', 'job-apply'),
+    ('class', 'btn-apply'),
+    ('text', 'apply'),
+    ('href', 'job-details')
+]
+
+def find_application_link(html, base_url):
+    """Return the best application link on a job page, or None
+
+    Every ``<a>`` and ``<button>`` is visited once and ranked by the first
+    APPLY_LINK_RULES entry it matches; only absolute http(s) targets count.
+    """
+    soup = html if hasattr(html, 'find_all') else make_soup(html)
+    best_rank, best_url = len(APPLY_LINK_RULES), None
+    for element in soup.find_all(['a', 'button']):
+        target = element.get('href') or element.get('data-href') or element.get('formaction')
+        if not target:
+            continue
+        target = urljoin(base_url, target)
+        if not target.startswith(('http://', 'https://')):
+            continue
+        values = {
+            'href': target.lower(),
+            'class': ' '.join(element.get('class') or []).lower(),
+            'id': (element.get('id') or '').lower(),
+            'data-automation': (element.get('data-automation') or '').lower(),
+            'text': element.get_text(' ', strip=True).lower()
+        }
+        for rank, (attribute, needle) in enumerate(APPLY_LINK_RULES[:best_rank]):
+            if needle in values[attribute]:
+                best_rank, best_url = rank, target
+                break
+        if best_rank == 0:
+            break
+    return best_url
+
+def find_job_posting_ld(soup):
+    """Return the first schema.org JobPosting object in the page's JSON-LD, or None"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except (TypeError, ValueError):
+            continue
+        candidates = data if isinstance(data, list) else [data]
+        for candidate in list(candidates):
+            if isinstance(candidate, dict) and isinstance(candidate.get('@graph'), list):
+                candidates.extend(candidate['@graph'])
+        for candidate in candidates:
+            if isinstance(candidate, dict) and candidate.get('@type') in ('JobPosting', ['JobPosting']):
+                return candidate
+    return None
+
+def format_salary(base_salary):
+    """Render a schema.org MonetaryAmount as text, e.g. 'USD 90000-120000/YEAR'"""
+    if not isinstance(base_salary, dict):
+        return str(base_salary or '')
+    value = base_salary.get('value')
+    if isinstance(value, dict):
+        low, high = value.get('minValue'), value.get('maxValue')
+        amount = f"{low}-{high}" if low and high else str(low or high or value.get('value') or '')
+        unit = value.get('unitText')
+    else:
+        amount, unit = str(value or ''), None
+    text = ' '.join(part for part in (base_salary.get('currency'), amount) if part)
+    return f"{text}/{unit}" if text and unit else text
+
+def extract_job_details(html, source):
+    """Extract description, salary, tags and employment type from a job detail page
+
+    JobPosting JSON-LD is used when present; missing fields come from the
+    source's DETAIL_SELECTORS. Returns only the fields that were found.
+    """
+    soup = make_soup(html)
+    details = {}
+    posting = find_job_posting_ld(soup)
+    if posting:
+        if posting.get('description'):
+            details['description'] = make_soup(posting['description']).get_text(' ', strip=True)
+        if posting.get('baseSalary'):
+            details['salary'] = format_salary(posting['baseSalary'])
+        employment_type = posting.get('employmentType')
+        if employment_type:
+            details['employment_type'] = ', '.join(employment_type) if isinstance(employment_type, list) else str(employment_type)
+        skills = posting.get('skills') or posting.get('keywords')
+        if skills:
+            details['tags'] = ', '.join(skills) if isinstance(skills, list) else str(skills)
+
+    for field, selector in DETAIL_SELECTORS.get(source, {}).items():
+        if not selector or details.get(field):
+            continue
+        if field == 'tags':
+            tags = [element.get_text(strip=True) for element in soup.select(selector)]
+            if tags:
+                details['tags'] = ', '.join(dict.fromkeys(tag for tag in tags if tag))
+        else:
+            element = soup.select_one(selector)
+            if element:
+                details[field] = element.get_text(' ', strip=True)
+
+    if details.get('description'):
+        details['description'] = details['description'][:ENRICH_DESCRIPTION_MAX_CHARS]
+    return details
+
+def parse_page(parser_name, html, keywords=None):
+    """Dispatch an archived page to the parser recorded with it
+
+    Parser names are ``<kind>`` or ``<kind>:<name>`` as written by the
+    scraper when the page was fetched.
+    """
+    kind, _, name = parser_name.partition(':')
+    keyword = keywords[0] if keywords else None
+    sources = current_sources()
+
+    if kind == 'job_board':
+        return parse_job_board(sources.boards[name], html, keyword)
+    if kind == 'weworkremotely':
+        return parse_weworkremotely(html, keyword)
+    if kind == 'remoteok':
+        return parse_remote_ok(html, keyword)
+    if kind == 'remotive':
+        return parse_remotive(html, keyword)
+    if kind == 'feed':
+        return tag_feed_jobs(parse_feed(name, html), keywords or sources.keywords)
+    if kind == 'ats':
+        # ats:<ats kind>:<company>
+        ats_kind, _, company = name.partition(':')
+        return tag_feed_jobs(parse_ats(ats_kind, html, company), keywords or sources.keywords)
+    if kind == 'company_search':
+        return parse_company_listing(sources.companies[name], html)
+    if kind == 'company_jobs':
+        return parse_company_listing(sources.companies[name], html, remote_terms=['remote'])
+    if kind == 'career_page':
+        if not keywords:
+            # Fetched over HTTP once for all keywords (get_static_entries): tag it like add_entries does
+            jobs = parse_company_listing(sources.companies[name], html, remote_terms=None)
+            return tag_feed_jobs([(job, job['title']) for job in jobs], sources.keywords)
+        # Rendered in the browser for the run's keywords: tag each job like scrape_company_career_pages does
+        jobs = parse_company_listing(sources.companies[name], html, keywords=keywords, remote_terms=None)
+        for job in jobs:
+            job['keyword'] = next((keyword for keyword in keywords or () if keyword.lower() in job['title'].lower()), None)
+        return jobs
+
+    raise ValueError(f"Unknown parser: {parser_name}")
@@ -0,0 +1,116 @@
+import queue
+import time
+import hashlib
+import threading
+from collections import defaultdict
+from config import PIPELINE_QUEUE_SIZE, PIPELINE_BATCH_SIZE, PIPELINE_FLUSH_SECONDS
+from logging_config import logger, log_and_print
+from metrics import metrics
+
+def normalize_job(job, keyword=None):
+    """Normalize stage: tidy text fields and fill in what every store expects (in place)"""
+    for field in ('title', 'company', 'location'):
+        if isinstance(job.get(field), str):
+            job[field] = ' '.join(job[field].split())
+    if isinstance(job.get('url'), str):
+        job['url'] = job['url'].strip()
+    if 'date' in job and not job.get('date_posted'):
+        job['date_posted'] = job.pop('date')
+    if keyword and not job.get('keyword'):
+        job['keyword'] = keyword
+    return job
+
+def job_key(job):
+    """Dedup stage key: an 8-byte digest of title and company, so the seen set stays small"""
+    text = f"{job['title'].lower()}|{job['company'].lower()}"
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class JobWriter:
+    """Write stage of the scrape pipeline: a bounded queue drained by one writer thread
+
+    ``put`` blocks while PIPELINE_QUEUE_SIZE jobs are waiting, so a slow
+    store holds back the stages feeding it instead of letting jobs pile up in
+    memory. The writer groups jobs by keyword and calls ``write(keyword, jobs)``
+    once PIPELINE_BATCH_SIZE jobs are pending or PIPELINE_FLUSH_SECONDS have
+    passed; ``on_batch(jobs)`` is then called with every written batch.
+    """
+
+    def __init__(self, write=None, on_batch=None, queue_size=PIPELINE_QUEUE_SIZE,
+                 batch_size=PIPELINE_BATCH_SIZE, flush_seconds=PIPELINE_FLUSH_SECONDS):
+        self.write = write
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.written = 0
+        self._closed = False
+        self._lock = threading.Lock()  # Orders flush requests before the stop message
+        self._thread = threading.Thread(target=self._run, name='job-writer', daemon=True)
+        self._thread.start()
+
+    def put(self, job):
+        """Queue a job for writing, waiting while the queue is full"""
+        start = time.perf_counter()
+        self.queue.put(('job', job))
+        metrics.observe('scraper_pipeline_wait_seconds', time.perf_counter() - start)
+
+    def flush(self):
+        """Block until every job queued so far has been written; returns at once after close()"""
+        done = threading.Event()
+        with self._lock:
+            if self._closed:
+                return  # close() already wrote everything and the writer thread is gone
+            self.queue.put(('flush', done))
+        done.wait()
+
+    def close(self):
+        """Write what is left and stop the writer thread"""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self.queue.put(('stop', None))
+        self._thread.join()
+
+    def _run(self):
+        pending = []
+        deadline = None
+        while True:
+            try:
+                kind, payload = self.queue.get(timeout=max(0, deadline - time.monotonic()) if pending else None)
+            except queue.Empty:
+                kind, payload = 'timeout', None
+            if kind == 'job':
+                if not pending:
+                    deadline = time.monotonic() + self.flush_seconds
+                pending.append(payload)
+                if len(pending) < self.batch_size:
+                    continue
+            self._write_batch(pending)
+            pending = []
+            if kind == 'flush':
+                payload.set()
+            elif kind == 'stop':
+                return
+
+    def _write_batch(self, jobs):
+        if not jobs:
+            return
+        if self.write:
+            by_keyword = defaultdict(list)
+            for job in jobs:
+                by_keyword[job.get('keyword')].append(job)
+            for keyword, batch in by_keyword.items():
+                if not keyword:
+                    logger.debug("Not storing %d jobs without a keyword", len(batch))
+                    continue
+                try:
+                    self.write(keyword, batch)
+                except Exception as e:
+                    log_and_print(f"Error writing {len(batch)} jobs for '{keyword}': {str(e)}", "error", e)
+        self.written += len(jobs)
+        metrics.inc('scraper_pipeline_batches_total')
+        if self.on_batch:
+            try:
+                self.on_batch(jobs)
+            except Exception as e:
+                log_and_print(f"Error handing on written jobs: {str(e)}", "error", e)
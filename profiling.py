@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+import threading
+import functools
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from config import PROFILE_DIRECTORY, PROFILE_SAMPLE_INTERVAL, PROFILE_TOP_ALLOCATIONS
+from logging_config import log_and_print
+
+# Active profiler; None means profiling is off and @profiled stages run untouched
+_profiler = None
+
+class StageProfiler:
+    """Per-stage cProfile, stack sampling and tracemalloc profiling for one run
+
+    Each stage gets its own accumulated cProfile (``<stage>.pstats``), folded
+    stacks from a background sampler (``<stage>.folded``, usable with
+    flamegraph.pl or speedscope) and the top allocation sites grown while the
+    stage was running (``<stage>_allocations.txt``).
+    """
+
+    def __init__(self, run_dir, sample_interval=PROFILE_SAMPLE_INTERVAL, top_allocations=PROFILE_TOP_ALLOCATIONS):
+        self.run_dir = run_dir
+        self.sample_interval = sample_interval
+        self.top_allocations = top_allocations
+        self._profiles = {}
+        self._samples = {}
+        self._allocations = {}
+        self._wall_times = Counter()
+        self._calls = Counter()
+        self._active = {}  # thread id -> stage name
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._new_profile = None
+
+    def start(self):
+        import cProfile
+        
+        self._new_profile = cProfile.Profile
+        os.makedirs(self.run_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)  # Only the allocating line is reported
+        self._sampler = threading.Thread(target=self._sample_loop, name='stage-sampler', daemon=True)
+        self._sampler.start()
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.sample_interval):
+            with self._lock:
+                active = dict(self._active)
+            if not active:
+                continue
+            frames = sys._current_frames()
+            for thread_id, stage in active.items():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    if code.co_filename == __file__:
+                        break  # Stop at the @profiled wrapper
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                folded = ';'.join([stage] + stack[::-1])
+                with self._lock:
+                    self._samples.setdefault(stage, Counter())[folded] += 1
+
+    def run(self, stage, func, *args, **kwargs):
+        """Call ``func`` with profiling attributed to ``stage``"""
+        thread_id = threading.get_ident()
+        with self._lock:
+            nested = thread_id in self._active
+            if not nested:
+                self._active[thread_id] = stage
+                profile = self._profiles.setdefault(stage, self._new_profile())
+        if nested:
+            # The outer stage already covers this call
+            return func(*args, **kwargs)
+
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError:
+            profile = None  # Another profiler is already active on this thread
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profile:
+                profile.disable()
+            elapsed = time.perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            growth = self._allocations.setdefault(stage, Counter())
+            for stat in after.compare_to(before, 'lineno'):
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    growth[f"{frame.filename}:{frame.lineno}"] += stat.size_diff
+            with self._lock:
+                del self._active[thread_id]
+                self._wall_times[stage] += elapsed
+                self._calls[stage] += 1
+
+    def finish(self):
+        """Stop sampling and write all per-stage output to the run directory"""
+        import pstats
+        
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+        tracemalloc.stop()
+
+        summary = [f"{'stage':<40} {'calls':>6} {'wall s':>10}"]
+        for stage, seconds in self._wall_times.most_common():
+            summary.append(f"{stage:<40} {self._calls[stage]:>6} {seconds:>10.3f}")
+
+            stats = pstats.Stats(self._profiles[stage])
+            stats.dump_stats(os.path.join(self.run_dir, f"{stage}.pstats"))
+
+            with open(os.path.join(self.run_dir, f"{stage}.folded"), 'w', encoding='utf-8') as f:
+                for stack, count in self._samples.get(stage, Counter()).most_common():
+                    f.write(f"{stack} {count}\n")
+
+            with open(os.path.join(self.run_dir, f"{stage}_allocations.txt"), 'w', encoding='utf-8') as f:
+                for site, size in self._allocations.get(stage, Counter()).most_common(self.top_allocations):
+                    f.write(f"{size / 1024:>12.1f} KiB  {site}\n")
+
+        with open(os.path.join(self.run_dir, 'summary.txt'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(summary) + '\n')
+        log_and_print(f"Profile written to {self.run_dir}")
+        return self.run_dir
+
+def enable_profiling(directory=PROFILE_DIRECTORY):
+    """Start profiling @profiled stages and return the run directory"""
+    global _profiler
+    if _profiler is not None:
+        return _profiler.run_dir
+    run_dir = os.path.join(directory, f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    _profiler = StageProfiler(run_dir)
+    _profiler.start()
+    log_and_print(f"Profiling enabled, writing to {run_dir}")
+    return run_dir
+
+def finish_profiling():
+    """Stop profiling and write the results; returns the run directory or None"""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is None:
+        return None
+    return profiler.finish()
+
+def profiled(stage):
+    """Decorator marking a scraper method as a profiling stage
+
+    When profiling is off the wrapper only checks a module global before
+    calling straight through.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+            return profiler.run(stage, func, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,188 @@
+import os
+import re
+import csv
+import json
+import gzip
+from datetime import datetime, timedelta
+from config import OUTPUT_DIRECTORY, RETENTION_MAX_SNAPSHOTS, RETENTION_SNAPSHOT_MAX_AGE_DAYS, RETENTION_EXPIRE_AFTER_DAYS
+from logging_config import log_and_print
+from metrics import metrics
+
+# Per-run files: legacy <name>_jobs_<stamp>.csv/.json pairs and <keyword>_changes_<stamp>.jsonl deltas
+SNAPSHOT_PATTERN = re.compile(r'^(?P<name>.+?)_(?:jobs_|changes_)?(?P<stamp>\d{8}_\d{6})\.(?P<ext>csv|json|jsonl)$')
+STATE_FILENAME = 'retention.json'
+
+def history_path(directory, name):
+    return os.path.join(directory, f"{name}_history.jsonl.gz")
+
+def read_snapshot(path):
+    """Yield the job records of a snapshot file"""
+    if path.endswith('.csv'):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    elif path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                yield from json.load(f)
+            except json.JSONDecodeError:
+                return
+
+def append_history(path, records):
+    """Append records to a gzip JSON-lines history (each call adds one gzip member)"""
+    count = 0
+    with gzip.open(path, 'at', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+def compact_snapshots(directory, max_snapshots, max_age, now):
+    """Merge per-run files beyond the newest ``max_snapshots`` (or older than ``max_age``) into history
+
+    Returns ``(snapshots merged, records merged, bytes freed)``.
+    """
+    runs = {}
+    for filename in os.listdir(directory):
+        match = SNAPSHOT_PATTERN.match(filename)
+        if match:
+            runs.setdefault((match['name'], match['stamp']), []).append(filename)
+
+    merged = records = freed = 0
+    by_name = {}
+    for name, stamp in runs:
+        by_name.setdefault(name, []).append(stamp)
+    for name, stamps in by_name.items():
+        stamps.sort(reverse=True)
+        # export --changes reads the newest delta, even when a legacy snapshot is newer
+        latest_delta = next((stamp for stamp in stamps if any(filename.endswith('.jsonl') for filename in runs[(name, stamp)])), None)
+        for position, stamp in enumerate(stamps):
+            taken_at = datetime.strptime(stamp, '%Y%m%d_%H%M%S')
+            if position == 0 or stamp == latest_delta or (position < max_snapshots and now - taken_at <= max_age):
+                continue  # The newest run and the latest delta are always kept
+            filenames = runs[(name, stamp)]
+            # A legacy CSV/JSON pair holds the same jobs twice; the JSON copy is enough
+            sources = [filename for filename in filenames if not (filename.endswith('.csv') and filename[:-4] + '.json' in filenames)]
+            for filename in sorted(sources):
+                kind = 'changes' if filename.endswith('.jsonl') else 'jobs'
+                snapshot = dict(snapshot=stamp, snapshot_kind=kind)
+                records += append_history(history_path(directory, name),
+                                          (dict(record, **snapshot) for record in read_snapshot(os.path.join(directory, filename))))
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                freed += os.path.getsize(path)
+                os.remove(path)
+            merged += 1
+    return merged, records, freed
+
+def expire_postings(directory, keyword, cutoff, scan_master):
+    """Drop postings not seen since ``cutoff`` from a keyword's results and change index
+
+    Expiry is decided from the change index, so the result files are only
+    rewritten when something expired, or once (``scan_master``) to expire
+    results stored before the index existed, by their last_updated stamp.
+    Returns the number of postings moved to history.
+    """
+    from changes import index_path
+
+    keyword_dir = os.path.join(directory, keyword)
+    stamp = cutoff.strftime('%Y-%m-%d %H:%M:%S')
+    index = {}
+    path = index_path(directory, keyword)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    expired = {key for key, entry in index.items() if entry[2] < stamp}
+    if not expired and not scan_master:
+        return 0
+
+    json_filename = os.path.join(keyword_dir, f"{keyword}_jobs.json")
+    csv_filename = os.path.join(keyword_dir, f"{keyword}_jobs.csv")
+    kept, dropped = [], []
+    if os.path.exists(json_filename):
+        with open(json_filename, 'r', encoding='utf-8') as f:
+            try:
+                jobs = json.load(f)
+            except json.JSONDecodeError:
+                jobs = []
+        for job in jobs:
+            key = job.get('url') or f"{job.get('title', '').lower()}|{job.get('company', '').lower()}"
+            if key in expired or (key not in index and (job.get('last_updated') or '') < stamp):
+                dropped.append(job)
+            else:
+                kept.append(job)
+
+    expired_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if dropped:
+        append_history(history_path(keyword_dir, keyword), (dict(job, expired_at=expired_at) for job in dropped))
+        with open(json_filename + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(kept, f, indent=2)
+        os.replace(json_filename + '.tmp', json_filename)
+        if os.path.exists(csv_filename):
+            import pandas as pd
+            dropped_urls = {job.get('url') for job in dropped}
+            df = pd.read_csv(csv_filename)
+            if 'url' in df.columns:
+                df[~df['url'].isin(dropped_urls)].to_csv(csv_filename, index=False)
+
+    if expired:
+        for key in expired:
+            del index[key]
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+    return len(dropped)
+
+def apply_retention(directory=OUTPUT_DIRECTORY, max_snapshots=RETENTION_MAX_SNAPSHOTS,
+                    snapshot_max_age_days=RETENTION_SNAPSHOT_MAX_AGE_DAYS, expire_after_days=RETENTION_EXPIRE_AFTER_DAYS):
+    """Compact old per-run files and expire stale postings in every keyword directory
+
+    Each pass only touches files past the limits and postings the change
+    index reports as stale, so it stays cheap however much history exists.
+    Returns totals for logging.
+    """
+    if not os.path.isdir(directory):
+        return {}
+    now = datetime.now()
+    max_age = timedelta(days=snapshot_max_age_days)
+    cutoff = now - timedelta(days=expire_after_days)
+    state_path = os.path.join(directory, STATE_FILENAME)
+    state = {}
+    if os.path.exists(state_path):
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            state = {}
+
+    totals = {'snapshots': 0, 'records': 0, 'bytes_freed': 0, 'expired': 0}
+    with metrics.timer('scraper_retention_seconds'):
+        directories = [('', directory)] + [(name, os.path.join(directory, name)) for name in sorted(os.listdir(directory))
+                                           if os.path.isdir(os.path.join(directory, name))]
+        for keyword, path in directories:
+            try:
+                merged, records, freed = compact_snapshots(path, max_snapshots, max_age, now)
+                totals['snapshots'] += merged
+                totals['records'] += records
+                totals['bytes_freed'] += freed
+                if keyword:
+                    scanned = state.get(keyword, {}).get('master_scanned', False)
+                    totals['expired'] += expire_postings(directory, keyword, cutoff, scan_master=not scanned)
+                    state[keyword] = {'master_scanned': True, 'checked_at': now.isoformat()}
+            except Exception as e:
+                log_and_print(f"Error applying retention to {path}: {str(e)}", "error", e)
+
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    if totals['snapshots'] or totals['expired']:
+        log_and_print(
+            f"Retention: merged {totals['snapshots']} snapshots ({totals['records']} records, "
+            f"{totals['bytes_freed'] / 1024 / 1024:.1f} MB freed) into history, expired {totals['expired']} postings"
+        )
+    return totals
@@ -0,0 +1,50 @@
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+
+class SiteRegistry:
+    """Small JSON file remembering a per-site decision with a re-check interval
+
+    Used for which ATS a careers page is backed by, whether a page can be
+    read without a browser and resolved application links. A value older
+    than ``ttl_days`` is still returned but reported as not known, so the
+    caller probes the site again.
+    """
+
+    def __init__(self, path, ttl_days):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+
+    def lookup(self, site):
+        """Return ``(known, value)``; ``known`` is False when the site needs (re)checking"""
+        entry = self._entries.get(site)
+        if not entry:
+            return False, None
+        if datetime.now() - datetime.fromisoformat(entry['checked_at']) > self.ttl:
+            return False, entry['value']
+        return True, entry['value']
+
+    def record(self, site, value, persist=True):
+        """Store a decision for a site; pass ``persist=False`` when recording a batch and call save()"""
+        with self._lock:
+            self._entries[site] = {'value': value, 'checked_at': datetime.now().isoformat()}
+        if persist:
+            self.save()
+
+    def save(self):
+        """Write the registry to disk"""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
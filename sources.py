@@ -0,0 +1,273 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from urllib.parse import quote, urlparse
+from config import DELAY_BETWEEN_REQUESTS, CONFIG_RELOAD_SECONDS
+from logging_config import log_and_print
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.py')
+
+BOARD_KEYS = {'enabled', 'feed', 'base_url', 'job_selector', 'title_selector', 'company_selector',
+              'location_selector', 'date_selector', 'delay'}
+BOARD_REQUIRED = ('base_url', 'job_selector', 'title_selector', 'company_selector')
+COMPANY_KEYS = {'name', 'url', 'ats', 'search_selector', 'job_selector', 'title_selector',
+                'location_selector', 'link_selector', 'delay'}
+COMPANY_REQUIRED = ('url', 'job_selector', 'title_selector')
+COMPANY_DEFAULTS = {'location_selector': '.location', 'link_selector': 'a'}
+
+class ConfigError(ValueError):
+    """Raised when the source configuration is invalid; ``problems`` lists every issue found"""
+
+    def __init__(self, problems):
+        super().__init__('; '.join(problems))
+        self.problems = problems
+
+@dataclass(frozen=True)
+class Selector:
+    """A CSS selector compiled once with soupsieve; ``css`` is kept for the browser"""
+    css: str
+    compiled: object = field(repr=False, compare=False)
+
+    def select(self, tag):
+        return self.compiled.select(tag)
+
+    def select_one(self, tag):
+        return self.compiled.select_one(tag)
+
+@dataclass(frozen=True)
+class BoardSource:
+    name: str
+    enabled: bool
+    feed: str
+    search_url: str  # template with a {keyword} placeholder
+    job: Selector
+    title: Selector
+    company: Selector
+    location: Selector
+    date: Selector
+    delay: float
+
+    def url_for(self, keyword):
+        return self.search_url.format(keyword=quote(keyword))
+
+@dataclass(frozen=True)
+class CompanySource:
+    name: str
+    url: str
+    ats: str
+    search_selector: str  # only used in the browser
+    job: Selector
+    title: Selector
+    location: Selector
+    link: Selector
+    delay: float
+
+@dataclass(frozen=True)
+class Sources:
+    """Immutable, validated snapshot of every scrape source in config.py"""
+    keywords: tuple
+    boards: MappingProxyType
+    feeds: MappingProxyType  # feed name -> URL
+    companies: MappingProxyType  # one definition per company name
+    remote_companies: tuple  # names, in config order
+    tech_companies: tuple
+    career_pages: tuple
+    loaded_at: str
+
+def compile_selector(css):
+    import soupsieve
+    return Selector(css, soupsieve.compile(css))
+
+def compile_sources(namespace):
+    """Validate the source settings of a config namespace and compile them into Sources
+
+    Collects every problem before raising ConfigError, so one reload
+    reports all mistakes at once. A company listed in several of
+    REMOTE_COMPANIES, TECH_COMPANIES and COMPANY_CAREER_PAGES is merged into
+    one definition; settings given in more than one place must agree.
+    """
+    from ats import ATS_ENDPOINTS
+
+    problems = []
+
+    def selector(where, css):
+        if not isinstance(css, str) or not css.strip():
+            problems.append(f"{where}: selector must be a non-empty string")
+            return None
+        try:
+            return compile_selector(css)
+        except Exception as e:
+            problems.append(f"{where}: invalid selector {css!r} ({e})")
+            return None
+
+    def check_url(where, url):
+        parts = urlparse(url) if isinstance(url, str) else None
+        if not parts or parts.scheme not in ('http', 'https') or not parts.netloc:
+            problems.append(f"{where}: {url!r} is not an http(s) URL")
+
+    def check_delay(where, delay):
+        if not isinstance(delay, (int, float)) or delay < 0:
+            problems.append(f"{where}: delay must be a non-negative number")
+
+    keywords = namespace.get('KEYWORDS', [])
+    if not keywords or not all(isinstance(keyword, str) and keyword.strip() for keyword in keywords):
+        problems.append("KEYWORDS: must be a non-empty list of strings")
+
+    feeds = {}
+    for name, feed in namespace.get('JOB_FEEDS', {}).items():
+        check_url(f"JOB_FEEDS[{name!r}]", feed.get('url'))
+        feeds[name] = feed.get('url')
+
+    boards = {}
+    for name, board in namespace.get('JOB_BOARDS', {}).items():
+        where = f"JOB_BOARDS[{name!r}]"
+        problems.extend(f"{where}: unknown setting {key!r}" for key in sorted(set(board) - BOARD_KEYS))
+        problems.extend(f"{where}: missing {key!r}" for key in BOARD_REQUIRED if key not in board)
+        if board.get('feed') and board['feed'] not in feeds:
+            problems.append(f"{where}: feed {board['feed']!r} is not in JOB_FEEDS")
+        check_url(where, board.get('base_url'))
+        check_delay(where, board.get('delay', DELAY_BETWEEN_REQUESTS))
+        boards[name] = BoardSource(
+            name=name,
+            enabled=bool(board.get('enabled', True)),
+            feed=board.get('feed'),
+            search_url=str(board.get('base_url', '')).replace('{', '{{').replace('}', '}}') + '{keyword}',
+            job=selector(f"{where} job_selector", board.get('job_selector')),
+            title=selector(f"{where} title_selector", board.get('title_selector')),
+            company=selector(f"{where} company_selector", board.get('company_selector')),
+            location=selector(f"{where} location_selector", board.get('location_selector', '.location')),
+            date=selector(f"{where} date_selector", board.get('date_selector', 'time')),
+            delay=board.get('delay', DELAY_BETWEEN_REQUESTS)
+        )
+
+    # Merge the three company lists into one definition per company
+    merged, groups = {}, {'remote': [], 'tech': [], 'career_page': []}
+    listed = [('REMOTE_COMPANIES', 'remote', name, company) for name, company in namespace.get('REMOTE_COMPANIES', {}).items()]
+    listed += [('TECH_COMPANIES', 'tech', name, company) for name, company in namespace.get('TECH_COMPANIES', {}).items()]
+    listed += [('COMPANY_CAREER_PAGES', 'career_page', company.get('name'), company) for company in namespace.get('COMPANY_CAREER_PAGES', [])]
+    for setting, group, name, company in listed:
+        where = f"{setting}[{name!r}]"
+        if not name:
+            problems.append(f"{setting}: every entry needs a 'name'")
+            continue
+        problems.extend(f"{where}: unknown setting {key!r}" for key in sorted(set(company) - COMPANY_KEYS))
+        if group in ('remote', 'tech') and 'search_selector' not in company:
+            problems.append(f"{where}: missing 'search_selector'")
+        settings = merged.setdefault(name, {})
+        for key, value in company.items():
+            if key != 'name' and key in settings and settings[key] != value:
+                problems.append(f"{where}: {key} {value!r} conflicts with {settings[key]!r} set elsewhere for {name}")
+            settings.setdefault(key, value)
+        groups[group].append(name)
+
+    companies = {}
+    for name, settings in merged.items():
+        where = f"company {name!r}"
+        settings = {**COMPANY_DEFAULTS, **settings}
+        problems.extend(f"{where}: missing {key!r}" for key in COMPANY_REQUIRED if key not in settings)
+        check_url(where, settings.get('url'))
+        check_delay(where, settings.get('delay', DELAY_BETWEEN_REQUESTS))
+        ats = settings.get('ats')
+        if ats and (':' not in ats or ats.partition(':')[0] not in ATS_ENDPOINTS or not ats.partition(':')[2]):
+            problems.append(f"{where}: ats {ats!r} must be '<{'|'.join(ATS_ENDPOINTS)}>:<board token>'")
+        companies[name] = CompanySource(
+            name=name,
+            url=settings.get('url'),
+            ats=ats,
+            search_selector=settings.get('search_selector'),
+            job=selector(f"{where} job_selector", settings.get('job_selector')),
+            title=selector(f"{where} title_selector", settings.get('title_selector')),
+            location=selector(f"{where} location_selector", settings['location_selector']),
+            link=selector(f"{where} link_selector", settings['link_selector']),
+            delay=settings.get('delay', DELAY_BETWEEN_REQUESTS)
+        )
+
+    if problems:
+        raise ConfigError(problems)
+    return Sources(
+        keywords=tuple(keywords),
+        boards=MappingProxyType(boards),
+        feeds=MappingProxyType(feeds),
+        companies=MappingProxyType(companies),
+        remote_companies=tuple(groups['remote']),
+        tech_companies=tuple(groups['tech']),
+        career_pages=tuple(groups['career_page']),
+        loaded_at=datetime.now().isoformat()
+    )
+
+_current = None
+_lock = threading.Lock()
+
+def current_sources():
+    """Return the active Sources, compiling the imported config on first use"""
+    global _current
+    if _current is None:
+        import config
+        with _lock:
+            if _current is None:
+                _current = compile_sources(vars(config))
+    return _current
+
+def install_sources(sources):
+    """Make ``sources`` the active Sources (e.g. ones compiled from a namespace other than config.py)"""
+    global _current
+    _current = sources  # One reference swap: readers see the old or the new snapshot, never a mix
+    return sources
+
+def reload_sources(path=CONFIG_PATH):
+    """Re-read config.py and swap in its sources; raises ConfigError and keeps the old ones if invalid"""
+    import runpy
+    return install_sources(compile_sources(runpy.run_path(path)))
+
+class ConfigWatcher:
+    """Polls config.py and hot-reloads the scrape sources when it changes
+
+    Only the source definitions (keywords, boards, feeds, companies) are
+    reloaded; running scrapers pick them up at their next keyword, keeping
+    their browser, HTTP connections and worker processes.
+    """
+
+    def __init__(self, path=CONFIG_PATH, interval=CONFIG_RELOAD_SECONDS):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._mtime = self._stat()
+        self._thread = threading.Thread(target=self._run, name='config-watcher', daemon=True)
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def check(self):
+        """Reload if the file changed since the last check; returns True when new sources were swapped in"""
+        mtime = self._stat()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            sources = reload_sources(self.path)
+        except ConfigError as e:
+            log_and_print(f"Config change ignored, keeping the previous sources: {len(e.problems)} problem(s)", "warning")
+            for problem in e.problems:
+                log_and_print(f"  {problem}", "warning")
+            return False
+        except Exception as e:
+            log_and_print(f"Config change ignored, could not load {self.path}: {str(e)}", "error", e)
+            return False
+        log_and_print(f"Reloaded config: {len(sources.boards)} boards, {len(sources.companies)} companies, {len(sources.keywords)} keywords")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
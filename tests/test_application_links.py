@@ -0,0 +1,46 @@
+import main
+from site_registry import SiteRegistry
+
+GOOD = 'https://example.com/jobs/1'
+NO_LINK = 'https://example.com/jobs/2'
+DOWN = 'https://example.com/jobs/3'
+
+
+class StubScraper(main.RemoteJobScraper):
+    """Scraper with canned page results instead of HTTP and Chrome"""
+
+    def __init__(self, registry, http, browser=None):
+        self.application_links = registry
+        self.http = http
+        self.browser = browser or {}
+
+    def find_application_link_http(self, job_url):
+        return self.http[job_url]
+
+    def find_application_link_browser(self, job_url):
+        return self.browser.get(job_url)
+
+
+def test_fetch_errors_are_not_cached(tmp_path):
+    registry = SiteRegistry(str(tmp_path / 'application_links.json'), 14)
+    scraper = StubScraper(registry, {GOOD: 'https://boards.example.com/apply/1', NO_LINK: '', DOWN: None})
+
+    links = scraper.resolve_application_links([GOOD, NO_LINK, DOWN], workers=2, browser_fallback=False)
+
+    assert links == {GOOD: 'https://boards.example.com/apply/1', NO_LINK: NO_LINK, DOWN: DOWN}
+    assert registry.lookup(GOOD) == (True, 'https://boards.example.com/apply/1')
+    assert registry.lookup(NO_LINK) == (True, NO_LINK)  # Loaded without a link: a real answer
+    assert registry.lookup(DOWN) == (False, None)
+
+
+def test_failed_render_is_not_cached(tmp_path):
+    registry = SiteRegistry(str(tmp_path / 'application_links.json'), 14)
+    # Both pages have no link in their HTML; only the first renders
+    scraper = StubScraper(registry, {GOOD: '', NO_LINK: ''},
+                          browser={GOOD: 'https://boards.example.com/apply/1', NO_LINK: None})
+
+    links = scraper.resolve_application_links([GOOD, NO_LINK], workers=1, browser_fallback=True)
+
+    assert links[NO_LINK] == NO_LINK
+    assert registry.lookup(GOOD) == (True, 'https://boards.example.com/apply/1')
+    assert registry.lookup(NO_LINK) == (False, None)
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+import main
+from ats import ats_endpoint, detect_ats
+from parse_pool import ParsePool
+from parsers import parse_ashby, parse_ats, parse_greenhouse, parse_lever, parse_workable
+from site_registry import SiteRegistry
+from sources import current_sources
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def test_greenhouse_board():
+    entries = parse_greenhouse(read_fixture('greenhouse_jobs.json'), 'GitLab')
+
+    job, text = entries[0]
+    assert job == {
+        'title': 'Senior Backend Engineer, Python',
+        'company': 'GitLab',
+        'location': 'Remote, EMEA',
+        'source': 'GitLab Careers',
+        'url': 'https://boards.greenhouse.io/gitlab/jobs/7654321',
+        'date_posted': '2024-10-02',  # First published, not last updated
+        'is_company_direct': True
+    }
+    assert text == 'Senior Backend Engineer, Python Engineering Data Platform'
+    job, _ = entries[1]
+    assert (job['location'], job['date_posted']) == ('Unknown', '2024-10-15')
+
+
+def test_lever_postings_mark_remote_workplaces():
+    entries = parse_lever(read_fixture('lever_postings.json'), 'Netlify')
+
+    remote, text = entries[0]
+    assert remote['location'] == 'Remote - United States'
+    assert remote['date_posted'] == '2024-10-15'
+    assert remote['url'].startswith('https://jobs.lever.co/netlify/')
+    assert text == 'Frontend Engineer (React) Web Platform Engineering'
+    office, _ = entries[1]
+    assert (office['location'], office['date_posted']) == ('San Francisco', '')
+
+
+def test_ashby_board_skips_unlisted_jobs():
+    entries = parse_ashby(read_fixture('ashby_job_board.json'), 'Linear')
+
+    assert [job['title'] for job, _ in entries] == ['Machine Learning Engineer', 'Product Designer']
+    ml, text = entries[0]
+    assert ml['location'] == 'Remote (US)'  # Already says remote
+    assert ml['date_posted'] == '2024-10-10'
+    assert text == 'Machine Learning Engineer Research Applied AI'
+    assert entries[1][0]['location'] == 'London'
+
+
+def test_workable_widget_builds_locations_and_falls_back_to_shortlink():
+    entries = parse_workable(read_fixture('workable_widget.json'), 'Hotjar')
+
+    developer, text = entries[0]
+    assert developer['location'] == 'Remote - Malta'
+    assert developer['date_posted'] == '2024-10-11'
+    assert text == 'Full-Stack Developer Engineering Software Development'
+    manager, _ = entries[1]
+    assert manager['location'] == 'Barcelona, Spain'
+    assert manager['url'] == 'https://apply.workable.com/j/F6G7H8I9J0'
+    assert manager['date_posted'] == '2024-10-01'
+
+
+def test_parse_ats_dispatches_by_kind():
+    assert parse_ats('lever', read_fixture('lever_postings.json'), 'Netlify') == \
+        parse_lever(read_fixture('lever_postings.json'), 'Netlify')
+
+
+def test_detects_the_most_specific_ats_link():
+    # The page also links an old Lever board; the Greenhouse embed wins
+    assert detect_ats(read_fixture('careers_greenhouse_embed.html')) == 'greenhouse:acme-corp'
+
+
+@pytest.mark.parametrize('html, expected', [
+    ('<a href="https://job-boards.greenhouse.io/figma/jobs/123">Apply</a>', 'greenhouse:figma'),
+    ('<a href="https://boards.eu.greenhouse.io/n26">Jobs</a>', 'greenhouse:n26'),
+    ('<iframe src="https://jobs.eu.lever.co/mistral.ai"></iframe>', 'lever:mistral.ai'),
+    ('<a href="https://jobs.ashbyhq.com/Linear">Open roles</a>', 'ashby:Linear'),
+    ('<script src="https://apply.workable.com/api/v1/widget"></script>'
+     '<a href="https://apply.workable.com/hotjar/">Careers</a>', 'workable:hotjar'),
+    ('<p>Email jobs@example.com</p>', None),
+])
+def test_detect_ats(html, expected):
+    assert detect_ats(html) == expected
+
+
+def test_configured_ats_skips_detection(tmp_path):
+    """GitLab sets 'ats': 'greenhouse:gitlab' in config.py, so its careers page is never probed"""
+    company = current_sources().companies['GitLab']
+    assert company.ats == 'greenhouse:gitlab'
+
+    fetched = []
+
+    class FakeResponse:
+        content = read_fixture('greenhouse_jobs.json')
+
+        def raise_for_status(self):
+            pass
+
+    scraper = main.RemoteJobScraper.__new__(main.RemoteJobScraper)
+    scraper.feed_entries = {}
+    scraper.parse_pool = ParsePool(workers=1)
+    scraper.ats_registry = SiteRegistry(str(tmp_path / 'ats.json'), 7)
+    scraper.fetch_page = lambda url, parser: fetched.append((url, parser)) or FakeResponse()
+    scraper.detect_company_ats = lambda *args: pytest.fail("careers page probed despite the configured ATS")
+
+    entries = scraper.get_ats_entries(company)
+
+    assert fetched == [('https://boards-api.greenhouse.io/v1/boards/gitlab/jobs', 'ats:greenhouse:GitLab')]
+    assert fetched[0][0] == ats_endpoint('greenhouse:gitlab')
+    assert [job['title'] for job, _ in entries] == ['Senior Backend Engineer, Python', 'Paid Social Manager']
@@ -0,0 +1,67 @@
+import os
+import json
+
+from changes import ChangeTracker, iter_changes, latest_changes_file
+
+
+def job(number, salary=''):
+    return {'title': f"Python Developer {number}", 'company': 'Acme', 'url': f"https://example.com/jobs/{number}",
+            'salary': salary, 'keyword': 'python'}
+
+
+def run(tracker, jobs):
+    """One simulated run: classify in two batches, then finish the keyword"""
+    tracker.start_run()
+    new, changed, unchanged = tracker.classify('python', jobs[:1])
+    more = tracker.classify('python', jobs[1:])
+    new, changed, unchanged = new + more[0], changed + more[1], unchanged + more[2]
+    # The stored results must exist for the index to be trusted on the next run
+    with open(os.path.join(tracker.directory, 'python', 'python_jobs.json'), 'w', encoding='utf-8') as f:
+        f.write('[]')
+    counts = tracker.finish('python')
+    return [j['url'][-1] for j in new], [j['url'][-1] for j in changed], counts
+
+
+def test_new_changed_and_removed_over_three_runs(tmp_path):
+    tracker = ChangeTracker(str(tmp_path), removed_after=2)
+
+    new, changed, counts = run(tracker, [job(1), job(2), job(3)])
+    assert (new, changed) == (['1', '2', '3'], [])
+    first_run = tracker.run_id
+
+    # 2 changes its salary, 3 is missing once (not removed yet), 4 appears
+    new, changed, counts = run(tracker, [job(1), job(2, salary='$120k'), job(4)])
+    assert (new, changed) == (['4'], ['2'])
+    assert (counts['unchanged'], counts['removed']) == (1, 0)
+    assert tracker.run_id != first_run
+
+    # 3 is missing a second time: removed
+    new, changed, counts = run(tracker, [job(1), job(2, salary='$120k'), job(4)])
+    assert (new, changed, counts['unchanged'], counts['removed']) == ([], [], 3, 1)
+
+    removed = list(iter_changes(str(tmp_path), statuses={'removed'}))
+    assert [(record['url'], record['change']) for record in removed] == [('https://example.com/jobs/3', 'removed')]
+
+    # Back after being removed: new again
+    new, _, _ = run(tracker, [job(3)])
+    assert new == ['3']
+
+
+def test_each_run_of_a_reused_tracker_gets_its_own_delta_file(tmp_path):
+    tracker = ChangeTracker(str(tmp_path))
+    run(tracker, [job(1)])
+    first = latest_changes_file(str(tmp_path), 'python')
+    run(tracker, [job(1), job(2)])
+    second = latest_changes_file(str(tmp_path), 'python')
+
+    assert first != second
+    with open(second, encoding='utf-8') as f:
+        assert [json.loads(line)['url'] for line in f] == ['https://example.com/jobs/2']
+
+
+def test_run_jobs_keeps_the_last_version_of_a_job(tmp_path):
+    tracker = ChangeTracker(str(tmp_path))
+    tracker.classify('python', [job(1)])
+    tracker.classify('python', [job(1, salary='$90k')])
+
+    assert tracker.run_jobs('python') == [job(1, salary='$90k')]
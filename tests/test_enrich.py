@@ -0,0 +1,35 @@
+import threading
+
+from enrich import JobEnricher
+from site_registry import SiteRegistry
+
+
+class FakeResponse:
+    content = b'<html></html>'
+
+    def raise_for_status(self):
+        pass
+
+
+def test_stalled_detail_page_does_not_block_the_run(tmp_path):
+    release = threading.Event()
+    done = []
+
+    def fetch(url):
+        if 'stalled' in url:
+            release.wait(10)
+        return FakeResponse()
+
+    enricher = JobEnricher(fetch, lambda html, source: {'salary': '$100k'}, workers=2,
+                           cache=SiteRegistry(str(tmp_path / 'job_details.json'), 30), on_done=done.append)
+    try:
+        enricher.submit({'title': 'Fast', 'url': 'https://fast.example.com/jobs/1'})
+        enricher.submit({'title': 'Stalled', 'url': 'https://stalled.example.com/jobs/2'})
+        enricher.wait(timeout=0.5)
+
+        assert {job['title']: job.get('salary') for job in done} == {'Fast': '$100k', 'Stalled': None}
+    finally:
+        release.set()
+        enricher.close()
+        enricher._executor.shutdown()  # Let the late fetch finish
+    assert len(done) == 2  # The late fetch does not hand the job on a second time
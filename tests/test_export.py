@@ -0,0 +1,124 @@
+import io
+import os
+import csv
+import sys
+import json
+import gzip
+
+import pytest
+
+import main
+from export import EXPORT_COLUMNS, ExportCancelled, detect_compression, detect_format, export_jobs, iter_stored_jobs
+
+JOBS = [
+    {'title': 'Python Developer', 'company': 'Acme', 'url': 'https://example.com/1', 'keyword': 'python',
+     'description': 'Line one\nline two, "quoted"', 'salary': '€90k'},
+    {'title': 'React Engineer', 'company': 'Orbit', 'url': 'https://example.com/2', 'keyword': 'react'},
+]
+
+
+def read_export(path, format_type, compression):
+    if compression == 'gzip':
+        f = gzip.open(path, 'rt', encoding='utf-8', newline='')
+    elif compression == 'zstd':
+        import zstandard
+        f = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')), encoding='utf-8', newline='')
+    else:
+        f = open(path, 'r', encoding='utf-8', newline='')
+    with f:
+        if format_type == 'csv':
+            return list(csv.DictReader(f))
+        if format_type == 'jsonl':
+            return [json.loads(line) for line in f]
+        return json.load(f)
+
+
+@pytest.mark.parametrize('compression', [None, 'gzip', 'zstd'])
+@pytest.mark.parametrize('format_type', ['csv', 'jsonl', 'json'])
+def test_round_trip(tmp_path, format_type, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / f"jobs.{format_type}")
+
+    assert export_jobs(iter(JOBS), path, format_type, compression=compression) == 2
+
+    rows = read_export(path, format_type, compression)
+    assert list(rows[0]) == list(EXPORT_COLUMNS)
+    assert [row['Title'] for row in rows] == ['Python Developer', 'React Engineer']
+    assert rows[0]['Description'] == 'Line one\nline two, "quoted"'
+    assert rows[0]['Salary'] == '€90k'
+    assert rows[1]['Location'] == 'Remote'  # Column default
+
+
+def test_empty_json_export_is_valid(tmp_path):
+    path = str(tmp_path / 'jobs.json')
+    assert export_jobs([], path, 'json') == 0
+    assert read_export(path, 'json', None) == []
+
+
+def test_zstd_without_the_module(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'zstandard', None)  # import zstandard now raises ImportError
+    path = str(tmp_path / 'jobs.csv.zst')
+
+    with pytest.raises(RuntimeError, match='zstandard'):
+        export_jobs(iter(JOBS), path, 'csv', compression='zstd')
+    assert not os.path.exists(path)
+
+
+def test_cancelled_export_removes_the_partial_file(tmp_path, monkeypatch):
+    monkeypatch.setattr('export.EXPORT_PROGRESS_EVERY', 1)
+    path = str(tmp_path / 'jobs.jsonl.gz')
+
+    with pytest.raises(ExportCancelled):
+        export_jobs(iter(JOBS), path, 'jsonl', compression='gzip', progress=lambda written, total: written < 1)
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize('path, format_type, compression', [
+    ('jobs.csv', 'csv', None),
+    ('jobs.JSONL.GZ', 'jsonl', 'gzip'),
+    ('jobs.json.zst', 'json', 'zstd'),
+    ('jobs.txt', None, None),
+])
+def test_format_and_compression_follow_the_file_name(path, format_type, compression):
+    assert (detect_format(path), detect_compression(path)) == (format_type, compression)
+
+
+def store(output_dir, keyword, jobs, changes=None):
+    keyword_dir = output_dir / keyword
+    keyword_dir.mkdir(parents=True)
+    (keyword_dir / f"{keyword}_jobs.json").write_text(json.dumps(jobs), encoding='utf-8')
+    for run_id, records in (changes or {}).items():
+        (keyword_dir / f"{keyword}_changes_{run_id}.jsonl").write_text(
+            ''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+
+
+def test_stored_jobs_are_read_per_keyword(tmp_path):
+    store(tmp_path, 'python', [{'title': 'Python Developer'}])
+    store(tmp_path, 'react', [{'title': 'React Engineer', 'keyword': 'react'}])
+    (tmp_path / 'broken').mkdir()
+    (tmp_path / 'broken' / 'broken_jobs.json').write_text('[{', encoding='utf-8')
+
+    assert [(job['title'], job['keyword']) for job in iter_stored_jobs(str(tmp_path))] == [
+        ('Python Developer', 'python'), ('React Engineer', 'react')
+    ]
+
+
+def test_export_command_filters_by_keyword_and_latest_changes(tmp_path):
+    output_dir = tmp_path / 'output'
+    store(output_dir, 'python', [{'title': 'Python Developer'}, {'title': 'Django Developer'}], changes={
+        '20241001_120000': [{'title': 'Old delta', 'change': 'new'}],
+        '20241002_120000': [{'title': 'Django Developer', 'change': 'changed'},
+                            {'title': 'Flask Developer', 'change': 'removed'}],
+    })
+    store(output_dir, 'react', [{'title': 'React Engineer'}])
+
+    path = str(tmp_path / 'python.jsonl.gz')
+    main.run_export(main.parse_args(['export', path, '--keyword', 'python', '--output-dir', str(output_dir)]))
+    assert [row['Title'] for row in read_export(path, 'jsonl', 'gzip')] == ['Python Developer', 'Django Developer']
+
+    path = str(tmp_path / 'changes.csv')
+    main.run_export(main.parse_args(['export', path, '--changes', '--output-dir', str(output_dir)]))
+    assert [(row['Title'], row['Change']) for row in read_export(path, 'csv', None)] == [
+        ('Django Developer', 'changed'), ('Flask Developer', 'removed')
+    ]
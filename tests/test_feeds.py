@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from parsers import parse_feed, parse_remoteok_feed, parse_remotive_feed, parse_weworkremotely_feed, tag_feed_jobs
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def test_remoteok_skips_legal_notice_and_untitled_items():
+    entries = parse_remoteok_feed(read_fixture('remoteok_api.json'))
+
+    assert [job['title'] for job, _ in entries] == ['Senior Python Engineer', 'Growth Marketer']
+    job, text = entries[0]
+    assert job == {
+        'title': 'Senior Python Engineer',
+        'company': 'Acme Analytics',
+        'location': 'Worldwide',
+        'date_posted': '2024-10-17',
+        'source': 'RemoteOK',
+        'url': 'https://remoteOK.com/remote-jobs/remote-senior-python-engineer-acme-1046721',
+        'is_company_direct': False
+    }
+    assert text == 'Senior Python Engineer Acme Analytics python django postgres'
+
+
+def test_remoteok_fills_missing_location_and_url():
+    job, _ = parse_remoteok_feed(read_fixture('remoteok_api.json'))[1]
+
+    assert job['location'] == 'Remote'
+    assert job['url'] == 'https://remoteok.com/remote-jobs/remote-growth-marketer-brightwave-1046655'
+
+
+def test_remotive_reads_the_jobs_array():
+    entries = parse_remotive_feed(read_fixture('remotive_api.json'))
+
+    assert len(entries) == 2  # The job without a title is dropped
+    backend, text = entries[0]
+    assert backend['company'] == 'Northwind'
+    assert backend['location'] == 'Europe'
+    assert backend['date_posted'] == '2024-10-14'
+    assert backend['url'] == 'https://remotive.com/remote-jobs/software-dev/backend-engineer-go-1953012'
+    # Category and tags are searchable but not copied onto the job
+    assert text == 'Backend Engineer Northwind Software Development go kubernetes'
+    assert 'tags' not in backend
+
+    analyst, _ = entries[1]
+    assert analyst['title'] == 'Data Analyst'
+    assert analyst['location'] == 'Remote'
+
+
+def test_weworkremotely_splits_company_from_title():
+    entries = parse_weworkremotely_feed(read_fixture('weworkremotely.rss'))
+
+    assert len(entries) == 2  # The blank item is dropped
+    job, text = entries[0]
+    assert (job['company'], job['title']) == ('Orbit Labs', 'Full-Stack React Developer')
+    assert job['location'] == 'Anywhere in the World'
+    assert job['date_posted'] == '2024-10-17'
+    assert job['source'] == 'We Work Remotely'
+    assert text == 'Full-Stack React Developer Orbit Labs Full-Stack Programming'
+
+
+def test_weworkremotely_item_without_company_or_valid_date():
+    job, _ = parse_weworkremotely_feed(read_fixture('weworkremotely.rss'))[1]
+
+    assert job['company'] == ''
+    assert job['title'] == 'Customer Success Lead'
+    assert job['date_posted'] == ''
+    assert job['location'] == 'Remote'
+    assert job['url'] == 'https://weworkremotely.com/remote-jobs/customer-success-lead'
+
+
+@pytest.mark.parametrize('feed_name, fixture', [
+    ('RemoteOK', 'remoteok_api.json'),
+    ('Remotive', 'remotive_api.json'),
+    ('WeWorkRemotely', 'weworkremotely.rss')
+])
+def test_parse_feed_dispatches_by_feed_name(feed_name, fixture):
+    assert parse_feed(feed_name, read_fixture(fixture))
+
+
+def test_tag_feed_jobs_matches_tags_and_categories():
+    entries = (parse_remoteok_feed(read_fixture('remoteok_api.json'))
+               + parse_remotive_feed(read_fixture('remotive_api.json')))
+
+    jobs = tag_feed_jobs(entries, ['python', 'kubernetes', 'seo', 'rust'])
+
+    assert [(job['title'], job['keyword']) for job in jobs] == [
+        ('Senior Python Engineer', 'python'),
+        ('Growth Marketer', 'seo'),  # Only in the RemoteOK tags
+        ('Backend Engineer', 'kubernetes')  # Only in the Remotive tags
+    ]
+    # Tagging copies the job instead of changing the parsed entry
+    assert 'keyword' not in entries[0][0]
@@ -0,0 +1,27 @@
+import main
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {'Content-Type': 'text/html'}
+    content = b'<html></html>'
+
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse()
+
+
+def test_every_fetch_has_connect_and_read_timeouts():
+    scraper = main.RemoteJobScraper.__new__(main.RemoteJobScraper)
+    scraper.session = RecordingSession()
+    scraper.archive = None
+
+    scraper.fetch_page('https://example.com/jobs/1', 'apply_page', archive=False)
+    scraper.fetch_job_detail('https://example.com/jobs/2')
+
+    assert [kwargs['timeout'] for _, kwargs in scraper.session.calls] == [(main.CONNECT_TIMEOUT, main.TIMEOUT)] * 2
@@ -0,0 +1,35 @@
+import re
+
+from config import KEYWORDS
+from parsers import KeywordTagger, keyword_pattern, tag_feed_jobs
+
+def per_keyword_tags(keywords, text):
+    """Reference result: each keyword searched on its own"""
+    return {keyword for keyword in keywords
+            if re.search(rf'(?<!\w){keyword_pattern(keyword)}(?!\w)', text, re.IGNORECASE)}
+
+def test_overlapping_keywords_are_all_reported():
+    tagger = KeywordTagger(KEYWORDS)
+    assert tagger.tags("Paid Social Media Marketing Manager") == {'paid-social', 'social-media-marketing'}
+
+def test_matches_per_keyword_search():
+    titles = [
+        "Senior Python Software Engineer",
+        "Full Stack Developer (React / Python)",
+        "Facebook Ads & Meta Ads Specialist",
+        "Digital Marketing / PPC Specialist",
+        "Backend-Frontend Engineer",
+        "Data Analyst",
+    ]
+    tagger = KeywordTagger(KEYWORDS)
+    for title in titles:
+        assert tagger.tags(title) == per_keyword_tags(KEYWORDS, title), title
+
+def test_whole_words_only():
+    tagger = KeywordTagger(['react', 'python'])
+    assert tagger.tags("Reactive systems engineer, Pythonista wanted") == set()
+
+def test_tag_feed_jobs_emits_one_job_per_keyword():
+    entries = [({'title': "Paid Social Media Marketing Manager"}, "Paid Social Media Marketing Manager")]
+    jobs = tag_feed_jobs(entries, KEYWORDS)
+    assert sorted(job['keyword'] for job in jobs) == ['paid-social', 'social-media-marketing']
@@ -0,0 +1,38 @@
+import json
+
+from metrics import Metrics
+
+
+def test_summary_covers_only_the_current_run(tmp_path):
+    metrics = Metrics()
+    metrics.inc('scraper_jobs_total', 5, source='RemoteOK')
+    metrics.observe('scraper_parse_seconds', 2.0, source='RemoteOK')
+
+    metrics.start_run()
+    metrics.inc('scraper_jobs_total', 3, source='RemoteOK')
+    metrics.inc('scraper_jobs_total', source='Remotive')
+    metrics.observe('scraper_parse_seconds', 0.5, source='RemoteOK')
+    metrics.observe('scraper_parse_seconds', 1.5, source='RemoteOK')
+
+    with open(metrics.write_summary(str(tmp_path))) as f:
+        summary = json.load(f)
+    assert summary['started_at'] == metrics.started_at.isoformat()
+    assert summary['counters']['scraper_jobs_total'] == [
+        {'source': 'RemoteOK', 'value': 3},
+        {'source': 'Remotive', 'value': 1}
+    ]
+    assert summary['histograms']['scraper_parse_seconds'] == [
+        {'source': 'RemoteOK', 'count': 2, 'sum': 2.0, 'avg': 1.0}
+    ]
+    # The Prometheus endpoint keeps the process totals
+    assert 'scraper_jobs_total{source="RemoteOK"} 8' in metrics.render_prometheus()
+
+
+def test_series_unchanged_during_the_run_are_left_out():
+    metrics = Metrics()
+    metrics.inc('scraper_fetch_errors_total', host='example.com')
+    metrics.start_run()
+    metrics.inc('scraper_jobs_total')
+    summary = metrics.summary()
+    assert 'scraper_fetch_errors_total' not in summary['counters']
+    assert summary['counters']['scraper_jobs_total'] == [{'value': 1}]
@@ -0,0 +1,40 @@
+import os
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+
+from parse_pool import ParsePool
+
+
+def crash_in_worker(text):
+    """Kill the worker process it runs in; return normally in the scraper process"""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return [{'title': text}]
+
+
+class BrokenExecutor:
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool('A child process terminated abruptly')
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_parse_lost_with_a_dead_worker_is_rerun_inline():
+    pool = ParsePool(workers=2, min_bytes=0)
+    try:
+        assert pool.submit(crash_in_worker, 'Python Developer').result(timeout=60) == [{'title': 'Python Developer'}]
+        assert pool._broken and pool._executor is None
+        # Later parses no longer go to worker processes
+        assert pool.submit(crash_in_worker, 'Go Developer').result(timeout=5) == [{'title': 'Go Developer'}]
+    finally:
+        pool.close()
+
+
+def test_submit_to_a_broken_pool_runs_inline():
+    pool = ParsePool(workers=2, min_bytes=0)
+    executor = pool._executor = BrokenExecutor()
+
+    assert pool.submit(str.upper, 'remote').result() == 'REMOTE'
+    assert executor.shut_down
+    assert pool._broken and pool._get_executor() is None
@@ -0,0 +1,29 @@
+import threading
+
+from pipeline import JobWriter
+
+
+def test_flush_after_close_returns():
+    batches = []
+    writer = JobWriter(lambda keyword, jobs: batches.append((keyword, len(jobs))), batch_size=10, flush_seconds=60)
+    for number in range(3):
+        writer.put({'title': f"Job {number}", 'company': 'Acme', 'keyword': 'python'})
+    writer.close()
+    assert batches == [('python', 3)]
+
+    flushed = threading.Thread(target=writer.flush, daemon=True)
+    flushed.start()
+    flushed.join(5)
+    assert not flushed.is_alive()
+    writer.close()  # Closing twice is harmless
+
+
+def test_flush_writes_partial_batches():
+    written = []
+    writer = JobWriter(on_batch=written.extend, batch_size=100, flush_seconds=60)
+    try:
+        writer.put({'title': 'Job', 'company': 'Acme', 'keyword': 'python'})
+        writer.flush()
+        assert len(written) == 1 and writer.written == 1
+    finally:
+        writer.close()
@@ -0,0 +1,33 @@
+from archive import PageArchive, reparse_entry
+
+CAREERS_PAGE = b"""<html><body>
+<div class="job"><a class="job-title" href="/jobs/1">Senior Python Engineer</a><span class="job-location">Remote</span></div>
+<div class="job"><a class="job-title" href="/jobs/2">React Frontend Developer</a><span class="job-location">Remote</span></div>
+<div class="job"><a class="job-title" href="/jobs/3">Office Manager</a><span class="job-location">Berlin</span></div>
+</body></html>"""
+
+def reparse(tmp_path, parser, keywords):
+    archive = PageArchive(str(tmp_path))
+    archive.store('https://about.gitlab.com/jobs/', CAREERS_PAGE, parser, keywords=keywords)
+    entry, = archive.entries()
+    return reparse_entry(str(tmp_path), entry)
+
+def test_career_page_jobs_get_the_keyword_in_their_title(tmp_path):
+    jobs = reparse(tmp_path, 'career_page:GitLab', ['python', 'javascript', 'react'])
+    assert {job['title']: job['keyword'] for job in jobs} == {
+        'Senior Python Engineer': 'python',
+        'React Frontend Developer': 'react',
+    }
+
+def test_static_career_page_is_tagged_with_the_configured_keywords(tmp_path):
+    # Server-rendered careers pages are fetched once per run, so their records have no keywords
+    jobs = reparse(tmp_path, 'career_page:GitLab', None)
+    assert sorted((job['title'], job['keyword']) for job in jobs) == [
+        ('React Frontend Developer', 'frontend'),
+        ('React Frontend Developer', 'react'),
+        ('Senior Python Engineer', 'python'),
+    ]
+
+def test_single_keyword_page_falls_back_to_its_keyword(tmp_path):
+    jobs = reparse(tmp_path, 'company_jobs:GitLab', ['python'])
+    assert jobs and all(job['keyword'] == 'python' for job in jobs)
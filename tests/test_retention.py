@@ -0,0 +1,150 @@
+import os
+import csv
+import json
+import gzip
+from datetime import datetime, timedelta
+
+from retention import compact_snapshots, expire_postings, apply_retention
+
+NOW = datetime(2024, 10, 18, 12, 0, 0)
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def write_jsonl(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def write_csv(path, jobs):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(jobs[0]))
+        writer.writeheader()
+        writer.writerows(jobs)
+
+
+def read_history(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def stamp(days_ago):
+    return (NOW - timedelta(days=days_ago)).strftime('%Y%m%d_%H%M%S')
+
+
+def test_old_snapshots_are_merged_into_gzip_history(tmp_path):
+    old, older, newest = stamp(40), stamp(50), stamp(1)
+    job = {'title': 'Python Developer', 'url': 'https://example.com/1'}
+    # A legacy CSV/JSON pair holds the same job twice
+    write_json(tmp_path / f"python_jobs_{older}.json", [job])
+    write_csv(tmp_path / f"python_jobs_{older}.csv", [job])
+    write_jsonl(tmp_path / f"python_changes_{old}.jsonl", [dict(job, change='changed')])
+    write_jsonl(tmp_path / f"python_changes_{newest}.jsonl", [dict(job, change='new')])
+
+    merged, records, freed = compact_snapshots(str(tmp_path), 10, timedelta(days=30), NOW)
+
+    assert (merged, records) == (2, 2)
+    assert freed > 0
+    assert sorted(os.listdir(tmp_path)) == [f"python_changes_{newest}.jsonl", 'python_history.jsonl.gz']
+    history = read_history(tmp_path / 'python_history.jsonl.gz')
+    assert sorted((record['snapshot'], record['snapshot_kind']) for record in history) == [
+        (older, 'jobs'), (old, 'changes')
+    ]
+
+
+def test_newest_run_is_kept_whatever_the_limits(tmp_path):
+    newest = stamp(90)
+    write_jsonl(tmp_path / f"python_changes_{stamp(100)}.jsonl", [{'title': 'Old', 'change': 'new'}])
+    write_jsonl(tmp_path / f"python_changes_{newest}.jsonl", [{'title': 'Latest', 'change': 'new'}])
+
+    merged, _, _ = compact_snapshots(str(tmp_path), 0, timedelta(days=30), NOW)
+
+    assert merged == 1
+    assert os.path.exists(tmp_path / f"python_changes_{newest}.jsonl")
+
+
+def test_latest_changes_file_survives_a_newer_legacy_snapshot(tmp_path):
+    delta = stamp(5)
+    write_jsonl(tmp_path / f"python_changes_{delta}.jsonl", [{'title': 'Latest', 'change': 'new'}])
+    write_json(tmp_path / f"python_jobs_{stamp(2)}.json", [{'title': 'Legacy'}])
+
+    compact_snapshots(str(tmp_path), 1, timedelta(days=30), NOW)
+
+    assert os.path.exists(tmp_path / f"python_changes_{delta}.jsonl")
+
+
+def test_changes_and_result_files_within_limits_are_left_alone(tmp_path):
+    filenames = [f"python_changes_{stamp(days)}.jsonl" for days in (1, 2, 3)]
+    filenames += ['python_jobs.json', 'python_jobs.csv', 'python_index.json', 'python_update_log.txt']
+    for filename in filenames:
+        (tmp_path / filename).write_text('{}\n', encoding='utf-8')
+
+    assert compact_snapshots(str(tmp_path), 10, timedelta(days=30), NOW) == (0, 0, 0)
+    assert sorted(os.listdir(tmp_path)) == sorted(filenames)
+
+
+def make_keyword(tmp_path, jobs, index=None):
+    keyword_dir = tmp_path / 'python'
+    keyword_dir.mkdir()
+    write_json(keyword_dir / 'python_jobs.json', jobs)
+    write_csv(keyword_dir / 'python_jobs.csv', jobs)
+    if index is not None:
+        write_json(keyword_dir / 'python_index.json', index)
+    return keyword_dir
+
+
+def test_expiry_uses_the_index_last_seen(tmp_path):
+    jobs = [
+        {'title': 'Stale', 'url': 'https://example.com/stale', 'last_updated': '2024-10-01 00:00:00'},
+        {'title': 'Fresh', 'url': 'https://example.com/fresh', 'last_updated': '2024-01-01 00:00:00'},
+    ]
+    # last_updated says the opposite: the index decides
+    keyword_dir = make_keyword(tmp_path, jobs, index={
+        'https://example.com/stale': ['h1', '2024-01-01 00:00:00', '2024-06-01 00:00:00', 3, 'Stale', ''],
+        'https://example.com/fresh': ['h2', '2024-01-01 00:00:00', '2024-10-17 00:00:00', 0, 'Fresh', ''],
+    })
+
+    assert expire_postings(str(tmp_path), 'python', datetime(2024, 8, 1), scan_master=False) == 1
+
+    with open(keyword_dir / 'python_jobs.json', encoding='utf-8') as f:
+        assert [job['title'] for job in json.load(f)] == ['Fresh']
+    with open(keyword_dir / 'python_jobs.csv', encoding='utf-8') as f:
+        assert [row['title'] for row in csv.DictReader(f)] == ['Fresh']
+    with open(keyword_dir / 'python_index.json', encoding='utf-8') as f:
+        assert list(json.load(f)) == ['https://example.com/fresh']
+    history = read_history(keyword_dir / 'python_history.jsonl.gz')
+    assert [job['title'] for job in history] == ['Stale']
+    assert 'expired_at' in history[0]
+
+
+def test_results_without_an_index_expire_by_last_updated_on_the_first_scan(tmp_path):
+    jobs = [
+        {'title': 'Stale', 'url': 'https://example.com/stale', 'last_updated': '2024-06-01 00:00:00'},
+        {'title': 'Fresh', 'url': 'https://example.com/fresh', 'last_updated': '2024-10-17 00:00:00'},
+    ]
+    keyword_dir = make_keyword(tmp_path, jobs)
+    cutoff = datetime(2024, 8, 1)
+
+    # Only the one-off master scan reads the result files
+    assert expire_postings(str(tmp_path), 'python', cutoff, scan_master=False) == 0
+    assert expire_postings(str(tmp_path), 'python', cutoff, scan_master=True) == 1
+
+    with open(keyword_dir / 'python_jobs.json', encoding='utf-8') as f:
+        assert [job['title'] for job in json.load(f)] == ['Fresh']
+
+
+def test_apply_retention_scans_each_master_once(tmp_path):
+    jobs = [{'title': 'Ancient', 'url': 'https://example.com/a', 'last_updated': '2000-01-01 00:00:00'}]
+    make_keyword(tmp_path, jobs)
+
+    assert apply_retention(str(tmp_path))['expired'] == 1
+    with open(tmp_path / 'retention.json', encoding='utf-8') as f:
+        assert json.load(f)['python']['master_scanned'] is True
+
+    # Postings written later without an index entry are left to the index from now on
+    write_json(tmp_path / 'python' / 'python_jobs.json', jobs)
+    assert apply_retention(str(tmp_path))['expired'] == 0
@@ -0,0 +1,99 @@
+import os
+import dataclasses
+import textwrap
+
+import pytest
+from bs4 import BeautifulSoup
+
+import sources
+from sources import ConfigError, ConfigWatcher, compile_sources, current_sources, install_sources
+
+BOARD = {'base_url': 'https://jobs.example.com/search?q=', 'job_selector': '.job',
+         'title_selector': '.title', 'company_selector': '.company'}
+
+CONFIG = textwrap.dedent("""
+    KEYWORDS = {keywords!r}
+    JOB_BOARDS = {{
+        'Example': {{
+            'base_url': 'https://jobs.example.com/search?q=',
+            'job_selector': {job_selector!r},
+            'title_selector': '.title',
+            'company_selector': '.company'
+        }}
+    }}
+""")
+
+
+@pytest.fixture(autouse=True)
+def keep_active_sources():
+    previous = sources._current
+    yield
+    install_sources(previous)
+
+
+def write_config(path, keywords, job_selector='.job', mtime_ns=None):
+    path.write_text(CONFIG.format(keywords=keywords, job_selector=job_selector), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))  # Coarse file system clocks could otherwise hide the edit
+
+
+def test_every_problem_is_reported_at_once():
+    namespace = {
+        'KEYWORDS': ['python'],
+        'JOB_BOARDS': {'Broken': dict(BOARD, job_selector='div[', delay=-1, colour='red')},
+        'COMPANY_CAREER_PAGES': [{'name': 'Acme', 'url': 'https://acme.example.com/careers', 'job_selector': '.job',
+                                  'title_selector': '.title', 'delay': 1},
+                                 {'name': 'Acme', 'url': 'https://acme.example.com/careers', 'job_selector': '.job',
+                                  'title_selector': '.title', 'delay': 2}]
+    }
+
+    with pytest.raises(ConfigError) as error:
+        compile_sources(namespace)
+
+    problems = error.value.problems
+    assert "JOB_BOARDS['Broken']: unknown setting 'colour'" in problems
+    assert "JOB_BOARDS['Broken']: delay must be a non-negative number" in problems
+    assert any(problem.startswith("JOB_BOARDS['Broken'] job_selector: invalid selector 'div['") for problem in problems)
+    assert any('delay 2 conflicts with 1' in problem for problem in problems)
+
+
+def test_compiled_sources_are_frozen():
+    compiled = compile_sources({'KEYWORDS': ['python'], 'JOB_BOARDS': {'Example': BOARD}})
+    board = compiled.boards['Example']
+
+    assert board.job.select_one(BeautifulSoup('<div class="job">x</div>', 'html.parser')).text == 'x'
+    assert board.url_for('machine learning') == 'https://jobs.example.com/search?q=machine%20learning'
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        board.delay = 0
+    with pytest.raises(TypeError):
+        compiled.boards['Other'] = board
+
+
+def test_watcher_reloads_when_the_file_changes(tmp_path):
+    path = tmp_path / 'config.py'
+    write_config(path, ['python'], mtime_ns=1_000_000_000)
+    watcher = ConfigWatcher(str(path), interval=3600)
+    install_sources(compile_sources({'KEYWORDS': ['python'], 'JOB_BOARDS': {'Example': BOARD}}))
+
+    assert not watcher.check()  # Unchanged
+
+    write_config(path, ['python', 'golang'], mtime_ns=2_000_000_000)
+    assert watcher.check()
+    assert current_sources().keywords == ('python', 'golang')
+    assert not watcher.check()  # Picked up once
+
+
+def test_invalid_edit_keeps_the_previous_sources(tmp_path):
+    path = tmp_path / 'config.py'
+    write_config(path, ['python'], mtime_ns=1_000_000_000)
+    watcher = ConfigWatcher(str(path), interval=3600)
+    previous = install_sources(compile_sources({'KEYWORDS': ['python'], 'JOB_BOARDS': {'Example': BOARD}}))
+
+    write_config(path, ['python', 'golang'], job_selector='div[', mtime_ns=2_000_000_000)
+    assert not watcher.check()
+    assert current_sources() is previous
+
+    # Fixing the file is picked up on the next change
+    write_config(path, ['python', 'golang'], mtime_ns=3_000_000_000)
+    assert watcher.check()
+    assert current_sources().keywords == ('python', 'golang')
@@ -0,0 +1,102 @@
+from gui import VirtualTreeview
+
+
+class FakeTree:
+    """The parts of ttk.Treeview VirtualTreeview uses, including Tk's report of detached items"""
+
+    def __init__(self):
+        self.children = []  # Attached top-level items, in order
+        self.items = {}
+        self.selected = ()
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def insert(self, parent, index, text=''):
+        item = f"I{len(self.items) + 1:03d}"
+        self.items[item] = {}
+        self.children.append(item)
+        return item
+
+    def item(self, item, **options):
+        self.items[item].update(options)
+
+    def parent(self, item):
+        return ''  # Same for detached items
+
+    def index(self, item):
+        return self.children.index(item) if item in self.children else 0  # Detached items report 0
+
+    def move(self, item, parent, index):
+        if item in self.children:
+            self.children.remove(item)
+        self.children.insert(index, item)
+
+    def detach(self, item):
+        self.children.remove(item)
+
+    def delete(self, item):
+        if item in self.children:
+            self.children.remove(item)
+        del self.items[item]
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, item):
+        self.selected = (item,)
+
+    def selection_remove(self, *items):
+        self.selected = ()
+
+    def bbox(self, item):
+        return None
+
+
+class FakeScrollbar:
+    def config(self, **options):
+        pass
+
+    def set(self, first, last):
+        pass
+
+
+def shown(view):
+    return [view.tree.items[item]['text'] for item in view.tree.children]
+
+
+def make_view(visible_count=3):
+    view = VirtualTreeview(FakeTree(), FakeScrollbar(), lambda key: (key, (), ()))
+    view.visible_count = visible_count
+    return view
+
+
+def test_first_row_is_reattached_after_an_empty_result():
+    view = make_view()
+    view.set_rows(['a', 'b', 'c', 'd'])
+    assert shown(view) == ['a', 'b', 'c']
+
+    view.set_rows([])  # A new scrape, or a filter that matched nothing
+    assert shown(view) == []
+
+    view.set_rows(['e'])
+    assert shown(view) == ['e']
+    view.append_rows(['f', 'g', 'h'])
+    assert shown(view) == ['e', 'f', 'g']
+
+
+def test_move_selection_follows_appended_rows():
+    view = make_view(visible_count=2)
+    view.set_rows(['a', 'b'])
+    view.append_rows(['c', 'd'])
+    view.selected_key = 'b'
+
+    view.move_selection(1)
+    view.move_selection(1)
+    assert view.selected_key == 'd'
+    assert shown(view) == ['c', 'd']
+    view.move_selection(5)
+    assert view.selected_key == 'd'
+    view.move_selection(-3)
+    assert view.selected_key == 'a'
+    assert shown(view) == ['a', 'b']
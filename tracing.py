@@ -0,0 +1,124 @@
+import os
+import json
+import time
+import itertools
+import threading
+import functools
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from config import TRACE_DIRECTORY
+from logging_config import log_and_print
+
+_NULL_SPAN = nullcontext()
+
+class Tracer:
+    """Span recorder writing Chrome trace-event files
+
+    Spans are emitted as complete (``"ph": "X"``) events while the run is in
+    progress, using the JSON array format with the closing bracket optional,
+    so a trace from an interrupted run still opens in chrome://tracing or
+    https://ui.perfetto.dev. Each span carries its own id and the id of the
+    enclosing span on the same thread in ``args``.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self._file = None
+        self._origin = 0
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._named_threads = set()
+        self._lock = threading.Lock()
+
+    def start(self, directory=TRACE_DIRECTORY):
+        """Start writing a new trace file and return its path"""
+        if self.enabled:
+            return self.path
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('[\n')
+        self._origin = time.perf_counter_ns()
+        self._named_threads = set()
+        self.enabled = True
+        log_and_print(f"Tracing enabled, writing to {self.path}")
+        return self.path
+
+    def finish(self):
+        """Close the trace file; returns its path or None if tracing was off"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self.enabled = False
+            self._file.write(json.dumps({'name': 'trace_end', 'ph': 'i', 's': 'g', 'ts': self._now(), 'pid': os.getpid(), 'tid': 0}) + '\n]\n')
+            self._file.close()
+            self._file = None
+        log_and_print(f"Trace written to {self.path}")
+        return self.path
+
+    def _now(self):
+        return (time.perf_counter_ns() - self._origin) / 1000  # microseconds
+
+    def _emit(self, event):
+        tid = event['tid']
+        with self._lock:
+            if self._file is None:
+                return
+            if tid not in self._named_threads:
+                self._named_threads.add(tid)
+                self._file.write(json.dumps({
+                    'name': 'thread_name', 'ph': 'M', 'pid': event['pid'], 'tid': tid,
+                    'args': {'name': threading.current_thread().name}
+                }) + ',\n')
+            self._file.write(json.dumps(event, default=str) + ',\n')
+
+    def span(self, name, cat='scraper', **args):
+        """Context manager recording a span; yields a dict for extra args"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name, cat, args):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        span_id = next(self._ids)
+        args['span_id'] = span_id
+        args['parent_id'] = stack[-1] if stack else None
+        stack.append(span_id)
+        start = self._now()
+        try:
+            yield args
+        except Exception as e:
+            args['error'] = str(e)
+            raise
+        finally:
+            stack.pop()
+            self._emit({
+                'name': name, 'cat': cat, 'ph': 'X',
+                'ts': start, 'dur': self._now() - start,
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': args
+            })
+
+    def sleep(self, seconds, reason='fixed delay'):
+        """``time.sleep`` that shows up as a span in the trace"""
+        with self.span('sleep', cat='sleep', seconds=seconds, reason=reason):
+            time.sleep(seconds)
+
+# Process-wide tracer used by the scraper
+tracer = Tracer()
+
+def traced(name, cat='stage'):
+    """Decorator recording each call of a function as a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name, cat=cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator